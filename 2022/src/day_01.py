@@ -1,39 +1,44 @@
-if __name__ == "__main__":
-    max_sum, current_sum = 0, 0
+from typing import List, Tuple
 
-    with open("data/day_01.txt", "r") as f:
-        for line in f:
-            if line.strip() == "":
-                if current_sum > max_sum:
-                    max_sum = current_sum
 
-                current_sum = 0
-                continue
+def sum_groups(lines: List[str]) -> List[int]:
+    sums, current_sum = [], 0
 
-            current_sum += int(line)
+    for line in lines:
+        if line.strip() == "":
+            sums.append(current_sum)
+            current_sum = 0
+            continue
 
-    print(max_sum)
+        current_sum += int(line)
 
-    first_sum, second_sum, third_sum, current_sum = 0, 0, 0, 0
+    sums.append(current_sum)
+    return sums
+
+
+def parse(lines: List[str]) -> List[int]:
+    return sum_groups(lines)
 
-    with open("data/day_01.txt", "r") as f:
-        for line in f:
-            if line.strip() == "":
-                if current_sum > first_sum:
-                    third_sum = second_sum
-                    second_sum = first_sum
-                    first_sum = current_sum
 
-                elif current_sum > second_sum:
-                    third_sum = second_sum
-                    second_sum = current_sum
+def part_1(sums: List[int]) -> int:
+    return max(sums)
 
-                elif current_sum > third_sum:
-                    third_sum = current_sum
 
-                current_sum = 0
-                continue
+def part_2(sums: List[int]) -> int:
+    return sum(sorted(sums, reverse=True)[:3])
 
-            current_sum += int(line)
 
-    print(first_sum + second_sum + third_sum)
+def fused(sums: List[int]) -> Tuple[int, int]:
+    top = sorted(sums, reverse=True)[:3]
+    return top[0], sum(top)
+
+
+if __name__ == "__main__":
+    lines = []
+
+    with open("data/day_01.txt", "r") as f:
+        for line in f:
+            lines.append(line.rstrip("\n"))
+
+    for answer in fused(parse(lines)):
+        print(answer)
@@ -1,59 +1,97 @@
-if __name__ == "__main__":
-    outcome_by_choice_pair = {
-        ("A", "X"): 3,
-        ("A", "Y"): 6,
-        ("A", "Z"): 0,
-        ("B", "X"): 0,
-        ("B", "Y"): 3,
-        ("B", "Z"): 6,
-        ("C", "X"): 6,
-        ("C", "Y"): 0,
-        ("C", "Z"): 3,
-    }
-
-    point_by_choice = {
-        "X": 1,
-        "Y": 2,
-        "Z": 3,
-    }
+from typing import List, Tuple
+
+
+OUTCOME_BY_CHOICE_PAIR = {
+    ("A", "X"): 3,
+    ("A", "Y"): 6,
+    ("A", "Z"): 0,
+    ("B", "X"): 0,
+    ("B", "Y"): 3,
+    ("B", "Z"): 6,
+    ("C", "X"): 6,
+    ("C", "Y"): 0,
+    ("C", "Z"): 3,
+}
+
+POINT_BY_CHOICE = {
+    "X": 1,
+    "Y": 2,
+    "Z": 3,
+}
+
+SELF_CHOICE_BY_OUTCOME_PAIR = {
+    ("A", "X"): "Z",
+    ("A", "Y"): "X",
+    ("A", "Z"): "Y",
+    ("B", "X"): "X",
+    ("B", "Y"): "Y",
+    ("B", "Z"): "Z",
+    ("C", "X"): "Y",
+    ("C", "Y"): "Z",
+    ("C", "Z"): "X",
+}
+
+POINT_BY_OUTCOME = {
+    "X": 0,
+    "Y": 3,
+    "Z": 6,
+}
+
 
+def parse(lines: List[str]) -> List[Tuple[str, str]]:
+    rounds = []
+
+    for line in lines:
+        opponent_choice, second_column = line.strip().split(" ")
+        rounds.append((opponent_choice, second_column))
+
+    return rounds
+
+
+def part_1(rounds: List[Tuple[str, str]]) -> int:
     points = 0
 
-    with open("data/day_02.txt", "r") as f:
-        for line in f:
-            opponent_choice, self_choice = line.strip().split(" ")
-            points += (
-                outcome_by_choice_pair[(opponent_choice, self_choice)]
-                + point_by_choice[self_choice]
-            )
-
-    print(points)
-
-    self_choice_by_outcome_pair = {
-        ("A", "X"): "Z",
-        ("A", "Y"): "X",
-        ("A", "Z"): "Y",
-        ("B", "X"): "X",
-        ("B", "Y"): "Y",
-        ("B", "Z"): "Z",
-        ("C", "X"): "Y",
-        ("C", "Y"): "Z",
-        ("C", "Z"): "X",
-    }
-
-    point_by_outcome = {
-        "X": 0,
-        "Y": 3,
-        "Z": 6,
-    }
+    for opponent_choice, self_choice in rounds:
+        points += (
+            OUTCOME_BY_CHOICE_PAIR[(opponent_choice, self_choice)]
+            + POINT_BY_CHOICE[self_choice]
+        )
+
+    return points
 
+
+def part_2(rounds: List[Tuple[str, str]]) -> int:
     points = 0
 
+    for opponent_choice, outcome in rounds:
+        self_choice = SELF_CHOICE_BY_OUTCOME_PAIR[(opponent_choice, outcome)]
+
+        points += POINT_BY_OUTCOME[outcome] + POINT_BY_CHOICE[self_choice]
+
+    return points
+
+
+def fused(rounds: List[Tuple[str, str]]) -> Tuple[int, int]:
+    points_1, points_2 = 0, 0
+
+    for opponent_choice, second_column in rounds:
+        points_1 += (
+            OUTCOME_BY_CHOICE_PAIR[(opponent_choice, second_column)]
+            + POINT_BY_CHOICE[second_column]
+        )
+
+        self_choice = SELF_CHOICE_BY_OUTCOME_PAIR[(opponent_choice, second_column)]
+        points_2 += POINT_BY_OUTCOME[second_column] + POINT_BY_CHOICE[self_choice]
+
+    return points_1, points_2
+
+
+if __name__ == "__main__":
+    lines = []
+
     with open("data/day_02.txt", "r") as f:
         for line in f:
-            opponent_choice, outcome = line.strip().split(" ")
-            self_choice = self_choice_by_outcome_pair[(opponent_choice, outcome)]
-
-            points += point_by_outcome[outcome] + point_by_choice[self_choice]
+            lines.append(line.rstrip("\n"))
 
-    print(points)
+    for answer in fused(parse(lines)):
+        print(answer)
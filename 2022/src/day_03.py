@@ -1,3 +1,6 @@
+from typing import List, Set, Tuple
+
+
 def convert_to_priority(character: str) -> int:
     if character >= "a" and character <= "z":
         return ord(character) - 97 + 1
@@ -19,42 +22,62 @@ def test_convert_to_priority() -> None:
     assert convert_to_priority("Z") == 52
 
 
-if __name__ == "__main__":
-    test_convert_to_priority()
+def find_both(contents: str) -> Set[str]:
+    assert len(contents) % 2 == 0
+    midpoint = len(contents) // 2
 
-    priorities = 0
+    return set(contents[:midpoint]).intersection(contents[midpoint:])
 
-    with open("data/day_03.txt", "r") as f:
-        for line in f:
-            contents = line.strip()
 
-            assert len(contents) % 2 == 0
-            midpoint = len(contents) // 2
+def find_common(group: List[str]) -> str:
+    common = set(group[0]).intersection(set(group[1])).intersection(set(group[2]))
 
-            both = set(contents[:midpoint]).intersection(contents[midpoint:])
+    assert len(common) == 1
+    return next(iter(common))
 
-            for character in both:
-                priorities += convert_to_priority(character)
 
-    print(priorities)
+def parse(lines: List[str]) -> List[str]:
+    return [line.strip() for line in lines]
 
+
+def part_1(rucksacks: List[str]) -> int:
     priorities = 0
-    lines = []
 
-    with open("data/day_03.txt", "r") as f:
-        for i, line in enumerate(f):
-            lines.append(line.strip())
+    for contents in rucksacks:
+        for character in find_both(contents):
+            priorities += convert_to_priority(character)
+
+    return priorities
+
+
+def part_2(rucksacks: List[str]) -> int:
+    priorities = 0
+
+    for i in range(0, len(rucksacks), 3):
+        priorities += convert_to_priority(find_common(rucksacks[i : i + 3]))
+
+    return priorities
+
+
+def fused(rucksacks: List[str]) -> Tuple[int, int]:
+    priorities_1, priorities_2 = 0, 0
+
+    for i, contents in enumerate(rucksacks):
+        for character in find_both(contents):
+            priorities_1 += convert_to_priority(character)
 
-            if i % 3 == 2:
-                common = (
-                    set(lines[0])
-                    .intersection(set(lines[1]))
-                    .intersection(set(lines[2]))
-                )
+        if i % 3 == 2:
+            priorities_2 += convert_to_priority(find_common(rucksacks[i - 2 : i + 1]))
 
-                assert len(common) == 1
-                priorities += convert_to_priority(next(iter(common)))
+    return priorities_1, priorities_2
 
-                lines = []
 
-    print(priorities)
+if __name__ == "__main__":
+    lines = []
+
+    with open("data/day_03.txt", "r") as f:
+        for line in f:
+            lines.append(line.rstrip("\n"))
+
+    for answer in fused(parse(lines)):
+        print(answer)
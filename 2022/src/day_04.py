@@ -1,3 +1,6 @@
+from typing import List, Tuple
+
+
 def convert_to_int(s: str) -> int:
     result = 0
 
@@ -45,29 +48,51 @@ def test_has_overlap() -> None:
     assert not has_overlap(1, 2)
 
 
-if __name__ == "__main__":
-    test_is_fully_covered()
-    test_convert_to_int()
-    test_has_overlap()
+def parse(lines: List[str]) -> List[str]:
+    return lines
+
+
+def convert_pair(line: str) -> Tuple[int, int]:
+    first, second = line.split(",")
+    return convert_to_int(first), convert_to_int(second)
 
+
+def part_1(lines: List[str]) -> int:
     count = 0
 
-    with open("data/day_04.txt", "r") as f:
-        for line in f:
-            first, second = line.rstrip("\n").split(",")
+    for line in lines:
+        count += int(is_fully_covered(*convert_pair(line)))
 
-            count += int(
-                is_fully_covered(convert_to_int(first), convert_to_int(second))
-            )
+    return count
 
-    print(count)
 
+def part_2(lines: List[str]) -> int:
     count = 0
 
+    for line in lines:
+        count += int(has_overlap(*convert_pair(line)))
+
+    return count
+
+
+def fused(lines: List[str]) -> Tuple[int, int]:
+    count_1, count_2 = 0, 0
+
+    # Each pair is converted once and dropped, rather than kept for both parts
+    for line in lines:
+        first, second = convert_pair(line)
+        count_1 += int(is_fully_covered(first, second))
+        count_2 += int(has_overlap(first, second))
+
+    return count_1, count_2
+
+
+if __name__ == "__main__":
+    lines = []
+
     with open("data/day_04.txt", "r") as f:
         for line in f:
-            first, second = line.rstrip("\n").split(",")
-
-            count += int(has_overlap(convert_to_int(first), convert_to_int(second)))
+            lines.append(line.rstrip("\n"))
 
-    print(count)
+    for answer in fused(parse(lines)):
+        print(answer)
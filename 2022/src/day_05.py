@@ -1,31 +1,35 @@
-from typing import DefaultDict, List, Tuple
+from typing import DefaultDict, Dict, List, Tuple
 import collections
 import copy
 
 
-if __name__ == "__main__":
+def parse(
+    lines: List[str],
+) -> Tuple[Dict[int, List[str]], List[Tuple[int, int, int]]]:
     stack_by_stack_number: DefaultDict[int, List[str]] = collections.defaultdict(list)
     instructions: List[Tuple[int, int, int]] = []
 
-    with open("data/day_05.txt", "r") as f:
-        for line in f:
-            if line[0] == "[":
-                for i, char in enumerate(line.rstrip("\n")):
-                    if (i - 1) % 4 == 0:
-                        if char != " ":
-                            stack_by_stack_number[((i - 1) // 4) + 1].append(char)
-
-            if line[0] == "m":
-                contents = line.rstrip("\n").split(" ")
-                instructions.append(
-                    (int(contents[1]), int(contents[3]), int(contents[5]))
-                )
+    for line in lines:
+        if line.startswith("["):
+            for i, char in enumerate(line):
+                if (i - 1) % 4 == 0:
+                    if char != " ":
+                        stack_by_stack_number[((i - 1) // 4) + 1].append(char)
+
+        if line.startswith("m"):
+            contents = line.split(" ")
+            instructions.append((int(contents[1]), int(contents[3]), int(contents[5])))
 
     # Reverse order of items in each stack.
     for stack_number, stack in stack_by_stack_number.items():
         stack_by_stack_number[stack_number] = stack_by_stack_number[stack_number][::-1]
 
-    stack_by_stack_number_copy = copy.deepcopy(stack_by_stack_number)
+    return dict(stack_by_stack_number), instructions
+
+
+def part_1(model: Tuple[Dict[int, List[str]], List[Tuple[int, int, int]]]) -> str:
+    stack_by_stack_number, instructions = model
+    stack_by_stack_number = copy.deepcopy(stack_by_stack_number)
 
     # Move item one-by-one.
     for instruction in instructions:
@@ -35,18 +39,31 @@ if __name__ == "__main__":
             item = stack_by_stack_number[from_stack].pop()
             stack_by_stack_number[to_stack].append(item)
 
-    print("".join([stack[-1] for _, stack in sorted(stack_by_stack_number.items())]))
+    return "".join([stack[-1] for _, stack in sorted(stack_by_stack_number.items())])
+
+
+def part_2(model: Tuple[Dict[int, List[str]], List[Tuple[int, int, int]]]) -> str:
+    stack_by_stack_number, instructions = model
+    stack_by_stack_number = copy.deepcopy(stack_by_stack_number)
 
     # Move multiple items at a time.
     for instruction in instructions:
         count, from_stack, to_stack = instruction
 
-        items = stack_by_stack_number_copy[from_stack][-count:]
-        stack_by_stack_number_copy[from_stack] = stack_by_stack_number_copy[from_stack][
-            :-count
-        ]
-        stack_by_stack_number_copy[to_stack] += items
+        items = stack_by_stack_number[from_stack][-count:]
+        stack_by_stack_number[from_stack] = stack_by_stack_number[from_stack][:-count]
+        stack_by_stack_number[to_stack] += items
+
+    return "".join([stack[-1] for _, stack in sorted(stack_by_stack_number.items())])
+
+
+if __name__ == "__main__":
+    lines = []
+
+    with open("data/day_05.txt", "r") as f:
+        for line in f:
+            lines.append(line.rstrip("\n"))
 
-    print(
-        "".join([stack[-1] for _, stack in sorted(stack_by_stack_number_copy.items())])
-    )
+    model = parse(lines)
+    print(part_1(model))
+    print(part_2(model))
@@ -1,4 +1,4 @@
-from typing import Counter, Optional
+from typing import Counter, List, Optional
 import collections
 import queue
 
@@ -35,13 +35,30 @@ def test_find_marker():
     assert find_marker("abacd", 5) is None
 
 
+def parse(lines: List[str]) -> str:
+    assert len(lines) == 1
+    return lines[0]
+
+
+def part_1(line: str) -> int:
+    marker = find_marker(line, 4)
+    assert marker is not None
+    return marker
+
+
+def part_2(line: str) -> int:
+    marker = find_marker(line, 14)
+    assert marker is not None
+    return marker
+
+
 if __name__ == "__main__":
-    test_find_marker()
+    lines = []
 
     with open("data/day_06.txt", "r") as f:
         for line in f:
-            print(find_marker(line, 4))
+            lines.append(line.rstrip("\n"))
 
-    with open("data/day_06.txt", "r") as f:
-        for line in f:
-            print(find_marker(line, 14))
+    model = parse(lines)
+    print(part_1(model))
+    print(part_2(model))
@@ -170,30 +170,42 @@ def test_generate_directories() -> None:
     assert directories_by_directory_path["/"].size == 48381165
 
 
+def parse(lines: List[str]) -> Dict[str, Directory]:
+    directories_by_directory_path = generate_directories(lines)
+    sum_file_sizes(directories_by_directory_path)
+    return directories_by_directory_path
+
+
+def part_1(directories_by_directory_path: Dict[str, Directory]) -> int:
+    return sum(
+        [
+            directory.size
+            for _, directory in directories_by_directory_path.items()
+            if directory.size is not None and directory.size <= 100000
+        ]
+    )
+
+
+def part_2(directories_by_directory_path: Dict[str, Directory]) -> int:
+    assert directories_by_directory_path["/"].size is not None
+    min_size = directories_by_directory_path["/"].size - (70000000 - 30000000)
+
+    return min(
+        [
+            directory.size
+            for _, directory in directories_by_directory_path.items()
+            if directory.size is not None and directory.size > min_size
+        ]
+    )
+
+
 if __name__ == "__main__":
-    test_generate_directories()
+    lines = []
 
     with open("data/day_07.txt", "r") as f:
-        directories_by_directory_path = generate_directories(f)
-        sum_file_sizes(directories_by_directory_path)
-        print(
-            sum(
-                [
-                    directory.size
-                    for _, directory in directories_by_directory_path.items()
-                    if directory.size is not None and directory.size <= 100000
-                ]
-            )
-        )
-
-        assert directories_by_directory_path["/"].size is not None
-        min_size = directories_by_directory_path["/"].size - (70000000 - 30000000)
-        print(
-            min(
-                [
-                    directory.size
-                    for _, directory in directories_by_directory_path.items()
-                    if directory.size is not None and directory.size > min_size
-                ]
-            )
-        )
+        for line in f:
+            lines.append(line.rstrip("\n"))
+
+    model = parse(lines)
+    print(part_1(model))
+    print(part_2(model))
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 def get_visibility(grid: List[List[int]], x: int, y: int) -> List[Optional[bool]]:
@@ -108,16 +108,51 @@ def test_get_viewability() -> None:
     assert get_viewability(grid, 2, 3) == [2, 2, 2, 1]
 
 
-if __name__ == "__main__":
-    test_get_visibility()
-    test_get_viewability()
+# Height of the sentinel cells around a flat grid, taller than any tree
+BORDER = 10
 
-    grid = []
 
-    with open("data/day_08.txt", "r") as f:
-        for line in f:
-            grid.append([int(item) for item in list(line.rstrip("\n"))])
+def create_heights(grid: List[List[int]]) -> Tuple[bytearray, int]:
+    stride = len(grid[0]) + 2
+    heights = bytearray([BORDER]) * stride
+
+    for row in grid:
+        heights += bytes([BORDER, *row, BORDER])
+
+    heights += bytes([BORDER]) * stride
+    return heights, stride
+
+
+def get_scenic_score(heights: bytearray, stride: int, i: int) -> int:
+    z = heights[i]
+    score = 1
+
+    for offset in (-1, 1, -stride, stride):
+        j = i + offset
+
+        while heights[j] < z:
+            j += offset
+
+        # Walking onto the border passes the last tree, which is still seen
+        distance = abs(j - i) // abs(offset)
+        score *= distance - (heights[j] == BORDER)
+
+    return score
+
+
+def test_create_heights() -> None:
+    heights, stride = create_heights([[3, 0], [2, 5]])
 
+    assert stride == 4
+    assert list(heights) == [10] * 5 + [3, 0] + [10] * 2 + [2, 5] + [10] * 5
+    assert get_scenic_score(heights, stride, 6) == 0
+
+
+def parse(lines: List[str]) -> List[List[int]]:
+    return [[int(item) for item in list(line)] for line in lines]
+
+
+def part_1(grid: List[List[int]]) -> int:
     visible = 0
 
     for i in range(1, len(grid) - 1):
@@ -127,8 +162,10 @@ if __name__ == "__main__":
                 == 0
             )
 
-    print(len(grid[0]) * len(grid) - visible)
+    return len(grid[0]) * len(grid) - visible
+
 
+def part_2(grid: List[List[int]]) -> int:
     viewable = 0
 
     for i in range(1, len(grid) - 1):
@@ -140,4 +177,67 @@ if __name__ == "__main__":
             if product > viewable:
                 viewable = product
 
-    print(viewable)
+    return viewable
+
+
+def part_1_grid(grid: List[List[int]]) -> int:
+    heights, stride = create_heights(grid)
+    height, width = len(grid), len(grid[0])
+    visible = bytearray(len(heights))
+
+    lines = [
+        range((y + 1) * stride + 1, (y + 1) * stride + width + 1) for y in range(height)
+    ]
+    lines += [
+        range(stride + x + 1, (height + 1) * stride, stride) for x in range(width)
+    ]
+
+    # A tree is visible from an edge when it is taller than every tree before it
+    for line in lines:
+        for cells in (line, reversed(line)):
+            tallest = -1
+
+            for i in cells:
+                if heights[i] > tallest:
+                    visible[i] = 1
+                    tallest = heights[i]
+
+    return sum(visible)
+
+
+def part_2_grid(grid: List[List[int]]) -> int:
+    heights, stride = create_heights(grid)
+
+    return max(
+        get_scenic_score(heights, stride, (y + 1) * stride + x + 1)
+        for y in range(len(grid))
+        for x in range(len(grid[0]))
+    )
+
+
+def test_grid_engine() -> None:
+    grid = [
+        [3, 0, 3, 7, 3],
+        [2, 5, 5, 1, 2],
+        [6, 5, 3, 3, 2],
+        [3, 3, 5, 4, 9],
+        [3, 5, 3, 9, 0],
+    ]
+
+    assert part_1_grid(grid) == part_1(grid) == 21
+    assert part_2_grid(grid) == part_2(grid) == 8
+
+
+ENGINES = {"grid": {1: part_1_grid, 2: part_2_grid}}
+
+
+if __name__ == "__main__":
+    lines = []
+
+    with open("data/day_08.txt", "r") as f:
+        for line in f:
+            lines.append(line.rstrip("\n"))
+
+    model = parse(lines)
+    print(part_1(model))
+    print(part_2(model))
@@ -123,15 +123,25 @@ def test_run_complex_instructions():
     assert run_complex_instructions(instructions, 10) == 36
 
 
-if __name__ == "__main__":
-    test_run_simple_instructions()
-    test_run_complex_instructions()
+def parse(lines: List[str]) -> List[str]:
+    return lines
+
+
+def part_1(instructions: List[str]) -> int:
+    return run_simple_instructions(instructions)
+
 
-    instructions = []
+def part_2(instructions: List[str]) -> int:
+    return run_complex_instructions(instructions, 10)
+
+
+if __name__ == "__main__":
+    lines = []
 
     with open("data/day_09.txt", "r") as f:
         for line in f:
-            instructions.append(line.rstrip("\n"))
+            lines.append(line.rstrip("\n"))
 
-    print(run_simple_instructions(instructions))
-    print(run_complex_instructions(instructions, 10))
+    model = parse(lines)
+    print(part_1(model))
+    print(part_2(model))
@@ -203,18 +203,31 @@ def test_run_instructions() -> None:
     assert pixels[200:240] == "#######.......#######.......#######....."
 
 
-if __name__ == "__main__":
-    test_run_instructions()
+CYCLES = [20, 60, 100, 140, 180, 220]
 
-    instructions = []
 
-    with open("data/day_10.txt", "r") as f:
-        for line in f:
-            instructions.append(line.rstrip("\n"))
+def parse(lines: List[str]) -> List[str]:
+    return lines
+
+
+def part_1(instructions: List[str]) -> int:
+    # Pass copies, since run_instructions consumes its arguments.
+    strength, _ = run_instructions(list(instructions), list(CYCLES))
+    return strength
 
-    strength, pixels = run_instructions(instructions, [20, 60, 100, 140, 180, 220])
 
-    print(strength)
+def part_2(instructions: List[str]) -> str:
+    _, pixels = run_instructions(list(instructions), list(CYCLES))
+    return "\n".join(pixels[i * 40 : (i + 1) * 40] for i in range(6))
+
+
+if __name__ == "__main__":
+    lines = []
+
+    with open("data/day_10.txt", "r") as f:
+        for line in f:
+            lines.append(line.rstrip("\n"))
 
-    for i in range(6):
-        print(pixels[i * 40 : (i + 1) * 40])
+    model = parse(lines)
+    print(part_1(model))
+    print(part_2(model))
@@ -1,5 +1,6 @@
 from typing import Callable, Dict, List, Optional, Tuple
 import dataclasses
+import time
 
 
 def convert_to_action(
@@ -115,31 +116,45 @@ def create_agents() -> Dict[int, Agent]:
     return agents
 
 
-if __name__ == "__main__":
-    test_agent_play()
-
-    agents = create_agents()
+# Gives up with the rounds played so far once the deadline has passed
+def play_rounds(
+    agents: Dict[int, Agent],
+    rounds: int,
+    base: Optional[int],
+    deadline: Optional[float] = None,
+) -> int:
+    for round_counter in range(rounds):
+        if deadline is not None and time.perf_counter() > deadline:
+            raise TimeoutError({"rounds": rounds, "rounds_done": round_counter})
 
-    for _ in range(20):
-        for i in range(8):
+        for i in range(len(agents)):
             while len(agents[i].levels):
-                level, recipient = agents[i].play()
+                level, recipient = agents[i].play(base)
                 agents[recipient].levels.append(level)
 
-    targets = sorted([agents[i].counter for i in range(8)], reverse=True)[:2]
-    print(targets[0] * targets[1])
+    targets = sorted([agent.counter for agent in agents.values()], reverse=True)[:2]
+    return targets[0] * targets[1]
+
+
+# The notes are embedded in create_agents, so the input is not used.
+def parse(lines: List[str]) -> None:
+    return None
+
 
+def part_1(model: None, deadline: Optional[float] = None) -> int:
+    return play_rounds(create_agents(), 20, None, deadline)
+
+
+def part_2(model: None, deadline: Optional[float] = None) -> int:
     agents = create_agents()
     base = 1
 
-    for i in range(8):
-        base *= agents[i].divisor
+    for agent in agents.values():
+        base *= agent.divisor
+
+    return play_rounds(agents, 10000, base, deadline)
 
-    for _ in range(10000):
-        for i in range(8):
-            while len(agents[i].levels):
-                level, recipient = agents[i].play(base)
-                agents[recipient].levels.append(level)
 
-    targets = sorted([agents[i].counter for i in range(8)], reverse=True)[:2]
-    print(targets[0] * targets[1])
+if __name__ == "__main__":
+    print(part_1(None))
+    print(part_2(None))
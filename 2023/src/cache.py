@@ -0,0 +1,220 @@
+"""
+This module provides a content-addressed on-disk cache of parsed puzzle inputs.
+Parsing dominates the running time of several days on large inputs, so the
+parsed structures are pickled once per input and reloaded on later runs instead
+of parsing the text again.
+
+Entries are keyed by the SHA-256 digest of the input file together with the
+name and version of the parser, so editing either the input or bumping the
+parser version yields a new entry. The scripts version their parsers by hand,
+while the runner passes the digest of the solver source, so any edit to the
+solver yields a new entry. The total size of the cache is capped, and
+the least recently used entries are evicted first.
+
+The cache lives in $AOC_CACHE_DIR, or ~/.cache/advent-of-code by default, and
+its size cap in bytes is read from $AOC_CACHE_MAX_BYTES.
+
+Usage:
+    python 2023/src/cache.py info
+    python 2023/src/cache.py clear
+    python 2023/src/cache.py evict [--max-bytes N]
+
+Functions:
+- get_directory: Returns the directory holding the cache entries.
+- get_max_size: Returns the size cap of the cache in bytes.
+- hash_file: Computes the SHA-256 digest of a file.
+- create_entry_name: Builds the file name of the entry for an input and parser.
+- load_or_parse: Returns the cached parse of an input, parsing it on a miss.
+- list_entries: Lists the entries from most to least recently used.
+- evict: Removes the least recently used entries until under a size cap.
+- clear: Removes every entry.
+"""
+
+from typing import Callable, List, Optional, Tuple, TypeVar, Union, cast
+import argparse
+import datetime
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+
+import helpers
+
+
+T = TypeVar("T")
+
+# Suffix of every cache entry, used to tell entries apart from other files
+ENTRY_SUFFIX = ".pickle"
+
+# Default size cap of the cache in bytes
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+# Mirrors aoc.registry.get_cache_directory, as the 2023 modules also run as
+# scripts without the aoc package
+def get_directory() -> str:
+    return os.environ.get(
+        "AOC_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "advent-of-code"),
+    )
+
+
+def get_max_size() -> int:
+    return int(os.environ.get("AOC_CACHE_MAX_BYTES", DEFAULT_MAX_SIZE))
+
+
+def hash_file(filename: str) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Builds a readable entry name from the parser, its version and the input digest
+def create_entry_name(
+    digest: str, parser: Callable[..., object], version: Union[int, str]
+) -> str:
+    # Name entries after the file, since __module__ is "__main__" for scripts
+    module = os.path.splitext(os.path.basename(inspect.getfile(parser)))[0]
+
+    # Keep script and module entries apart, as their pickles refer to classes
+    # in different modules
+    key = hashlib.sha256(f"{parser.__module__}:{digest}".encode()).hexdigest()
+
+    return f"{module}.{parser.__qualname__}.v{version}.{key}{ENTRY_SUFFIX}"
+
+
+def load_or_parse(
+    filename: str,
+    parser: Callable[[List[str]], T],
+    version: Union[int, str],
+    read: Optional[Callable[[str], List[str]]] = None,
+) -> T:
+    """
+    Returns the parsed structure of an input, loading it from the cache when an
+    entry for the same input contents, parser and version exists, and parsing
+    the input and storing the result otherwise. A result that cannot be
+    pickled is returned without being stored.
+
+    Args:
+        filename (str): The input file.
+        parser (Callable[[List[str]], T]): The parser, called with the stripped
+        lines of the input on a miss.
+        version (Union[int, str]): The parser version. Bump it whenever the
+        structure returned by the parser changes, or pass a digest of the
+        parser source.
+        read (Optional[Callable[[str], List[str]]]): Reads the lines of the
+        input on a miss, defaulting to stripping them as the 2023 solvers do.
+
+    Returns:
+        T: The parsed structure.
+    """
+    directory = get_directory()
+    path = os.path.join(
+        directory, create_entry_name(hash_file(filename), parser, version)
+    )
+
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+
+        # Mark the entry as recently used for eviction
+        os.utime(path)
+        return cast(T, result)
+
+    except FileNotFoundError:
+        pass
+
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Drop entries that are truncated or refer to code that has moved
+        os.remove(path)
+
+    lines = read(filename) if read is not None else helpers.generate_lines(filename)
+    result = parser(list(lines))
+    os.makedirs(directory, exist_ok=True)
+
+    # Write to a temporary file first so readers never see a partial entry
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Models holding views or generators are parsed again on every run
+        os.remove(temporary_path)
+        return result
+
+    os.replace(temporary_path, path)
+    evict(get_max_size())
+
+    return result
+
+
+# Lists entries as (name, size, last used) from most to least recently used
+def list_entries() -> List[Tuple[str, int, float]]:
+    directory = get_directory()
+
+    if not os.path.isdir(directory):
+        return []
+
+    entries = []
+
+    for entry in os.scandir(directory):
+        if entry.name.endswith(ENTRY_SUFFIX):
+            stat = entry.stat()
+            entries.append((entry.name, stat.st_size, stat.st_mtime))
+
+    return sorted(entries, key=lambda x: x[2], reverse=True)
+
+
+# Removes the least recently used entries until the cache fits the size cap
+def evict(max_size: int) -> List[str]:
+    total_size = 0
+    removed = []
+
+    for name, size, _ in list_entries():
+        total_size += size
+
+        if total_size > max_size:
+            os.remove(os.path.join(get_directory(), name))
+            removed.append(name)
+
+    return removed
+
+
+def clear() -> List[str]:
+    removed = []
+
+    for name, _, _ in list_entries():
+        os.remove(os.path.join(get_directory(), name))
+        removed.append(name)
+
+    return removed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or clear the parse cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("info", help="list entries, most recently used first")
+    subparsers.add_parser("clear", help="remove every entry")
+    evict_parser = subparsers.add_parser("evict", help="apply the size cap")
+    evict_parser.add_argument("--max-bytes", type=int, default=get_max_size())
+    args = parser.parse_args()
+
+    match args.command:
+        case "info":
+            entries = list_entries()
+
+            for name, size, last_used in entries:
+                timestamp = datetime.datetime.fromtimestamp(last_used)
+                print(f"{timestamp:%Y-%m-%d %H:%M:%S}{size:>12}  {name}")
+
+            total_size = sum(size for _, size, _ in entries)
+            print(f"{len(entries)} entries, {total_size} of {get_max_size()} bytes")
+            print(get_directory())
+
+        case "clear":
+            print(f"Removed {len(clear())} entries.")
+
+        case "evict":
+            print(f"Removed {len(evict(args.max_bytes))} entries.")
@@ -0,0 +1,237 @@
+"""
+This module converts puzzle inputs into a compact columnar binary format, so
+that a solver loads its input by mapping a file into memory rather than parsing
+text. Each column is a flat array of fixed-size values, such as the integers of
+every day 9 history with the offsets where each history starts, or the cells of
+a grid with their border.
+
+A file starts with an 8-byte magic number and the size of a JSON header, which
+names the day and describes each column by its typecode, offset and length.
+Every column starts on an 8-byte boundary, so loading a column casts a slice of
+the mapped file to its typecode without copying. The values are stored in the
+byte order of the machine that converted the input, and files written on a
+machine with another byte order are rejected.
+
+A day module supports the format by defining encode_columns(lines), returning
+its columns as arrays, and decode_columns(columns), building the model of its
+parts from the loaded columns. The runner loads inputs with the SUFFIX of the
+format this way in place of reading and parsing them.
+
+Usage:
+    python 2023/src/columnar.py convert --day 9 2023/data/day_09.txt
+    python 2023/src/columnar.py info 2023/data/day_09.col
+
+Functions:
+- get_output_path: Returns the columnar file written for a text input.
+- write_columns: Writes columns to a file.
+- load_columns: Maps a file into memory and returns its day and columns.
+- convert_file: Converts a text input with the encoder of its day.
+- encode_grid: Encodes the lines of a grid as its cells and shape.
+- decode_grid: Builds a grid over its loaded cells.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+import argparse
+import array
+import importlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+import grid
+import helpers
+
+
+# Magic number at the start of every columnar file
+MAGIC = b"AOCCOL01"
+
+# Suffix of columnar files, used by the runner to tell them apart from text
+SUFFIX = ".col"
+
+# Alignment of the header and of every column, in bytes
+ALIGNMENT = 8
+
+# Typecodes a column may have, with the size of their values in bytes
+ITEM_SIZES = {"B": 1, "I": 4, "q": 8}
+
+
+def get_output_path(filename: str) -> str:
+    return os.path.splitext(filename)[0] + SUFFIX
+
+
+# Pads a length up to the next multiple of the alignment
+def align(length: int) -> int:
+    return -(-length // ALIGNMENT) * ALIGNMENT
+
+
+def write_columns(
+    filename: str, day: int, columns: Mapping[str, "array.array[int]"]
+) -> None:
+    """
+    Writes columns to a file, after a header describing the day and each column.
+
+    Args:
+        filename (str): The file to write.
+        day (int): The day whose model the columns encode.
+        columns (Mapping[str, array.array[int]]): The columns by name.
+    """
+    descriptions = []
+    offset = 0
+
+    for name, column in columns.items():
+        if ITEM_SIZES.get(column.typecode) != column.itemsize:
+            raise ValueError(f"Column {name} has unsupported type {column.typecode}.")
+
+        descriptions.append(
+            {
+                "name": name,
+                "typecode": column.typecode,
+                "offset": offset,
+                "length": len(column),
+            }
+        )
+        offset = align(offset + len(column) * column.itemsize)
+
+    header = {"day": day, "byteorder": sys.byteorder, "columns": descriptions}
+    encoded = json.dumps(header).encode()
+    encoded = encoded.ljust(align(len(encoded)))
+
+    with open(filename, "wb") as f:
+        f.write(MAGIC + struct.pack("<Q", len(encoded)) + encoded)
+
+        for column in columns.values():
+            data = column.tobytes()
+            f.write(data + bytes(align(len(data)) - len(data)))
+
+
+def load_columns(filename: str) -> Tuple[int, Dict[str, memoryview]]:
+    """
+    Maps a columnar file into memory. Each column is a view of the mapping cast
+    to the typecode of the column, so loading takes the same time whatever the
+    size of the input, and the pages of a column are only read once used.
+
+    Args:
+        filename (str): The columnar file.
+
+    Returns:
+        Tuple[int, Dict[str, memoryview]]: The day whose model the columns
+        encode, and the columns by name.
+    """
+    with open(filename, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    data = memoryview(mapped)
+
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{filename} is not a columnar file.")
+
+    (size,) = struct.unpack_from("<Q", data, len(MAGIC))
+    start = len(MAGIC) + 8
+    header = json.loads(bytes(data[start : start + size]))
+
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"{filename} was written in another byte order.")
+
+    # Column offsets are relative to the end of the header
+    columns = {}
+
+    for description in header["columns"]:
+        offset = start + size + description["offset"]
+        end = offset + description["length"] * ITEM_SIZES[description["typecode"]]
+        columns[description["name"]] = data[offset:end].cast(description["typecode"])
+
+    return header["day"], columns
+
+
+def convert_file(day: int, filename: str, output: Optional[str] = None) -> str:
+    """
+    Converts a text input into a columnar file, with the encoder of the module
+    of its day.
+
+    Args:
+        day (int): The day of the input.
+        filename (str): The text input.
+        output (Optional[str]): The file to write, defaulting to the input with
+        the suffix of the format.
+
+    Returns:
+        str: The file written.
+    """
+    module = importlib.import_module(f"day_{day:02}")
+
+    if not hasattr(module, "encode_columns"):
+        raise ValueError(f"Day {day} has no columnar encoding.")
+
+    output = output or get_output_path(filename)
+    write_columns(
+        output, day, module.encode_columns(list(helpers.generate_lines(filename)))
+    )
+
+    return output
+
+
+def encode_grid(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    """
+    Encodes the lines of a grid as the cells of a grid.Grid, border included,
+    and the number of rows and columns with the value of the border.
+
+    Args:
+        lines (List[str]): The rows of the grid, all of the same length.
+
+    Returns:
+        Dict[str, array.array[int]]: The cells and shape columns.
+    """
+    layout = grid.Grid.from_lines(lines)
+    shape = [layout.rows, layout.columns, layout.border]
+
+    return {"cells": array.array("B", layout.cells), "shape": array.array("q", shape)}
+
+
+def decode_grid(columns: Mapping[str, memoryview]) -> grid.Grid:
+    """
+    Builds a grid over its loaded cells. The grid adopts the view of the cells
+    as they are, so building it copies nothing and the grid is read-only.
+
+    Args:
+        columns (Mapping[str, memoryview]): The cells and shape columns.
+
+    Returns:
+        grid.Grid: The grid.
+    """
+    rows, width, border = columns["shape"]
+    return grid.Grid(rows, width, border, columns["cells"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert inputs to columns.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert_parser = subparsers.add_parser("convert", help="convert a text input")
+    convert_parser.add_argument("--day", type=int, required=True)
+    convert_parser.add_argument("input")
+    convert_parser.add_argument("--output")
+    info_parser = subparsers.add_parser("info", help="describe a columnar file")
+    info_parser.add_argument("file")
+    args = parser.parse_args()
+
+    match args.command:
+        case "convert":
+            try:
+                output = convert_file(args.day, args.input, args.output)
+
+            except ValueError as e:
+                parser.exit(1, f"{e}\n")
+
+            input_size, output_size = (
+                os.path.getsize(args.input),
+                os.path.getsize(output),
+            )
+            print(f"Wrote {output}, {output_size} bytes from {input_size}.")
+
+        case "info":
+            day, columns = load_columns(args.file)
+            print(f"Day {day}")
+
+            for name, column in columns.items():
+                print(f"{name:<12}{column.format:>4}{len(column):>12}")
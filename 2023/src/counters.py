@@ -0,0 +1,110 @@
+"""
+This module counts the calls made to the character-level parsing primitives of
+helpers: expect, parse_digits and parse_whitespace. For each primitive and each
+calling module, it records the number of calls, the characters consumed and the
+time spent, and prints the table to stderr when the process exits.
+
+Counting is enabled by setting $AOC_COUNT_HELPERS before helpers is imported,
+which then swaps each primitive for a counting wrapper. When the variable is
+not set, nothing is swapped and the primitives run without any per-call check.
+
+Usage:
+    AOC_COUNT_HELPERS=1 python -m aoc run --year 2023 --day 7
+
+Functions:
+- is_enabled: Returns whether counting is requested by the environment.
+- find_caller: Returns the module that called into the helpers.
+- wrap: Wraps a primitive to count its calls, characters and time.
+- install: Swaps the primitives of a module for counting wrappers.
+- format_counts: Formats the counts as a table.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+import atexit
+import dataclasses
+import functools
+import os
+import sys
+import time
+import types
+
+# Environment variable enabling the counters
+ENVIRONMENT_VARIABLE = "AOC_COUNT_HELPERS"
+
+# Primitives of helpers that are counted
+PRIMITIVES = ("expect", "parse_digits", "parse_whitespace")
+
+# Modules whose frames are skipped when looking for the caller
+SKIPPED_MODULES = ("helpers", "counters")
+
+
+@dataclasses.dataclass
+class Count:
+    calls: int = 0
+    chars: int = 0
+    seconds: float = 0
+
+
+# Counts keyed by calling module and primitive
+COUNTS: Dict[Tuple[str, str], Count] = {}
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+# Walks up the stack to the first frame outside of the helpers, which is the
+# solver for calls made through helpers such as Layout.parse
+def find_caller() -> str:
+    frame = sys._getframe(2)
+
+    while frame is not None:
+        name = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+
+        if name not in SKIPPED_MODULES:
+            return name
+
+        frame = frame.f_back  # type: ignore[assignment]
+
+    return "<unknown>"
+
+
+def wrap(name: str, primitive: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(primitive)
+    def counted(line: str, line_index: int, *args: Any) -> Any:
+        start = time.perf_counter()
+        value = primitive(line, line_index, *args)
+        elapsed = time.perf_counter() - start
+
+        # parse_digits returns the digits along with the index after them
+        end = value[1] if isinstance(value, tuple) else value
+
+        count = COUNTS.setdefault((find_caller(), name), Count())
+        count.calls += 1
+        count.chars += end - line_index
+        count.seconds += elapsed
+        return value
+
+    return counted
+
+
+def install(module: types.ModuleType) -> None:
+    for name in PRIMITIVES:
+        setattr(module, name, wrap(name, getattr(module, name)))
+
+    atexit.register(lambda: print(format_counts(), file=sys.stderr))
+
+
+def format_counts() -> str:
+    rows = [
+        f"{'caller':<16}{'primitive':<18}{'calls':>12}{'chars':>12}"
+        f"{'ms':>10}{'ns/call':>10}"
+    ]
+
+    for (caller, name), count in sorted(COUNTS.items()):
+        rows.append(
+            f"{caller:<16}{name:<18}{count.calls:>12}{count.chars:>12}"
+            f"{count.seconds * 1000:>10.2f}{count.seconds * 1e9 / count.calls:>10.0f}"
+        )
+
+    return "\n".join(rows)
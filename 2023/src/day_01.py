@@ -22,9 +22,13 @@ Functions:
   spelled-out) in a string.
 - get_calibration_values_composite: Calculates the sum of calibration values for
   composite number combinations.
+- parse: Parses the input into the model shared by both parts.
+- part_1: Solves part one of the puzzle from the parsed model.
+- part_2: Solves part two of the puzzle from the parsed model.
+- stream: Solves both parts in one pass over the lines as they are read.
 """
 
-from typing import List, Iterable, Optional
+from typing import List, Iterable, Optional, Tuple
 
 import helpers
 
@@ -224,11 +228,73 @@ def get_calibration_values_composite(lines: Iterable[str]) -> int:
     return total
 
 
+# Parses the calibration document into the model shared by both parts
+def parse(lines: List[str]) -> List[str]:
+    """
+    Parses the calibration document. The lines are used as they are.
+
+    Args:
+        lines (List[str]): The lines of the calibration document.
+
+    Returns:
+        List[str]: The lines of the calibration document.
+    """
+    return lines
+
+
+# Solves part one from the parsed calibration document
+def part_1(lines: List[str]) -> int:
+    """
+    Solves part one: the sum of simple calibration values.
+
+    Args:
+        lines (List[str]): The parsed calibration document.
+
+    Returns:
+        int: The sum of simple calibration values.
+    """
+    return get_calibration_values_simple(lines)
+
+
+# Solves part two from the parsed calibration document
+def part_2(lines: List[str]) -> int:
+    """
+    Solves part two: the sum of composite calibration values.
+
+    Args:
+        lines (List[str]): The parsed calibration document.
+
+    Returns:
+        int: The sum of composite calibration values.
+    """
+    return get_calibration_values_composite(lines)
+
+
+# Solves both parts while reading the lines, keeping only the running totals
+def stream(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solves both parts in a single pass over the lines, folding each line into
+    the totals as it is read so that memory stays constant.
+
+    Args:
+        lines (Iterable[str]): The lines of the calibration document.
+
+    Returns:
+        Tuple[int, int]: The answers to parts one and two.
+    """
+    total, composite_total = 0, 0
+
+    for line in lines:
+        total += combine_numbers_simple(line)
+        composite_total += combine_numbers_composite(line)
+
+    return total, composite_total
+
+
 # Main execution block
 if __name__ == "__main__":
-    # Read lines from the calibration document
-    lines = list(helpers.generate_lines("2023/data/day_01.txt"))
-
-    # Print the total calibration values for both simple and composite cases
-    print(get_calibration_values_simple(lines))
-    print(get_calibration_values_composite(lines))
+    # Print the total calibration values for both simple and composite cases,
+    # reading the calibration document line by line
+    total, composite_total = stream(helpers.generate_lines("2023/data/day_01.txt"))
+    print(total)
+    print(composite_total)
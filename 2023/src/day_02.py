@@ -17,13 +17,24 @@ Functions:
 - add_valid_games: Sums the IDs of games that are possible within given limits.
 - add_set_powers: Calculates the sum of the powers of minimum sets of cubes
   required for each game.
+- find_max_draws: Finds the largest count of each color drawn in a game.
+- parse: Parses the input into the model shared by both parts.
+- part_1: Solves part one of the puzzle from the parsed model.
+- part_2: Solves part two of the puzzle from the parsed model.
+- fused: Solves both parts of the puzzle in a single pass.
+- stream: Solves both parts in one pass over the lines as they are read.
 """
 
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, List, Tuple
+import math
 
 import helpers
 
 
+# Cube count limits used in part one
+LIMITS = {"red": 12, "green": 13, "blue": 14}
+
+
 # Convert string of cube draws into a dictionary with counts for each color
 def convert_to_draws_dict(draws_string: str) -> Dict[str, int]:
     """
@@ -161,13 +172,128 @@ def add_set_powers(lines: Iterable[str]) -> int:
     return total
 
 
+# Find the largest count of each color over all the draws of a game
+def find_max_draws(line: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Finds the largest count of each color drawn in a game. A game is possible
+    within limits exactly when these counts are, and they form the minimum set
+    of cubes for the game.
+
+    Args:
+        line (str): A line from the game data.
+
+    Returns:
+        Tuple[int, Dict[str, int]]: The game ID and the largest count drawn of
+        each color.
+    """
+    prefix, all_draws_string = validate_line(line)
+    max_draws_dict: Dict[str, int] = {}
+
+    for draws_string in all_draws_string.split("; "):
+        for k, v in convert_to_draws_dict(draws_string).items():
+            if k not in max_draws_dict or max_draws_dict[k] < v:
+                max_draws_dict[k] = v
+
+    return int(prefix[5:]), max_draws_dict
+
+
+# Parses the game data into the model shared by both parts
+def parse(lines: List[str]) -> List[str]:
+    """
+    Parses the game data into the model shared by both parts. The games are
+    folded into the answers one line at a time, so the model is the lines as
+    they are rather than a record of the largest draws of every game.
+
+    Args:
+        lines (List[str]): The lines of the game data.
+
+    Returns:
+        List[str]: The lines of the game data.
+    """
+    return lines
+
+
+# Solves part one from the lines of the game data
+def part_1(lines: Iterable[str]) -> int:
+    """
+    Solves part one: the sum of IDs of games possible within LIMITS.
+
+    Args:
+        lines (Iterable[str]): The lines of the game data.
+
+    Returns:
+        int: The sum of IDs of possible games.
+    """
+    return sum(
+        game_id
+        for game_id, max_draws_dict in map(find_max_draws, lines)
+        if verify_within_limits(LIMITS, max_draws_dict)
+    )
+
+
+# Solves part two from the lines of the game data
+def part_2(lines: Iterable[str]) -> int:
+    """
+    Solves part two: the sum of the powers of the minimum sets of cubes.
+
+    Args:
+        lines (Iterable[str]): The lines of the game data.
+
+    Returns:
+        int: The sum of the powers of the minimum sets of cubes.
+    """
+    return sum(
+        math.prod(max_draws_dict.values())
+        for _, max_draws_dict in map(find_max_draws, lines)
+    )
+
+
+# Solves both parts in a single pass over the lines, finding the largest draws
+# of each game once
+def fused(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solves both parts in a single pass over the games, so that each line is
+    split once and memory stays constant however many games there are.
+
+    Args:
+        lines (Iterable[str]): The lines of the game data.
+
+    Returns:
+        Tuple[int, int]: The answers to parts one and two.
+    """
+    total, power_total = 0, 0
+
+    for game_id, max_draws_dict in map(find_max_draws, lines):
+        if verify_within_limits(LIMITS, max_draws_dict):
+            total += game_id
+
+        power_total += math.prod(max_draws_dict.values())
+
+    return total, power_total
+
+
+# Solves both parts while reading the lines, parsing each game only when it is
+# folded into the totals
+def stream(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solves both parts in a single pass over the lines as they are read.
+
+    Args:
+        lines (Iterable[str]): The lines of the game data.
+
+    Returns:
+        Tuple[int, int]: The answers to parts one and two.
+    """
+    return fused(lines)
+
+
 # Main execution point
 if __name__ == "__main__":
-    # Generate and process lines from the data file
-    lines = list(helpers.generate_lines("2023/data/day_02.txt"))
+    # Process the lines of the data file as they are read
+    total, power_total = stream(helpers.generate_lines("2023/data/day_02.txt"))
 
     # Print the sum of IDs of valid games within given limits
-    print(add_valid_games({"red": 12, "green": 13, "blue": 14}, lines))
+    print(total)
 
     # Print the sum of powers of minimum sets of cubes for each game
-    print(add_set_powers(lines))
+    print(power_total)
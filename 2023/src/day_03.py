@@ -9,14 +9,59 @@ https://adventofcode.com/2023/day/3
 
 Functions:
 - get_neighbors: Determines the adjacent locations to a given grid location.
+- scan_schematic: Collects the locations of numbers and symbols in the
+  engine schematic.
 - get_part_numbers_sum: Calculates the sum of part numbers and the sum of gear
   ratios as specified in the engine schematic.
+- add_part_numbers: Calculates both sums from a scanned schematic.
+- add_part_numbers_grid: Calculates both sums by reading the numbers around
+  each symbol of a flat grid.
+- parse: Builds the flat grid and the scan of the schematic shared by both
+  parts.
+- encode_columns: Encodes the schematic as the cells of a flat grid.
+- decode_columns: Builds the flat grid of the schematic over its cells, along
+  with its scan.
+- solve: Calculates both sums from the scan of the parsed model.
+- part_1: Solves part one of the puzzle from the parsed model.
+- part_2: Solves part two of the puzzle from the parsed model.
+- fused: Solves both parts with a single pass over the scan.
+- part_1_grid, part_2_grid: Solve the parts with add_part_numbers_grid.
+
+The parsed model holds a flat grid of the schematic, so its rows must all have
+the same length, and the schematic scanned once for the reference parts.
 """
 
-from typing import DefaultDict, Iterable, List, Tuple
+from typing import DefaultDict, Dict, Iterable, List, Mapping, Set, Tuple
+import array
 import collections
+import re
 
-import helpers
+import cache
+import columnar
+import grid
+
+
+# Version of the model returned by parse, bumped when it changes
+PARSER_VERSION = 2
+
+# Bytes of the digits, and patterns matching a number and a symbol in the cells
+# of a flat grid of the schematic
+DIGITS = b"0123456789"
+NUMBER_PATTERN = re.compile(rb"\d+")
+SYMBOL_PATTERN = re.compile(rb"[^.\d]")
+
+# Scanned schematic: number locations keyed by value and occurrence, symbol
+# locations and characters, and the maximum row and column indices
+Schematic = Tuple[
+    Dict[Tuple[int, int], Set[Tuple[int, int]]],
+    List[Tuple[Tuple[int, int], str]],
+    int,
+    int,
+]
+
+# Parsed model: the flat grid of the schematic for the engines, and its scan for
+# the reference parts
+Model = Tuple[grid.Grid, Schematic]
 
 
 # Function to get neighboring cells of a grid location
@@ -44,22 +89,18 @@ def get_neighbors(
     return neighbors
 
 
-# Main function to process the schematic and calculate sums
-def get_part_numbers_sum(lines: Iterable[str]) -> Tuple[int, int]:
+# Scan the schematic for part number and symbol locations
+def scan_schematic(lines: Iterable[str]) -> Schematic:
     """
-    Processes the engine schematic to calculate the sum of part numbers and gear
-    ratios.
-
-    Part numbers are adjacent to symbols in the schematic. Gear ratios are
-    calculated for gears, represented by '*' and adjacent to exactly two part
-    numbers. The function returns a tuple containing the sum of part numbers and
-    the sum of gear ratios.
+    Scans the engine schematic for numbers and symbols.
 
     Args:
         lines (Iterable[str]): Lines of the engine schematic.
 
     Returns:
-        Tuple[int, int]: Sum of part numbers and sum of gear ratios.
+        Schematic: The locations of each number keyed by value and occurrence,
+        the location and character of each symbol, and the maximum row and
+        column indices.
     """
 
     # Collect in dictionary digit-count as key and locations as values
@@ -107,6 +148,51 @@ def get_part_numbers_sum(lines: Iterable[str]) -> Tuple[int, int]:
             # Collect symbol locations for later processing
             symbol_locations.append(((i, j), char))
 
+    return digits, symbol_locations, max_row_index, max_column_index
+
+
+# Main function to process the schematic and calculate sums
+def get_part_numbers_sum(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Processes the engine schematic to calculate the sum of part numbers and gear
+    ratios.
+
+    Part numbers are adjacent to symbols in the schematic. Gear ratios are
+    calculated for gears, represented by '*' and adjacent to exactly two part
+    numbers. The function returns a tuple containing the sum of part numbers and
+    the sum of gear ratios.
+
+    Args:
+        lines (Iterable[str]): Lines of the engine schematic.
+
+    Returns:
+        Tuple[int, int]: Sum of part numbers and sum of gear ratios.
+    """
+    return add_part_numbers(*scan_schematic(lines))
+
+
+# Calculate the sums from a scanned schematic
+def add_part_numbers(
+    digits: Dict[Tuple[int, int], Set[Tuple[int, int]]],
+    symbol_locations: List[Tuple[Tuple[int, int], str]],
+    max_row_index: int,
+    max_column_index: int,
+) -> Tuple[int, int]:
+    """
+    Calculates the sum of part numbers and gear ratios from a scanned
+    schematic. The digits dictionary is consumed as part numbers are found.
+
+    Args:
+        digits (Dict[Tuple[int, int], Set[Tuple[int, int]]]): The locations of
+        each number keyed by value and occurrence.
+        symbol_locations (List[Tuple[Tuple[int, int], str]]): The location and
+        character of each symbol.
+        max_row_index, max_column_index (int): The maximum row and column
+        indices of the schematic.
+
+    Returns:
+        Tuple[int, int]: Sum of part numbers and sum of gear ratios.
+    """
     part_numbers = []
 
     # Collect in dictionary asterisk location as key and part numbers as values
@@ -150,10 +236,115 @@ def get_part_numbers_sum(lines: Iterable[str]) -> Tuple[int, int]:
     return sum(part_numbers), gear_ratio_total
 
 
+# Calculate the sums by reading the numbers around each symbol of a flat grid
+def add_part_numbers_grid(layout: grid.Grid) -> Tuple[int, int]:
+    """
+    Calculates the sum of part numbers and gear ratios from a flat grid of the
+    schematic. Symbols are found by searching the cells, and the numbers next
+    to a symbol by reading its eight neighbours and extending each digit found
+    to the whole number, so neither the numbers nor their cells are collected
+    beforehand. As in add_part_numbers, a number adjacent to several symbols
+    only counts towards the first.
+
+    Args:
+        layout (grid.Grid): The schematic, with '.' as its border.
+
+    Returns:
+        Tuple[int, int]: Sum of part numbers and sum of gear ratios.
+    """
+    cells = layout.cells
+
+    # First cell of each number already counted
+    used: Set[int] = set()
+    part_number_total, gear_ratio_total = 0, 0
+
+    for match in SYMBOL_PATTERN.finditer(cells):
+        index = match.start()
+        numbers = []
+
+        for offset in layout.offsets_8:
+            start = index + offset
+
+            if cells[start] not in DIGITS:
+                continue
+
+            # The border stops the walk back to the first digit of the number
+            while cells[start - 1] in DIGITS:
+                start -= 1
+
+            if start not in used:
+                used.add(start)
+                number = NUMBER_PATTERN.match(cells, start)
+                assert number is not None
+                numbers.append(int(number.group()))
+
+        part_number_total += sum(numbers)
+
+        if match.group() == b"*" and len(numbers) == 2:
+            gear_ratio_total += numbers[0] * numbers[1]
+
+    return part_number_total, gear_ratio_total
+
+
+# Parses the schematic into a flat grid and its scan, shared by both parts
+def parse(lines: List[str]) -> Model:
+    return grid.Grid.from_lines(lines), scan_schematic(lines)
+
+
+# Encodes the schematic as the cells of a flat grid for the columnar format
+def encode_columns(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    columns: Dict[str, "array.array[int]"] = columnar.encode_grid(lines)
+    return columns
+
+
+# Builds the flat grid of the schematic over the columns of its cells, and scans
+# the schematic from the rows of the grid
+def decode_columns(columns: Mapping[str, memoryview]) -> Model:
+    layout = columnar.decode_grid(columns)
+    return layout, scan_schematic(layout.to_lines())
+
+
+# Calculates both sums from the scan, copying the numbers as they are consumed
+def solve(model: Model) -> Tuple[int, int]:
+    digits, symbol_locations, max_row_index, max_column_index = model[1]
+    return add_part_numbers(
+        dict(digits), symbol_locations, max_row_index, max_column_index
+    )
+
+
+# Solves part one: the sum of part numbers
+def part_1(model: Model) -> int:
+    return solve(model)[0]
+
+
+# Solves part two: the sum of gear ratios
+def part_2(model: Model) -> int:
+    return solve(model)[1]
+
+
+# Solves both parts, matching numbers to symbols once rather than once per part
+def fused(model: Model) -> Tuple[int, int]:
+    return solve(model)
+
+
+# Solves part one from the symbols of the flat grid
+def part_1_grid(model: Model) -> int:
+    return add_part_numbers_grid(model[0])[0]
+
+
+# Solves part two from the symbols of the flat grid
+def part_2_grid(model: Model) -> int:
+    return add_part_numbers_grid(model[0])[1]
+
+
+# Alternative implementations of the parts, keyed by engine name
+ENGINES = {"grid": {1: part_1_grid, 2: part_2_grid}}
+
+
 # Entry point for running the program
 if __name__ == "__main__":
-    # Read and process lines from the data file
-    lines = helpers.generate_lines("2023/data/day_03.txt")
+    # Read and parse the schematic, reusing a cached model when available
+    model = cache.load_or_parse("2023/data/day_03.txt", parse, PARSER_VERSION)
 
     # Print the results of the calculation
-    print(get_part_numbers_sum(lines))
+    print(fused(model))
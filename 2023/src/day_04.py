@@ -14,21 +14,34 @@ Classes:
 
 Functions:
 - parse_card(line): Parses a single line of input into a Card object.
+- scan_cards(lines): Parses every line of input into a list of Card objects.
 - count_match(card): Counts the number of matches between a card's winning and
   player's numbers.
 - count_points(card): Calculates the points for a card based on the number of
   matches.
 - count_cards(cards): Calculates the total number of cards including any
   additional ones won.
+- parse(lines): Parses the input into the list of cards shared by both parts.
+- part_1(cards): Calculates the total points of all cards.
+- part_2(cards): Calculates the total number of cards including copies.
+- stream(lines): Solves both parts in one pass over the lines as they are read.
 """
 
-from typing import Counter, List, Sequence, Set
+from typing import Counter, Dict, Iterable, List, Sequence, Set, Tuple
 import collections
 import dataclasses
 
+import cache
 import helpers
 
 
+# Layout of a scratchcard line, compiled once on import
+CARD_LAYOUT = helpers.compile_layout("Card {int}: {ints} | {ints}")
+
+# Version of the structure returned by scan_cards, bumped when it changes
+PARSER_VERSION = 1
+
+
 # Define a dataclass to represent each scratchcard
 @dataclasses.dataclass
 class Card:
@@ -44,58 +57,14 @@ class Card:
 
 # Parse a line of text into a Card object
 def parse_card(line: str) -> Card:
-    line_index = 0
-    item_counter = 0
-
-    items: List[int] = []
-
-    # Process each character in the line to extract card information
-    while line_index < len(line):
-        match item_counter:
-            case 0:
-                # Parse each character of the word "Card" and the card ID
-                line_index = helpers.expect(line, line_index, "C")
-                line_index = helpers.expect(line, line_index, "a")
-                line_index = helpers.expect(line, line_index, "r")
-                line_index = helpers.expect(line, line_index, "d")
-                line_index = helpers.parse_whitespace(line, line_index)
-                card_id, line_index = helpers.parse_digits(line, line_index)
-                line_index = helpers.expect(line, line_index, ":")
-                line_index = helpers.parse_whitespace(line, line_index)
-
-                item_counter += 1
-
-            case 1:
-                # Parse winning numbers, separated by a vertical bar from
-                # player's numbers
-                if line[line_index] == "|":
-                    n_winners = len(items)
-
-                    line_index += 1
-                    line_index = helpers.parse_whitespace(line, line_index)
+    card_id, winners, selects = CARD_LAYOUT.parse(line)
 
-                    item_counter += 1
-                    continue
+    return Card(card_id, len(winners), winners + selects)
 
-                winner, line_index = helpers.parse_digits(line, line_index)
-                items.append(int(winner))
 
-                line_index = helpers.parse_whitespace(line, line_index)
-
-            case 2:
-                # Parse player's numbers
-                selection, line_index = helpers.parse_digits(line, line_index)
-                items.append(int(selection))
-
-                if line_index == len(line):
-                    break
-
-                line_index = helpers.parse_whitespace(line, line_index)
-
-            case _:
-                raise ValueError("Expected sequence of digits.")
-
-    return Card(int(card_id), n_winners, items)
+# Parse every line of text into a list of Card objects
+def scan_cards(lines: Iterable[str]) -> List[Card]:
+    return [parse_card(line) for line in lines]
 
 
 # Count the number of matches between winning and player's numbers on a card
@@ -134,17 +103,50 @@ def count_cards(cards: Sequence[Card]) -> int:
     return len(cards) + total_copies
 
 
+# Parse the scratchcards into the model shared by both parts
+def parse(lines: List[str]) -> List[Card]:
+    return scan_cards(lines)
+
+
+# Solve part one: the total points of all scratchcards
+def part_1(cards: List[Card]) -> int:
+    return sum(count_points(card) for card in cards)
+
+
+# Solve part two: the total number of scratchcards including copies
+def part_2(cards: List[Card]) -> int:
+    return count_cards(cards)
+
+
+# Solve both parts while reading the lines. Copies won by a card only go to the
+# cards right after it, so only the copies of cards not yet read are kept, and
+# they are dropped once their card is read.
+def stream(lines: Iterable[str]) -> Tuple[int, int]:
+    pending: Dict[int, int] = {}
+    points, total = 0, 0
+
+    for line in lines:
+        card = parse_card(line)
+        match = count_match(card)
+        copies = pending.pop(card.id, 0)
+
+        points += 0 if match == 0 else 2 ** (match - 1)
+        total += 1 + match * (1 + copies)
+
+        for i in range(match):
+            pending[card.id + i + 1] = pending.get(card.id + i + 1, 0) + 1 + copies
+
+    return points, total
+
+
 if __name__ == "__main__":
     # Process each line to create Card objects and calculate total points and
     # card count
-    lines = helpers.generate_lines("2023/data/day_04.txt")
+    cards = cache.load_or_parse("2023/data/day_04.txt", scan_cards, PARSER_VERSION)
     total = 0
-    cards = []
 
-    for line in lines:
-        card = parse_card(line)
+    for card in cards:
         total += count_points(card)
-        cards.append(card)
 
     # Print the total points from all scratchcards
     print(total)
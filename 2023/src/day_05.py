@@ -19,16 +19,28 @@ Functions:
   lines.
 - find_min_location_individual(almanac, seeds): Finds the lowest location for
   individual seeds.
-- find_min_location_range(almanac, seeds): Finds the lowest location for a range
-  of seeds.
+- find_min_location_range(almanac, seeds, deadline): Finds the lowest location
+  for a range of seeds, giving up at an optional deadline.
+- find_min_location_intervals(almanac, seeds): Finds the lowest location for a
+  range of seeds by mapping whole intervals at a time.
+- parse(lines): Parses the input into the almanac and seeds shared by both
+  parts.
+- part_1(model): Finds the lowest location for individual seeds.
+- part_2(model): Finds the lowest location for ranges of seeds.
+- part_2_intervals(model): Finds the same location using interval mapping.
 """
 
 from typing import Dict, List, Optional, Iterable, Tuple
 import dataclasses
 
+import cache
 import helpers
 
 
+# Version of the structure returned by init_almanac, bumped when it changes
+PARSER_VERSION = 1
+
+
 # Define a dataclass to represent the transformation range from one category to another
 @dataclasses.dataclass
 class Range:
@@ -103,10 +115,10 @@ def init_almanac(lines: Iterable[str]) -> Tuple[Almanac, List[int]]:
                     item_counter += 1
 
                 case 1:
-                    # Process lines containing seed numbers
-                    line_index = helpers.parse_whitespace(line, line_index)
-                    seed, line_index = helpers.parse_digits(line, line_index)
-                    seeds.append(int(seed))
+                    # Process all seed numbers on the line at once
+                    seed_values, _ = helpers.parse_ints(line[line_index:])
+                    seeds.extend(seed_values)
+                    break
 
                 case _:
                     # Process mapping lines
@@ -120,15 +132,14 @@ def init_almanac(lines: Iterable[str]) -> Tuple[Almanac, List[int]]:
                         break
 
                     # Process and update dictionary with mapping data
-                    target_start, line_index = helpers.parse_digits(line, line_index)
-                    line_index = helpers.parse_whitespace(line, line_index)
-                    source_start, line_index = helpers.parse_digits(line, line_index)
-                    line_index = helpers.parse_whitespace(line, line_index)
-                    size, line_index = helpers.parse_digits(line, line_index)
+                    mapping_values, _ = helpers.parse_ints(line)
 
-                    almanac.update_dictionary(
-                        source, int(source_start), int(target_start), int(size)
-                    )
+                    if len(mapping_values) != 3:
+                        raise ValueError("Expected exactly 3 items.")
+
+                    target_start, source_start, size = mapping_values
+                    almanac.update_dictionary(source, source_start, target_start, size)
+                    break
 
     return almanac, seeds
 
@@ -159,8 +170,11 @@ def find_min_location_individual(almanac: Almanac, seeds: List[int]) -> Tuple[in
     return min_location, min_seed
 
 
-# Find the minimum location number for a range of seeds
-def find_min_location_range(almanac: Almanac, seeds: List[int]) -> Tuple[int, int]:
+# Find the minimum location number for a range of seeds, giving up with the
+# progress made once the deadline has passed
+def find_min_location_range(
+    almanac: Almanac, seeds: List[int], deadline: Optional[float] = None
+) -> Tuple[int, int]:
     min_seed, min_location = None, None
 
     # Fill gaps in the dictionaries to optimize the search
@@ -173,6 +187,16 @@ def find_min_location_range(almanac: Almanac, seeds: List[int]) -> Tuple[int, in
 
         # Iterate over each seed in the range
         for j in range(seeds[i], seeds[i] + seeds[i + 1]):
+            if deadline is not None and j % helpers.DEADLINE_INTERVAL == 0:
+                helpers.check_deadline(
+                    deadline,
+                    ranges=len(seeds) // 2,
+                    ranges_done=i // 2,
+                    seeds_done=j - seeds[i],
+                    seeds_in_range=seeds[i + 1],
+                    min_location=min_location,
+                )
+
             if skip_count > 0:
                 skip_count -= 1
                 continue
@@ -204,10 +228,84 @@ def find_min_location_range(almanac: Almanac, seeds: List[int]) -> Tuple[int, in
     return min_location, min_seed
 
 
+# Find the minimum location number for a range of seeds by mapping intervals
+def find_min_location_intervals(almanac: Almanac, seeds: List[int]) -> Tuple[int, int]:
+    # Each interval holds its start, its end and the seed mapped to its start.
+    # Mappings are translations, so the seed of any value follows from these.
+    intervals = [
+        (seeds[i], seeds[i] + seeds[i + 1], seeds[i]) for i in range(0, len(seeds), 2)
+    ]
+
+    source = "seed"
+
+    # Split intervals at the bounds of each mapping, and translate the pieces
+    while source != "location":
+        mappings = sorted(almanac.dictionaries[source].dictionary.items())
+        mapped_intervals = []
+
+        for start, end, seed in intervals:
+            for (source_start, source_end), target_start in mappings:
+                if end <= source_start or source_end <= start:
+                    continue
+
+                # Values before the mapping keep their number
+                if start < source_start:
+                    mapped_intervals.append((start, source_start, seed))
+                    seed += source_start - start
+                    start = source_start
+
+                overlap_end = min(end, source_end)
+                offset = target_start - source_start
+                mapped_intervals.append((start + offset, overlap_end + offset, seed))
+
+                seed += overlap_end - start
+                start = overlap_end
+
+                if start == end:
+                    break
+
+            if start < end:
+                mapped_intervals.append((start, end, seed))
+
+        intervals = mapped_intervals
+        source = almanac.dictionaries[source].target
+
+    min_location, _, min_seed = min(intervals)
+    return min_location, min_seed
+
+
+# Parse the almanac into the model shared by both parts
+def parse(lines: List[str]) -> Tuple[Almanac, List[int]]:
+    return init_almanac(lines)
+
+
+# Solve part one: the lowest location for individual seeds
+def part_1(model: Tuple[Almanac, List[int]]) -> int:
+    almanac, seeds = model
+    return find_min_location_individual(almanac, seeds)[0]
+
+
+# Solve part two: the lowest location for ranges of seeds
+def part_2(model: Tuple[Almanac, List[int]], deadline: Optional[float] = None) -> int:
+    almanac, seeds = model
+    return find_min_location_range(almanac, seeds, deadline)[0]
+
+
+# Solve part two by mapping intervals instead of scanning seeds
+def part_2_intervals(model: Tuple[Almanac, List[int]]) -> int:
+    almanac, seeds = model
+    return find_min_location_intervals(almanac, seeds)[0]
+
+
+# Alternative implementations of the parts, keyed by engine name
+ENGINES = {"intervals": {2: part_2_intervals}}
+
+
 if __name__ == "__main__":
     # Read input lines, initialize the almanac and seed list, and find the minimum locations
-    lines = helpers.generate_lines("2023/data/day_05.txt")
-    almanac, seeds = init_almanac(lines)
+    almanac, seeds = cache.load_or_parse(
+        "2023/data/day_05.txt", init_almanac, PARSER_VERSION
+    )
 
     print(find_min_location_individual(almanac, seeds))
     print(find_min_location_range(almanac, seeds))
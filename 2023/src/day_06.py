@@ -10,12 +10,26 @@ Functions:
   from input lines.
 - count_ways(time, distance): Computes the number of ways to win a race given
   time and distance.
+- count_ways_closed(time, distance): Computes the number of ways to win a race
+  from the roots of the distance equation.
+- parse(lines): Parses the input into the model shared by both parts.
+- part_1(model): Computes the product of the ways to win each race.
+- part_2(model): Computes the ways to win the concatenated race.
+- part_1_closed(model), part_2_closed(model): Computes both parts with
+  count_ways_closed.
 """
 
 from typing import Iterable, List, Tuple
+import math
+
 import helpers
 
 
+# Layouts of the time and distance lines, compiled once on import
+TIME_LAYOUT = helpers.compile_layout("Time: {ints}")
+DISTANCE_LAYOUT = helpers.compile_layout("Distance: {ints}")
+
+
 def scan_race_parameters(lines: Iterable[str]) -> Tuple[List[int], List[int]]:
     """
     Scans and parses input lines to extract race parameters, specifically time
@@ -37,40 +51,18 @@ def scan_race_parameters(lines: Iterable[str]) -> Tuple[List[int], List[int]]:
         AssertionError: If the number of extracted time values doesn't match the
         number of distances.
     """
-    section_counter = 0  # Tracks which section (time or distance) is being parsed.
-    times, distances = [], []  # Lists to store parsed time and distance values.
-
-    for line in lines:
-        line_index = 0  # Tracks the current position within the line.
-
-        while line_index < len(line):
-            match section_counter:
-                # Process the Time section.
-                case 0:
-                    if line_index == 0:
-                        # Expect the "Time:" label at the start of the line.
-                        line_index = helpers.expect(line, line_index, "Time:")
-                        continue
-
-                    # Parse the time value and append it to the times list.
-                    line_index = helpers.parse_whitespace(line, line_index)
-                    time, line_index = helpers.parse_digits(line, line_index)
-                    times.append(int(time))
-
-                # Process the Distance section.
-                case 1:
-                    if line_index == 0:
-                        # Expect the "Distance:" label at the start of the line.
-                        line_index = helpers.expect(line, line_index, "Distance:")
-                        continue
-
-                    # Parse the distance value and append it to the distances
-                    # list.
-                    line_index = helpers.parse_whitespace(line, line_index)
-                    distance, line_index = helpers.parse_digits(line, line_index)
-                    distances.append(int(distance))
-
-        section_counter += 1
+    times: List[int] = []  # List to store parsed time values.
+    distances: List[int] = []  # List to store parsed distance values.
+
+    for section_counter, line in enumerate(lines):
+        match section_counter:
+            # Process the Time section.
+            case 0:
+                (times,) = TIME_LAYOUT.parse(line)
+
+            # Process the Distance section.
+            case 1:
+                (distances,) = DISTANCE_LAYOUT.parse(line)
 
     # Ensure the number of times matches the number of distances.
     assert len(times) == len(
@@ -110,6 +102,128 @@ def count_ways(time: int, distance: int) -> int:
     return ways
 
 
+def count_ways_closed(time: int, distance: int) -> int:
+    """
+    Calculates the number of ways to win a race without trying every hold
+    duration.
+
+    Holding the button for i milliseconds beats the record when
+    i * (time - i) > distance, which holds strictly between the two roots of
+    i^2 - time * i + distance. The first winning duration is found from the
+    integer square root of the discriminant, and the winning durations are
+    symmetric around time / 2.
+
+    Args:
+        time (int): The total time limit for the race.
+        distance (int): The record distance to beat.
+
+    Returns:
+        int: The number of ways to win the race by exceeding the record
+        distance.
+    """
+    discriminant = time * time - 4 * distance
+
+    if discriminant <= 0:
+        return 0
+
+    # Start at or below the first winning duration, then step up to it.
+    first = max(1, (time - math.isqrt(discriminant)) // 2)
+
+    while first <= time - first and first * (time - first) <= distance:
+        first += 1
+
+    return max(0, time - 2 * first + 1)
+
+
+def parse(lines: List[str]) -> Tuple[List[int], List[int]]:
+    """
+    Parses the race parameters into the model shared by both parts.
+
+    Args:
+        lines (List[str]): The lines of the race document.
+
+    Returns:
+        Tuple[List[int], List[int]]: The time limits and record distances.
+    """
+    return scan_race_parameters(lines)
+
+
+def part_1(model: Tuple[List[int], List[int]]) -> int:
+    """
+    Solves part one: the product of the number of ways to win each race.
+
+    Args:
+        model (Tuple[List[int], List[int]]): The time limits and record
+        distances.
+
+    Returns:
+        int: The product of the number of ways to win each race.
+    """
+    times, distances = model
+    product = 1
+
+    for i in range(len(times)):
+        product *= count_ways(times[i], distances[i])
+
+    return product
+
+
+def part_2(model: Tuple[List[int], List[int]]) -> int:
+    """
+    Solves part two: the number of ways to win the single race whose time and
+    distance are the concatenated values.
+
+    Args:
+        model (Tuple[List[int], List[int]]): The time limits and record
+        distances.
+
+    Returns:
+        int: The number of ways to win the concatenated race.
+    """
+    times, distances = model
+
+    actual_time = int("".join(map(str, times)))
+    actual_distance = int("".join(map(str, distances)))
+
+    return count_ways(actual_time, actual_distance)
+
+
+def part_1_closed(model: Tuple[List[int], List[int]]) -> int:
+    """
+    Solves part one with the closed form of the number of ways to win.
+
+    Args:
+        model (Tuple[List[int], List[int]]): The time limits and record
+        distances.
+
+    Returns:
+        int: The product of the number of ways to win each race.
+    """
+    times, distances = model
+    return math.prod(map(count_ways_closed, times, distances))
+
+
+def part_2_closed(model: Tuple[List[int], List[int]]) -> int:
+    """
+    Solves part two with the closed form of the number of ways to win.
+
+    Args:
+        model (Tuple[List[int], List[int]]): The time limits and record
+        distances.
+
+    Returns:
+        int: The number of ways to win the concatenated race.
+    """
+    times, distances = model
+    return count_ways_closed(
+        int("".join(map(str, times))), int("".join(map(str, distances)))
+    )
+
+
+# Alternative implementations of the parts, keyed by engine name
+ENGINES = {"closed": {1: part_1_closed, 2: part_2_closed}}
+
+
 if __name__ == "__main__":
     # Load race data from a file and parse it.
     lines = helpers.generate_lines("2023/data/day_06.txt")
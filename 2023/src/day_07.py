@@ -12,6 +12,7 @@ on their rankings.
 https://adventofcode.com/2023/day/7
 
 Functions:
+- parse_hand_bid_pair(line): Extracts the hand and bid of a line.
 - scan_hand_bid_pairs(lines): Extracts hands and bids from input lines.
 - evaluate_hand_strength(ranked_hand): Determines the strength of a given hand.
 - convert_hand_to_hand_type(hand): Converts a hand to a tuple with its strength
@@ -22,9 +23,20 @@ Functions:
   wildcard hand.
 - calculate_winnings(lines, is_wildcard_version): Calculates total winnings
   based on hand rankings.
+- unpack_code(code): Unpacks the card ranks of a packed hand.
+- calculate_code_winnings(codes, bids, is_wildcard_version): Calculates total
+  winnings by sorting and scoring the packed hands.
+- parse(lines): Packs the hands and bids into the model shared by both parts.
+- encode_columns(lines): Encodes the hands as packed codes and the bids.
+- decode_columns(columns): Returns the packed hands and bids of their columns.
+- part_1(model): Calculates total winnings under regular rules.
+- part_2(model): Calculates total winnings under wildcard rules.
+- stream(lines): Calculates total winnings under both rules, reading the lines
+  as they come.
 """
 
-from typing import Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+import array
 import collections
 import dataclasses
 
@@ -36,6 +48,17 @@ import helpers
 RANKS = "..23456789TJQKA"
 WILDCARD_RANKS = "..J23456789TQKA"
 
+# Bits per card in the packed code of a hand, enough for any index of RANKS
+CARD_BITS = 4
+
+# Index of the wildcard in RANKS, and the index it takes in a packed hand under
+# wildcard rules, below every other card
+JOKER = RANKS.index("J")
+WILDCARD_JOKER = 1
+
+# Packed hands and their bids, as encoded in the columns
+Model = Tuple[Sequence[int], Sequence[int]]
+
 
 @dataclasses.dataclass(frozen=True)
 class RankCount:
@@ -52,6 +75,25 @@ class RankCount:
     rank: int
 
 
+def parse_hand_bid_pair(line: str) -> Tuple[str, str]:
+    """
+    Parses a line containing a hand and bid pair.
+
+    Args:
+        line (str): A line with a hand and a bid.
+
+    Returns:
+        Tuple[str, str]: The hand and its corresponding bid.
+    """
+    line_index = 5  # Line index where the hand ends and bid begins.
+
+    hand = line[:line_index]
+    line_index = helpers.parse_whitespace(line, line_index)  # Skipping whitespace.
+    bid, _ = helpers.parse_digits(line, line_index)  # Parsing the bid.
+
+    return hand, bid
+
+
 def scan_hand_bid_pairs(lines: Iterable[str]) -> List[Tuple[str, str]]:
     """
     Parses lines containing hand and bid pairs.
@@ -64,18 +106,7 @@ def scan_hand_bid_pairs(lines: Iterable[str]) -> List[Tuple[str, str]]:
         List[Tuple[str, str]]: A list of tuples, each containing a hand (str)
         and its corresponding bid (str).
     """
-    pairs = []
-
-    for line in lines:
-        line_index = 5  # Line index where the hand ends and bid begins.
-
-        hand = line[:line_index]
-        line_index = helpers.parse_whitespace(line, line_index)  # Skipping whitespace.
-        bid, _ = helpers.parse_digits(line, line_index)  # Parsing the bid.
-
-        pairs.append((hand, bid))
-
-    return pairs
+    return [parse_hand_bid_pair(line) for line in lines]
 
 
 def evaluate_hand_strength(ranked_hand: Sequence[int]) -> int:
@@ -254,10 +285,195 @@ def calculate_winnings(lines: Iterable[str], is_wildcard_version: bool) -> int:
     return winnings
 
 
+def unpack_code(code: int) -> List[int]:
+    """
+    Unpacks the index in RANKS of each card of a packed hand, first card first.
+
+    Args:
+        code (int): The hand packed as in encode_columns.
+
+    Returns:
+        List[int]: The index in RANKS of each card.
+    """
+    mask = (1 << CARD_BITS) - 1
+    return [(code >> (CARD_BITS * i)) & mask for i in reversed(range(5))]
+
+
+def calculate_code_winnings(
+    codes: Sequence[int], bids: Sequence[int], is_wildcard_version: bool
+) -> int:
+    """
+    Calculates total winnings from packed hands, as calculate_winnings does from
+    lines. Packed hands compare as their ranks do, so each hand is sorted by its
+    strength placed above its code. Under wildcard rules, jokers take the most
+    common of the other cards to find the strength, and the lowest index in the
+    code so that they compare below every other card.
+
+    Args:
+        codes (Sequence[int]): The hands, packed as in encode_columns.
+        bids (Sequence[int]): The bid of each hand.
+        is_wildcard_version (bool): A flag indicating if wildcard rules should
+        be applied.
+
+    Returns:
+        int: The total winnings calculated based on hand rankings and
+        corresponding bids.
+    """
+    key_bid_pairs = []
+
+    for code, bid in zip(codes, bids):
+        ranked_hand = unpack_code(code)
+
+        if is_wildcard_version and JOKER in ranked_hand:
+            others = [rank for rank in ranked_hand if rank != JOKER] or [JOKER]
+            best = max(others, key=others.count)
+            hand_strength = evaluate_hand_strength(
+                [best if rank == JOKER else rank for rank in ranked_hand]
+            )
+
+            code = 0
+
+            for rank in ranked_hand:
+                code = (code << CARD_BITS) | (WILDCARD_JOKER if rank == JOKER else rank)
+
+        else:
+            hand_strength = evaluate_hand_strength(ranked_hand)
+
+        key_bid_pairs.append(((hand_strength << (CARD_BITS * 5)) | code, bid))
+
+    # Sorting on the key alone keeps copies of a hand in their order, as
+    # calculate_winnings does.
+    key_bid_pairs.sort(key=lambda x: x[0])
+
+    return sum(bid * i for i, (_, bid) in enumerate(key_bid_pairs, start=1))
+
+
+def parse(lines: List[str]) -> Model:
+    """
+    Packs the hands and bids, as encode_columns does, so that the parts score
+    text and columnar inputs alike.
+
+    Args:
+        lines (List[str]): The lines of hands and bids.
+
+    Returns:
+        Model: The packed hands and the bid of each hand.
+    """
+    columns = encode_columns(lines)
+    return columns["codes"], columns["bids"]
+
+
+def encode_columns(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    """
+    Encodes each hand as a 32-bit code, packing the index of each card in RANKS
+    into four bits with the first card highest, and each bid as a 32-bit value.
+
+    Args:
+        lines (List[str]): The lines of hands and bids.
+
+    Returns:
+        Dict[str, array.array[int]]: The codes and bids columns.
+    """
+    codes, bids = array.array("I"), array.array("I")
+
+    for hand, bid in scan_hand_bid_pairs(lines):
+        code = 0
+
+        for char in hand:
+            code = (code << CARD_BITS) | RANKS.index(char)
+
+        codes.append(code)
+        bids.append(int(bid))
+
+    return {"codes": codes, "bids": bids}
+
+
+def decode_columns(columns: Mapping[str, memoryview]) -> Model:
+    """
+    Returns the packed hands and bids of their columns. Both are views of the
+    mapped columns, so no hand is unpacked until it is scored.
+
+    Args:
+        columns (Mapping[str, memoryview]): The codes and bids columns.
+
+    Returns:
+        Model: The packed hands and the bid of each hand.
+    """
+    return columns["codes"], columns["bids"]
+
+
+def part_1(model: Model) -> int:
+    """
+    Solves part one: the total winnings under regular rules.
+
+    Args:
+        model (Model): The packed hands and the bid of each hand.
+
+    Returns:
+        int: The total winnings.
+    """
+    return calculate_code_winnings(*model, False)
+
+
+def part_2(model: Model) -> int:
+    """
+    Solves part two: the total winnings with 'J' as a wildcard.
+
+    Args:
+        model (Model): The packed hands and the bid of each hand.
+
+    Returns:
+        int: The total winnings.
+    """
+    return calculate_code_winnings(*model, True)
+
+
+def stream(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Calculates total winnings under both rules in a single pass over the lines.
+
+    Two hands have the same type and ranks only when they are the same hand, so
+    ranking needs the distinct hands alone. Each hand keeps its count, the sum
+    of its bids, and the sum of its bids weighted by their order among the
+    copies of the hand, which is the order a stable sort leaves them in. Memory
+    is bounded by the number of distinct hands rather than of lines.
+
+    Args:
+        lines (Iterable[str]): An iterable collection of strings, each
+        representing a line with a hand and a bid.
+
+    Returns:
+        Tuple[int, int]: The total winnings under regular and wildcard rules.
+    """
+    totals: Dict[str, List[int]] = {}
+
+    for line in lines:
+        hand, bid = parse_hand_bid_pair(line)
+        total = totals.setdefault(hand, [0, 0, 0])
+        total[2] += total[0] * int(bid)
+        total[0] += 1
+        total[1] += int(bid)
+
+    winnings = []
+
+    for convert in (convert_hand_to_hand_type, convert_wildcard_hand_to_hand_type):
+        rank, part_winnings = 1, 0
+
+        # The copies of a hand take the ranks from rank onwards
+        for hand in sorted(totals, key=convert):
+            count, bid_total, weighted_total = totals[hand]
+            part_winnings += rank * bid_total + weighted_total
+            rank += count
+
+        winnings.append(part_winnings)
+
+    return winnings[0], winnings[1]
+
+
 if __name__ == "__main__":
-    # Main execution block.
-    lines = list(helpers.generate_lines("2023/data/day_07.txt"))
+    # Main execution block, reading the lines as they come.
+    winnings, wildcard_winnings = stream(helpers.generate_lines("2023/data/day_07.txt"))
 
     # Calculate and print winnings for both regular and wildcard versions.
-    print(calculate_winnings(lines, False))
-    print(calculate_winnings(lines, True))
+    print(winnings)
+    print(wildcard_winnings)
@@ -18,19 +18,24 @@ https://adventofcode.com/2023/day/8
 Functions:
 - scan_map(lines): Parses input lines into navigation instructions and node
   connections.
-- follow_directions_single(instructions, directions, start_location, condition):
-  Follows instructions from a single node until a specified condition is met.
-- follow_directions_multiple(instructions, directions): Determines the required
-  steps to reach destination nodes from multiple starting nodes simultaneously.
+- follow_directions_single(instructions, directions, start_location, condition,
+  deadline): Follows instructions from a single node until a specified condition
+  is met, giving up at an optional deadline.
+- follow_directions_multiple(instructions, directions, deadline): Determines the
+  required steps to reach destination nodes from multiple starting nodes
+  simultaneously.
+- parse(lines): Parses the input into the model shared by both parts.
+- part_1(model): Counts the steps from "AAA" to "ZZZ".
+- part_2(model): Counts the steps for all starting nodes simultaneously.
 """
-from typing import Callable, Dict, Iterable, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import math
 
 import helpers
 
 
-# Constant defining the length of a location identifier in the map
-LOCATION_LENGTH = 3
+# Layout of a node connection line, compiled once on import
+NODE_LAYOUT = helpers.compile_layout("{id} = ({id}, {id})")
 
 
 def scan_map(lines: Iterable[str]) -> Tuple[str, Dict[str, Tuple[str, str]]]:
@@ -66,27 +71,7 @@ def scan_map(lines: Iterable[str]) -> Tuple[str, Dict[str, Tuple[str, str]]]:
 
             case 1:
                 # Second section: Parse node connections
-                line_index = 0
-                key = line[:LOCATION_LENGTH]  # Extract the node name
-                line_index += LOCATION_LENGTH
-
-                # Parsing the line to identify connected nodes
-                line_index = helpers.parse_whitespace(line, line_index)
-                line_index = helpers.expect(line, line_index, "=")
-                line_index = helpers.parse_whitespace(line, line_index)
-                line_index = helpers.expect(line, line_index, "(")
-
-                # Extract left node
-                left = line[line_index : line_index + LOCATION_LENGTH]
-                line_index += LOCATION_LENGTH
-                line_index = helpers.parse_whitespace(line, line_index)
-                line_index = helpers.expect(line, line_index, ",")
-                line_index = helpers.parse_whitespace(line, line_index)
-
-                # Extract right node
-                right = line[line_index : line_index + LOCATION_LENGTH]
-                line_index += LOCATION_LENGTH
-                line_index = helpers.expect(line, line_index, ")")
+                key, left, right = NODE_LAYOUT.parse(line)
 
                 # Store connections in directions dictionary
                 directions[key] = (left, right)
@@ -99,10 +84,12 @@ def follow_directions_single(
     directions: Dict[str, Tuple[str, str]],
     start_location: str,
     condition: Callable[[str], bool],
+    deadline: Optional[float] = None,
 ) -> int:
     """
     Follows the instructions starting from a single node until a given condition
-    is met.
+    is met. A walk that never meets the condition runs forever, so the walk
+    gives up with the steps taken so far once the deadline has passed.
 
     Args:
         instructions (str): String of navigation instructions (e.g., "LRLL").
@@ -110,14 +97,27 @@ def follow_directions_single(
         start_location (str): The starting node.
         condition (Callable[[str], bool]): A function that returns True if the
         navigation should continue.
+        deadline (Optional[float]): The time.perf_counter() value after which
+        to give up, or None to walk until the condition is met.
 
     Returns:
         int: Number of steps taken to meet the condition.
+
+    Raises:
+        TimeoutError: If the deadline passes, holding the progress made.
     """
     current_location = start_location
     step_counter = 0
 
     while condition(current_location):
+        if deadline is not None and step_counter % helpers.DEADLINE_INTERVAL == 0:
+            helpers.check_deadline(
+                deadline,
+                start_location=start_location,
+                location=current_location,
+                steps=step_counter,
+            )
+
         # Repeat instructions cyclically
         next_direction = instructions[step_counter % len(instructions)]
 
@@ -133,7 +133,9 @@ def follow_directions_single(
 
 
 def follow_directions_multiple(
-    instructions: str, directions: Dict[str, Tuple[str, str]]
+    instructions: str,
+    directions: Dict[str, Tuple[str, str]],
+    deadline: Optional[float] = None,
 ) -> int:
     """
     Follows instructions from all nodes ending with 'A' until they reach nodes
@@ -142,6 +144,8 @@ def follow_directions_multiple(
     Args:
         instructions (str): String of navigation instructions.
         directions (Dict[str, Tuple[str, str]]): Dictionary of node connections.
+        deadline (Optional[float]): The time.perf_counter() value after which
+        to give up, or None to walk until every destination is reached.
 
     Returns:
         int: The least common multiple of steps taken from all starting nodes to
@@ -153,7 +157,7 @@ def follow_directions_multiple(
     # Calculate the number of steps for each start location
     step_counters = [
         follow_directions_single(
-            instructions, directions, location, lambda x: x[2] != "Z"
+            instructions, directions, location, lambda x: x[2] != "Z", deadline
         )
         for location in start_locations
     ]
@@ -162,6 +166,61 @@ def follow_directions_multiple(
     return math.lcm(*step_counters)
 
 
+def parse(lines: List[str]) -> Tuple[str, Dict[str, Tuple[str, str]]]:
+    """
+    Parses the map into the model shared by both parts.
+
+    Args:
+        lines (List[str]): The lines of the input map.
+
+    Returns:
+        Tuple[str, Dict[str, Tuple[str, str]]]: The instructions and the node
+        connections.
+    """
+    return scan_map(lines)
+
+
+def part_1(
+    model: Tuple[str, Dict[str, Tuple[str, str]]], deadline: Optional[float] = None
+) -> int:
+    """
+    Solves part one: the number of steps from "AAA" to "ZZZ".
+
+    Args:
+        model (Tuple[str, Dict[str, Tuple[str, str]]]): The instructions and
+        the node connections.
+        deadline (Optional[float]): The time.perf_counter() value after which
+        to give up.
+
+    Returns:
+        int: The number of steps.
+    """
+    instructions, directions = model
+    return follow_directions_single(
+        instructions, directions, "AAA", lambda x: x != "ZZZ", deadline
+    )
+
+
+def part_2(
+    model: Tuple[str, Dict[str, Tuple[str, str]]], deadline: Optional[float] = None
+) -> int:
+    """
+    Solves part two: the number of steps until every node ending with 'A'
+    reaches a node ending with 'Z'.
+
+    Args:
+        model (Tuple[str, Dict[str, Tuple[str, str]]]): The instructions and
+        the node connections.
+        deadline (Optional[float]): The time.perf_counter() value after which
+        to give up.
+
+    Returns:
+        int: The number of steps.
+    """
+    instructions, directions = model
+    return follow_directions_multiple(instructions, directions, deadline)
+
+
 if __name__ == "__main__":
     # Main execution block
     lines = list(helpers.generate_lines("2023/data/day_08.txt"))  # Read input file
@@ -24,14 +24,31 @@ https://adventofcode.com/2023/day/9
 Functions:
 - scan_values(lines): Parses input lines and converts them into lists of
   integers.
+- scan_buffer(data): Parses a whole input buffer in one pass and yields the
+  integers of each line.
 - create_steps(values): Creates sequences of differences between consecutive
   numbers in a list.
 - extrapolate_next_value(values): Calculates the next and prior values in a
   sequence based on extrapolation.
-
+- create_weights(count): Computes the weights extrapolating a history of a given
+  length in closed form.
+- extrapolate_closed(values): Calculates the next and prior values as weighted
+  sums of the values.
+- parse(lines): Parses the input into the histories shared by both parts.
+- encode_columns(lines): Encodes the histories as columns of values and
+  offsets.
+- decode_columns(columns): Builds the histories from their columns.
+- part_1(histories): Sums the extrapolated next values.
+- part_2(histories): Sums the extrapolated prior values.
+- part_1_closed(histories), part_2_closed(histories): Sums the extrapolated
+  values computed in closed form.
+- stream(lines): Sums the extrapolated values of each history as it is read.
 """
 
-from typing import Generator, Iterable, List, Sequence, Tuple
+from typing import Dict, Generator, Iterable, List, Mapping, Sequence, Tuple, Union
+import array
+import functools
+import math
 
 import helpers
 
@@ -41,8 +58,8 @@ def scan_values(lines: Iterable[str]) -> Generator[List[int], None, None]:
     Scans each line of input data and extracts numerical values.
 
     This function iterates through each line of input, parsing and converting
-    the space-separated numerical values into a list of integers. It uses helper
-    functions for parsing.
+    the space-separated numerical values into a list of integers. It uses the
+    bulk integer parser from helpers on each line.
 
     Args:
         lines (Iterable[str]): An iterable (e.g., list or generator) of strings
@@ -53,26 +70,34 @@ def scan_values(lines: Iterable[str]) -> Generator[List[int], None, None]:
         integers for each line.
     """
     for line in lines:
-        # Initialize line index to start parsing from the beginning of the line
-        line_index = 0
+        # Parse every value on the line at once
+        values, _ = helpers.parse_ints(line)
 
-        # List to store the parsed integers from the line
-        values = []
+        # Yield the list of values for the current line
+        yield values.tolist()
 
-        # Loop to parse the entire line
-        while line_index != len(line):
-            # Skip whitespace except at the beginning of the line
-            if line_index != 0:
-                line_index = helpers.parse_whitespace(line, line_index)
 
-            # Parse digits and update line index
-            value, line_index = helpers.parse_digits(line, line_index)
+def scan_buffer(
+    data: Union[str, bytes, memoryview],
+) -> Generator[Sequence[int], None, None]:
+    """
+    Scans a whole input buffer and extracts the numerical values of each line.
 
-            # Convert parsed value to int and add to list
-            values.append(int(value))
+    All values are parsed in a single pass over the buffer, and each line is
+    then yielded as a slice of the resulting array.
 
-        # Yield the list of values for the current line
-        yield values
+    Args:
+        data (Union[str, bytes, memoryview]): The whole input, such as a
+        memory-mapped file from helpers.map_file.
+
+    Yields:
+        Generator[Sequence[int], None, None]: A generator yielding the integers
+        of each line.
+    """
+    values, offsets = helpers.parse_ints(data)
+
+    for i in range(len(offsets) - 1):
+        yield values[offsets[i] : offsets[i + 1]]
 
 
 def create_steps(values: Sequence[int]) -> List[Sequence[int]]:
@@ -170,19 +195,176 @@ def extrapolate_next_value(values: Sequence[int]) -> Tuple[int, int]:
     return next_value, prior_starts[-1]
 
 
-if __name__ == "__main__":
-    # Read the input file and store the lines in a list
-    lines = list(helpers.generate_lines("2023/data/day_09.txt"))
+@functools.lru_cache(maxsize=None)
+def create_weights(count: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Computes the weights that extrapolate a history of a given length.
+
+    Taking differences until they are all zero and summing them back up is the
+    same as extending the polynomial of lowest degree through the values. The
+    next value is then the sum of (-1)^(n-1-k) * C(n, k) * values[k], and the
+    prior value the sum of (-1)^k * C(n, k+1) * values[k].
+
+    Args:
+        count (int): The number of values in the history.
+
+    Returns:
+        Tuple[Tuple[int, ...], Tuple[int, ...]]: The weights of the values for
+        the next value, and for the prior value.
+    """
+    next_weights = tuple(
+        (-1) ** (count - 1 - k) * math.comb(count, k) for k in range(count)
+    )
+    prior_weights = tuple((-1) ** k * math.comb(count, k + 1) for k in range(count))
+
+    return next_weights, prior_weights
+
+
+def extrapolate_closed(values: Sequence[int]) -> Tuple[int, int]:
+    """
+    Extrapolates the next value and the prior value as weighted sums of the
+    values, without building the sequences of differences.
+
+    Args:
+        values (Sequence[int]): The original sequence of integers.
+
+    Returns
+        Tuple[int, int]: The extrapolated next value and the extrapolated prior
+        value.
+    """
+    next_weights, prior_weights = create_weights(len(values))
+
+    return (
+        sum(map(int.__mul__, next_weights, values)),
+        sum(map(int.__mul__, prior_weights, values)),
+    )
+
+
+def parse(lines: List[str]) -> List[List[int]]:
+    """
+    Parses the histories into the model shared by both parts.
+
+    Args:
+        lines (List[str]): The lines of the input data.
+
+    Returns:
+        List[List[int]]: The values of each history.
+    """
+    return list(scan_values(lines))
+
+
+def encode_columns(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    """
+    Encodes the histories as the values of every history, one after the other,
+    and the offset where each history starts, as in helpers.parse_ints.
+
+    Args:
+        lines (List[str]): The lines of the input data.
+
+    Returns:
+        Dict[str, array.array[int]]: The values and offsets columns.
+    """
+    values, offsets = helpers.parse_ints("\n".join(lines))
+    return {"values": values, "offsets": offsets}
+
+
+def decode_columns(columns: Mapping[str, memoryview]) -> List[Sequence[int]]:
+    """
+    Builds the histories from their columns. Each history is a slice of the
+    values column, so no value is copied.
+
+    Args:
+        columns (Mapping[str, memoryview]): The values and offsets columns.
 
-    # Initialize variables for total next and prior values
+    Returns:
+        List[Sequence[int]]: The values of each history.
+    """
+    values, offsets = columns["values"], columns["offsets"]
+    return [values[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def part_1(histories: List[List[int]]) -> int:
+    """
+    Solves part one: the sum of the extrapolated next values.
+
+    Args:
+        histories (List[List[int]]): The values of each history.
+
+    Returns:
+        int: The sum of the extrapolated next values.
+    """
+    return sum(extrapolate_next_value(values)[0] for values in histories)
+
+
+def part_2(histories: List[List[int]]) -> int:
+    """
+    Solves part two: the sum of the extrapolated prior values.
+
+    Args:
+        histories (List[List[int]]): The values of each history.
+
+    Returns:
+        int: The sum of the extrapolated prior values.
+    """
+    return sum(extrapolate_next_value(values)[1] for values in histories)
+
+
+def part_1_closed(histories: List[List[int]]) -> int:
+    """
+    Solves part one with the values extrapolated in closed form.
+
+    Args:
+        histories (List[List[int]]): The values of each history.
+
+    Returns:
+        int: The sum of the extrapolated next values.
+    """
+    return sum(extrapolate_closed(values)[0] for values in histories)
+
+
+def part_2_closed(histories: List[List[int]]) -> int:
+    """
+    Solves part two with the values extrapolated in closed form.
+
+    Args:
+        histories (List[List[int]]): The values of each history.
+
+    Returns:
+        int: The sum of the extrapolated prior values.
+    """
+    return sum(extrapolate_closed(values)[1] for values in histories)
+
+
+# Alternative implementations of the parts, keyed by engine name
+ENGINES = {"closed": {1: part_1_closed, 2: part_2_closed}}
+
+
+def stream(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solves both parts in a single pass over the lines, extrapolating each
+    history in closed form as it is read. Only the values of the current line
+    are held, so memory stays constant however many histories there are.
+
+    Args:
+        lines (Iterable[str]): The lines of the input data.
+
+    Returns:
+        Tuple[int, int]: The sums of the extrapolated next and prior values.
+    """
     next_total, prior_total = 0, 0
 
-    # Process each line of values and sum up the extrapolated next and prior
-    # values
     for values in scan_values(lines):
-        next_item, prior_item = extrapolate_next_value(values)
+        next_item, prior_item = extrapolate_closed(values)
         next_total += next_item
         prior_total += prior_item
 
+    return next_total, prior_total
+
+
+if __name__ == "__main__":
+    # Process each line of values as it is read, summing up the extrapolated
+    # next and prior values
+    next_total, prior_total = stream(helpers.generate_lines("2023/data/day_09.txt"))
+
     print(next_total)
     print(prior_total)
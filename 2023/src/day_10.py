@@ -35,12 +35,27 @@ Functions:
   the start.
 - get_islands: Identifies and groups tiles within the loop's boundaries.
 - count_tiles: Counts the number of tiles enclosed within the loop.
+- get_islands_flat: Identifies the islands off the loop of a flat grid by
+  flood fill.
+- count_tiles_flat: Counts the tiles of the islands enclosed by the loop.
+- create_connections: Maps each pipe to the offsets of the cells it joins.
+- trace_loop: Follows the loop through a grid, marking the cells on it.
+- parse: Parses the input into the grid shared by both parts.
+- encode_columns: Encodes the grid as the cells of a flat grid.
+- decode_columns: Builds the flat grid over its loaded cells.
+- part_1: Finds the number of steps to the farthest point of the loop.
+- part_2: Counts the tiles enclosed by the loop.
+- part_1_grid, part_2_grid: Solve the parts on a flat grid of bytes.
+- part_2_flood: Solves part two with the islands found by flood fill.
 """
 
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
+import array
 import collections
 import enum
 
+import columnar
+import grid
 import helpers
 
 
@@ -92,6 +107,10 @@ REDIRECTION = {
     "F": init_redirection(None, Direction.EAST, Direction.SOUTH, None),
 }
 
+# Pipes joining their tile to the one north of it, which a row crosses when
+# going in or out of the loop
+NORTH_PIPES = b"|LJ"
+
 
 def find_start_location(lines: List[str]) -> Optional[Tuple[int, int]]:
     """
@@ -455,6 +474,277 @@ def count_tiles(
     return tiles
 
 
+def create_connections(pipes: grid.Grid) -> Dict[int, Tuple[int, int]]:
+    """
+    Maps each pipe to the offsets, in a grid, of the two cells it joins.
+
+    Args:
+        pipes (grid.Grid): The grid of pipes.
+
+    Returns:
+        Dict[int, Tuple[int, int]]: The offsets joined by each pipe character.
+    """
+    north, south, east, west = pipes.offsets_4
+
+    return {
+        ord("|"): (north, south),
+        ord("-"): (east, west),
+        ord("L"): (north, east),
+        ord("J"): (north, west),
+        ord("7"): (south, west),
+        ord("F"): (south, east),
+    }
+
+
+def trace_loop(pipes: grid.Grid) -> Tuple[int, bytearray, bytearray]:
+    """
+    Follows the loop from the start around the grid, taking the start for the
+    pipe joining its two neighbours on the loop. The grid is not changed, so it
+    may be a read-only view.
+
+    Args:
+        pipes (grid.Grid): The grid of pipes.
+
+    Returns:
+        Tuple[int, bytearray, bytearray]: The length of the loop, a flag for
+        each cell of the grid set on the cells of the loop, and a flag set on
+        the cells of the loop whose pipe joins the cell north of it.
+    """
+    connections = create_connections(pipes)
+    start = next(pipes.locate(ord("S")), -1)
+
+    if start == -1:
+        raise ValueError("Start location not found in the grid.")
+
+    # The start joins the neighbours whose pipes lead back to it
+    exits = tuple(
+        offset
+        for offset in pipes.offsets_4
+        if -offset in connections.get(pipes.cells[start + offset], ())
+    )
+    shapes = [
+        pipe for pipe, offsets in connections.items() if set(offsets) == set(exits)
+    ]
+
+    if len(shapes) != 1:
+        raise ValueError("The start should join exactly two pipes.")
+
+    on_loop = bytearray(len(pipes.cells))
+    crossings = bytearray(len(pipes.cells))
+    on_loop[start], crossings[start] = 1, shapes[0] in NORTH_PIPES
+
+    previous, current = start, start + exits[0]
+    length = 1
+
+    while current != start:
+        pipe = pipes.cells[current]
+        on_loop[current], crossings[current] = 1, pipe in NORTH_PIPES
+
+        first, second = connections[pipe]
+        step = first if current + first != previous else second
+        previous, current = current, current + step
+        length += 1
+
+    return length, on_loop, crossings
+
+
+def get_islands_flat(
+    pipes: grid.Grid, on_loop: bytearray, with_labels: bool = False
+) -> grid.Components:
+    """
+    Identifies the islands of tiles off the loop like get_islands, with the
+    flood fill of the grid module on flat indices. Islands are numbered in the
+    same order, and each is described by its size and first tile rather than
+    the list of its tiles.
+
+    Args:
+        pipes (grid.Grid): The grid of pipes.
+        on_loop (bytearray): A flag for each cell set on the loop, as returned
+        by trace_loop.
+        with_labels (bool): Whether to also label each tile with its island.
+
+    Returns:
+        grid.Components: The islands.
+    """
+    islands: grid.Components = grid.find_components(pipes, on_loop, with_labels)
+    return islands
+
+
+def count_tiles_flat(
+    pipes: grid.Grid, crossings: bytearray, islands: grid.Components
+) -> int:
+    """
+    Counts the tiles enclosed by the loop like count_tiles, from the islands
+    found by get_islands_flat. An island is enclosed when its row crosses the
+    loop an odd number of times before its first tile.
+
+    Args:
+        pipes (grid.Grid): The grid of pipes.
+        crossings (bytearray): A flag for each cell set on the pipes of the
+        loop joining the cell north of them, as returned by trace_loop.
+        islands (grid.Components): The islands off the loop.
+
+    Returns:
+        int: The total number of tiles enclosed by the loop.
+    """
+    tiles = 0
+    previous, count = 0, 0
+
+    # The islands come in row-major order, so the crossings before each island
+    # are counted on from the island before it in the same row
+    for seed, island_size in zip(islands.seeds, islands.sizes):
+        start = seed - seed % pipes.stride
+
+        if start > previous:
+            previous, count = start, 0
+
+        count += crossings.count(1, previous, seed)
+        previous = seed
+
+        if count % 2 == 1:
+            tiles += island_size
+
+    return tiles
+
+
+def parse(lines: List[str]) -> grid.Grid:
+    """
+    Parses the grid of pipes into a flat grid.
+
+    Args:
+        lines (List[str]): The grid of pipes as a list of strings.
+
+    Returns:
+        grid.Grid: The flat grid of pipes.
+    """
+    return grid.Grid.from_lines(lines)
+
+
+def encode_columns(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    """
+    Encodes the grid of pipes as the cells of a flat grid for the columnar
+    format.
+
+    Args:
+        lines (List[str]): The grid of pipes as a list of strings.
+
+    Returns:
+        Dict[str, array.array[int]]: The cells and shape columns.
+    """
+    columns: Dict[str, "array.array[int]"] = columnar.encode_grid(lines)
+    return columns
+
+
+def decode_columns(columns: Mapping[str, memoryview]) -> grid.Grid:
+    """
+    Builds the flat grid of pipes over its loaded cells, without copying them.
+
+    Args:
+        columns (Mapping[str, memoryview]): The cells and shape columns.
+
+    Returns:
+        grid.Grid: The flat grid of pipes.
+    """
+    return columnar.decode_grid(columns)
+
+
+def part_1(pipes: grid.Grid) -> int:
+    """
+    Solves part one: the number of steps to the farthest point of the loop.
+
+    Args:
+        pipes (grid.Grid): The flat grid of pipes.
+
+    Returns:
+        int: The number of steps to the farthest point.
+    """
+    solution, _ = solve_loop(pipes.to_lines())
+    return solution
+
+
+def part_2(pipes: grid.Grid) -> int:
+    """
+    Solves part two: the number of tiles enclosed by the loop.
+
+    Args:
+        pipes (grid.Grid): The flat grid of pipes.
+
+    Returns:
+        int: The number of enclosed tiles.
+    """
+    lines = pipes.to_lines()
+    _, boundary = solve_loop(lines)
+    islands = get_islands(lines, boundary)
+    return count_tiles(lines, islands, boundary)
+
+
+def part_1_grid(pipes: grid.Grid) -> int:
+    """
+    Solves part one by tracing the loop through the flat grid.
+
+    Args:
+        pipes (grid.Grid): The flat grid of pipes.
+
+    Returns:
+        int: The number of steps to the farthest point.
+    """
+    length, _, _ = trace_loop(pipes)
+    return length // 2
+
+
+def part_2_grid(pipes: grid.Grid) -> int:
+    """
+    Solves part two by scanning each row of the flat grid. A tile off the loop
+    is enclosed when the row crosses the loop an odd number of times before it,
+    counting the pipes joining the tile north of them.
+
+    Args:
+        pipes (grid.Grid): The flat grid of pipes.
+
+    Returns:
+        int: The number of enclosed tiles.
+    """
+    _, on_loop, crossings = trace_loop(pipes)
+    tiles = 0
+
+    for row in range(pipes.rows):
+        start = pipes.index(row, 0)
+        inside = False
+
+        for index in range(start, start + pipes.columns):
+            if on_loop[index]:
+                if crossings[index]:
+                    inside = not inside
+
+            elif inside:
+                tiles += 1
+
+    return tiles
+
+
+def part_2_flood(pipes: grid.Grid) -> int:
+    """
+    Solves part two like part_2, finding the islands by flood fill on the flat
+    grid rather than with sets of coordinates.
+
+    Args:
+        pipes (grid.Grid): The flat grid of pipes.
+
+    Returns:
+        int: The number of enclosed tiles.
+    """
+    _, on_loop, crossings = trace_loop(pipes)
+    islands = get_islands_flat(pipes, on_loop)
+    return count_tiles_flat(pipes, crossings, islands)
+
+
+# Alternative implementations of the parts, keyed by engine name
+ENGINES = {
+    "grid": {1: part_1_grid, 2: part_2_grid},
+    "flood": {2: part_2_flood},
+}
+
+
 if __name__ == "__main__":
     lines = list(helpers.generate_lines("2023/data/day_10.txt"))
 
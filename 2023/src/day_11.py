@@ -25,6 +25,8 @@ https://adventofcode.com/2023/day/11
 Functions:
 - scan_galaxies: Scans the input data to identify galaxy locations and non-empty
   rows and columns.
+- scan_galaxies_grid: Scans a flat grid of the image for galaxies, searching
+  for each galaxy rather than visiting every tile.
 - create_adjustments: Creates adjustment mappings for rows and columns based on
   cosmic expansion.
 - apply_adjustments: Applies the cosmic expansion adjustments to the galaxy
@@ -32,11 +34,28 @@ Functions:
 - calculate_distance: Calculates the Manhattan distance between two galaxy
   locations.
 - sum_distances: Calculates the sum of distances between every pair of galaxies.
+- parse: Parses the input into the model shared by both parts.
+- encode_columns: Encodes the image as the cells of a flat grid.
+- decode_columns: Scans the image from its cells.
+- solve_expansion: Sums the distances between galaxies for an expansion
+  factor.
+- sum_expansions: Sums the distances between galaxies before expansion, and the
+  empty rows and columns between them.
+- part_1: Sums the distances with an expansion factor of 2.
+- part_2: Sums the distances with an expansion factor of 1000000.
+- fused: Sums the distances for both expansion factors in a single pass.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Tuple
+import array
 
-import helpers
+import cache
+import columnar
+import grid
+
+
+# Version of the structure returned by scan_galaxies, bumped when it changes
+PARSER_VERSION = 1
 
 
 def scan_galaxies(
@@ -77,6 +96,39 @@ def scan_galaxies(
     return galaxies, non_empty_rows, non_empty_columns
 
 
+def scan_galaxies_grid(
+    image: grid.Grid,
+) -> Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]:
+    """
+    Scans a flat grid of the image for galaxies, with the same result as
+    scan_galaxies. Each galaxy is found by searching the cells from the previous
+    one, so empty space is skipped without visiting each tile in Python.
+
+    Args:
+        image (grid.Grid): The image, where '.' is empty space and '#' is a
+        galaxy.
+
+    Returns:
+        Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]: A tuple
+        containing a dictionary of galaxy locations indexed by galaxy number,
+        and two lists indicating non-empty rows and columns.
+    """
+    non_empty_rows = [False for _ in range(image.rows)]
+    non_empty_columns = [False for _ in range(image.columns)]
+    galaxies = {}
+
+    # Cells are searched row after row, so galaxies are numbered as they are
+    # by scan_galaxies
+    for galaxy_count, index in enumerate(image.locate(ord("#"))):
+        i, j = image.position(index)
+        galaxies[galaxy_count] = (i, j)
+
+        non_empty_rows[i] = True
+        non_empty_columns[j] = True
+
+    return galaxies, non_empty_rows, non_empty_columns
+
+
 def create_adjustments(
     non_empty_rows: List[bool], non_empty_columns: List[bool], factor: int = 2
 ) -> Tuple[Dict[int, int], Dict[int, int]]:
@@ -185,21 +237,174 @@ def sum_distances(galaxies: Dict[int, Tuple[int, int]]) -> int:
     return total_distance
 
 
-if __name__ == "__main__":
-    lines = list(helpers.generate_lines("2023/data/day_11.txt"))
+def parse(
+    lines: List[str],
+) -> Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]:
+    """
+    Parses the image into the model shared by both parts, scanning it as a
+    flat grid. Unlike scan_galaxies, which accepts lines shorter than the
+    first, the lines must all have the same length.
 
-    galaxies, non_empty_rows, non_empty_columns = scan_galaxies(lines)
+    Args:
+        lines (List[str]): The lines of the image.
+
+    Returns:
+        Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]: The galaxy
+        locations and the non-empty rows and columns.
+
+    Raises:
+        ValueError: If the lines do not all have the same length.
+    """
+    return scan_galaxies_grid(grid.Grid.from_lines(lines))
+
+
+def encode_columns(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    """
+    Encodes the image as the cells of a flat grid for the columnar format.
+
+    Args:
+        lines (List[str]): The lines of the image.
+
+    Returns:
+        Dict[str, array.array[int]]: The cells and shape columns.
+    """
+    columns: Dict[str, "array.array[int]"] = columnar.encode_grid(lines)
+    return columns
+
+
+def decode_columns(
+    columns: Mapping[str, memoryview],
+) -> Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]:
+    """
+    Scans the image into the model shared by both parts, from a flat grid over
+    the loaded cells rather than a copy of them.
+
+    Args:
+        columns (Mapping[str, memoryview]): The cells and shape columns.
+
+    Returns:
+        Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]: The galaxy
+        locations and the non-empty rows and columns.
+    """
+    return scan_galaxies_grid(columnar.decode_grid(columns))
+
+
+def solve_expansion(
+    model: Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]], factor: int
+) -> int:
+    """
+    Calculates the sum of distances between galaxies for an expansion factor.
+
+    Args:
+        model (Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]): The
+        galaxy locations and the non-empty rows and columns.
+        factor (int): The expansion factor for empty rows and columns.
+
+    Returns:
+        int: The sum of distances between every pair of galaxies.
+    """
+    galaxies, non_empty_rows, non_empty_columns = model
 
     row_adjustments, column_adjustments = create_adjustments(
-        non_empty_rows, non_empty_columns
+        non_empty_rows, non_empty_columns, factor
     )
 
-    galaxies_1 = apply_adjustments(galaxies.copy(), row_adjustments, column_adjustments)
-    print(sum_distances(galaxies_1))
+    # Adjust a copy, since the parsed galaxies are shared by both parts
+    adjusted = apply_adjustments(galaxies.copy(), row_adjustments, column_adjustments)
+    return sum_distances(adjusted)
+
+
+def sum_expansions(
+    model: Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]],
+) -> Tuple[int, int]:
+    """
+    Sums the distances between every pair of galaxies before expansion, and the
+    number of empty rows and columns crossed by each of those distances. Every
+    crossed row or column adds factor - 1 to a distance, so the sum for any
+    expansion factor follows from these two totals.
+
+    Args:
+        model (Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]): The
+        galaxy locations and the non-empty rows and columns.
 
+    Returns:
+        Tuple[int, int]: The sum of distances before expansion, and the sum of
+        empty rows and columns crossed.
+    """
+    galaxies, non_empty_rows, non_empty_columns = model
+
+    # With a factor of 2, each adjustment counts the empty lines before it
     row_adjustments, column_adjustments = create_adjustments(
-        non_empty_rows, non_empty_columns, 1000000
+        non_empty_rows, non_empty_columns
     )
+    locations = [
+        (row, column, row_adjustments[row], column_adjustments[column])
+        for row, column in galaxies.values()
+    ]
+
+    total_distance, total_crossed = 0, 0
+
+    # Iterate over each pair of galaxies once for both totals.
+    for i, (row_1, column_1, empty_rows_1, empty_columns_1) in enumerate(locations):
+        for row_2, column_2, empty_rows_2, empty_columns_2 in locations[i + 1 :]:
+            total_distance += abs(row_2 - row_1) + abs(column_2 - column_1)
+            total_crossed += abs(empty_rows_2 - empty_rows_1) + abs(
+                empty_columns_2 - empty_columns_1
+            )
+
+    return total_distance, total_crossed
+
+
+def part_1(model: Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]) -> int:
+    """
+    Solves part one: the sum of distances with an expansion factor of 2.
+
+    Args:
+        model (Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]): The
+        galaxy locations and the non-empty rows and columns.
+
+    Returns:
+        int: The sum of distances between every pair of galaxies.
+    """
+    return solve_expansion(model, 2)
+
+
+def part_2(model: Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]) -> int:
+    """
+    Solves part two: the sum of distances with an expansion factor of 1000000.
+
+    Args:
+        model (Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]): The
+        galaxy locations and the non-empty rows and columns.
+
+    Returns:
+        int: The sum of distances between every pair of galaxies.
+    """
+    return solve_expansion(model, 1000000)
+
+
+def fused(
+    model: Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]],
+) -> Tuple[int, int]:
+    """
+    Solves both parts from a single pass over the pairs of galaxies. The sums
+    for both expansion factors follow from the sum of distances before
+    expansion and the number of empty rows and columns crossed.
+
+    Args:
+        model (Tuple[Dict[int, Tuple[int, int]], List[bool], List[bool]]): The
+        galaxy locations and the non-empty rows and columns.
+
+    Returns:
+        Tuple[int, int]: The sums of distances with expansion factors of 2 and
+        1000000.
+    """
+    total_distance, total_crossed = sum_expansions(model)
+    return total_distance + total_crossed, total_distance + 999999 * total_crossed
+
+
+if __name__ == "__main__":
+    model = cache.load_or_parse("2023/data/day_11.txt", scan_galaxies, PARSER_VERSION)
 
-    galaxies_2 = apply_adjustments(galaxies.copy(), row_adjustments, column_adjustments)
-    print(sum_distances(galaxies_2))
+    for answer in fused(model):
+        print(answer)
@@ -1,17 +1,21 @@
-from typing import List, Tuple
-import helpers
+from typing import Iterable, List, Tuple
 
+import cache
 
-def scan_conditions(lines: List[str]) -> List[Tuple[str, List[int]]]:
-    pairs = []
 
-    for line in lines:
-        condition, record = line.split(" ")
-        arrangement = [int(item) for item in record.split(",")]
+# Version of the structure returned by scan_conditions, bumped when it changes
+PARSER_VERSION = 1
+
 
-        pairs.append((condition, arrangement))
+def parse_condition(line: str) -> Tuple[str, List[int]]:
+    condition, record = line.split(" ")
+    arrangement = [int(item) for item in record.split(",")]
 
-    return pairs
+    return condition, arrangement
+
+
+def scan_conditions(lines: List[str]) -> List[Tuple[str, List[int]]]:
+    return [parse_condition(line) for line in lines]
 
 
 def generate_possibilities(initial_condition: str) -> List[str]:
@@ -77,8 +81,63 @@ def calculate_total(pairs: List[Tuple[str, List[int]]]) -> int:
     return total
 
 
-if __name__ == "__main__":
-    lines = helpers.generate_lines("2023/data/day_12.txt")
+# Counts the arrangements matching the groups by dynamic programming, where
+# counts[i][j] is the number of ways the springs from i onwards match the groups
+# from j onwards, instead of generating every possible condition
+def count_arrangements(condition: str, arrangement: List[int]) -> int:
+    length, group_count = len(condition), len(arrangement)
+
+    # Past the end, only having no groups left is a match. The extra row stands
+    # for the gap after a group ending at the last spring.
+    done = [0] * group_count + [1]
+    counts = [[0] * (group_count + 1) for _ in range(length)] + [done, done]
+
+    for i in range(length - 1, -1, -1):
+        for j in range(group_count + 1):
+            if condition[i] != "#":
+                counts[i][j] += counts[i + 1][j]
+
+            if condition[i] != "." and j < group_count:
+                end = i + arrangement[j]
+
+                if (
+                    end <= length
+                    and "." not in condition[i:end]
+                    and (end == length or condition[end] != "#")
+                ):
+                    counts[i][j] += counts[end + 1][j + 1]
+
+    return counts[0][0]
+
+
+def calculate_total_dp(pairs: List[Tuple[str, List[int]]]) -> int:
+    return sum(
+        count_arrangements(condition, arrangement) for condition, arrangement in pairs
+    )
 
-    pairs = scan_conditions(lines)
+
+def parse(lines: List[str]) -> List[Tuple[str, List[int]]]:
+    return scan_conditions(lines)
+
+
+def part_1(pairs: List[Tuple[str, List[int]]]) -> int:
+    return calculate_total(pairs)
+
+
+def part_1_dp(pairs: List[Tuple[str, List[int]]]) -> int:
+    return calculate_total_dp(pairs)
+
+
+# Alternative implementations of the parts, keyed by engine name
+ENGINES = {"dp": {1: part_1_dp}}
+
+
+# Counts the arrangements of each row as it is read, so that memory is bounded
+# by the longest row rather than growing with the number of rows
+def stream(lines: Iterable[str]) -> Tuple[int]:
+    return (sum(count_arrangements(*parse_condition(line)) for line in lines),)
+
+
+if __name__ == "__main__":
+    pairs = cache.load_or_parse("2023/data/day_12.txt", scan_conditions, PARSER_VERSION)
     print(calculate_total(pairs))
@@ -1,9 +1,17 @@
-from typing import Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+import array
 import dataclasses
 
 import helpers
 
 
+# Columns of a hailstone, one per coordinate of its position and velocity
+HAILSTONE_COLUMNS = ("px", "py", "pz", "vx", "vy", "vz")
+
+# Layout of a hailstone line, compiled once on import
+HAILSTONE_LAYOUT = helpers.compile_layout("{int}, {int}, {int} @ {int}, {int}, {int}")
+
+
 @dataclasses.dataclass(frozen=True)
 class Vector:
     x: int
@@ -18,55 +26,28 @@ class Hailstone:
 
 
 def parse_hailstone(line: str) -> Hailstone:
-    line_index = 0
-    item_counter = 0
-
-    items = []
+    items = HAILSTONE_LAYOUT.parse(line)
 
-    while line_index < len(line):
-        match item_counter:
-            # expect: digits comma space
-            case 0 | 1:
-                digits, line_index = helpers.parse_digits(line, line_index)
-                items.append(int(digits))
-                item_counter += 1
-
-                line_index = helpers.expect(line, line_index, ",")
-                line_index = helpers.expect(line, line_index, " ")
-
-            # expect: digits space at space
-            case 2:
-                digits, line_index = helpers.parse_digits(line, line_index)
-                items.append(int(digits))
-                item_counter += 1
-
-                line_index = helpers.expect(line, line_index, " ")
-                line_index = helpers.expect(line, line_index, "@")
-                line_index = helpers.expect(line, line_index, " ")
+    position = Vector(*items[:3])
+    velocity = Vector(*items[3:])
+    return Hailstone(position, velocity)
 
-            # expect: digits comma space
-            case 3 | 4:
-                digits, line_index = helpers.parse_digits(line, line_index)
-                items.append(int(digits))
-                item_counter += 1
 
-                line_index = helpers.expect(line, line_index, ",")
-                line_index = helpers.expect(line, line_index, " ")
+def parse_hailstones(data: Union[str, bytes, memoryview]) -> List[Hailstone]:
+    values, offsets = helpers.parse_ints(data)
+    hailstones = []
 
-            # expect: digits EOL
-            case 5:
-                digits, line_index = helpers.parse_digits(line, line_index)
-                items.append(int(digits))
+    for i in range(len(offsets) - 1):
+        start, end = offsets[i], offsets[i + 1]
 
-                if line_index != len(line):
-                    raise ValueError("Expected EOL after item 5.")
+        if end - start != 6:
+            raise ValueError("Expected exactly 6 items.")
 
-            case _:
-                raise ValueError("Expected exactly 6 items.")
+        position = Vector(values[start], values[start + 1], values[start + 2])
+        velocity = Vector(values[start + 3], values[start + 4], values[start + 5])
+        hailstones.append(Hailstone(position, velocity))
 
-    position = Vector(*items[:3])
-    velocity = Vector(*items[3:])
-    return Hailstone(position, velocity)
+    return hailstones
 
 
 def calculate_line_coefficients_2d(h: Hailstone) -> Tuple[float, float]:
@@ -98,13 +79,9 @@ def calculate_intersection_2d(
     return x, y
 
 
-if __name__ == "__main__":
-    lines = helpers.generate_lines("2023/data/day_04.txt")
-    hailstones = []
-
-    for line in lines:
-        hailstones.append(parse_hailstone(line))
-
+def count_intersections_2d(
+    hailstones: List[Hailstone], lower: float, upper: float
+) -> int:
     counter = 0
 
     for i, h_1 in enumerate(hailstones):
@@ -113,13 +90,44 @@ if __name__ == "__main__":
 
             if (
                 intersection is not None
-                and intersection[0] >= 200000000000000
-                and intersection[0] <= 400000000000000
-                and intersection[1] >= 200000000000000
-                and intersection[1] <= 400000000000000
+                and intersection[0] >= lower
+                and intersection[0] <= upper
+                and intersection[1] >= lower
+                and intersection[1] <= upper
                 and (intersection[0] - h_1.position.x) / h_1.velocity.x > 0
                 and (intersection[0] - h_2.position.x) / h_2.velocity.x > 0
             ):
                 counter += 1
 
-    print(counter)
+    return counter
+
+
+def parse(lines: List[str]) -> List[Hailstone]:
+    return [parse_hailstone(line) for line in lines]
+
+
+def encode_columns(lines: List[str]) -> Dict[str, "array.array[int]"]:
+    values, offsets = helpers.parse_ints("\n".join(lines))
+
+    if len(values) != 6 * (len(offsets) - 1):
+        raise ValueError("Expected exactly 6 items.")
+
+    return {name: values[i::6] for i, name in enumerate(HAILSTONE_COLUMNS)}
+
+
+def decode_columns(columns: Mapping[str, memoryview]) -> List[Hailstone]:
+    px, py, pz, vx, vy, vz = (columns[name] for name in HAILSTONE_COLUMNS)
+
+    return [
+        Hailstone(Vector(*position), Vector(*velocity))
+        for position, velocity in zip(zip(px, py, pz), zip(vx, vy, vz))
+    ]
+
+
+def part_1(hailstones: List[Hailstone]) -> int:
+    return count_intersections_2d(hailstones, 200000000000000, 400000000000000)
+
+
+if __name__ == "__main__":
+    hailstones = parse_hailstones(helpers.map_file("2023/data/day_24.txt"))
+    print(count_intersections_2d(hailstones, 200000000000000, 400000000000000))
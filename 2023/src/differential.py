@@ -0,0 +1,310 @@
+"""
+This module checks the fast engines of the 2023 days against the straightforward
+implementations of the same parts, which serve as reference oracles. Each check
+generates many small random inputs with the synthetic generators, solves every
+part the engine replaces with both implementations, and compares the answers.
+
+A mismatching input is shrunk to a minimal counterexample by repeatedly dropping
+lines, dropping numbers, making numbers smaller and dropping other characters,
+keeping each change that still makes the engine disagree with the reference.
+Changes that make the reference fail are discarded, since the input is then no
+longer valid.
+
+Usage:
+    python 2023/src/differential.py [DAY ...] [--trials N] [--seed N]
+
+Functions:
+- solve: Solves a part on some lines, capturing any error as the answer.
+- find_mismatch: Finds a part on which an engine disagrees with the reference.
+- create_candidates: Yields smaller variations of some lines.
+- shrink: Shrinks lines while they keep failing.
+- check_engine: Compares an engine with the reference on random inputs.
+- run_check: Runs one of the predefined checks.
+"""
+
+from typing import Any, Callable, Dict, Generator, List, Optional
+import argparse
+import contextlib
+import dataclasses
+import importlib
+import io
+import random
+import re
+import types
+
+import generators
+
+
+# Pattern matching a number, optionally negative
+NUMBER_PATTERN = re.compile(r"-?\d+")
+
+# Largest number of candidates tried while shrinking a single counterexample
+MAX_SHRINK_ATTEMPTS = 5000
+
+
+@dataclasses.dataclass
+class Check:
+    day: int
+    engine: str
+
+    # Draws the generator parameters of a trial, keeping inputs small enough for
+    # the reference to solve quickly
+    draw_parameters: Callable[[random.Random], Dict[str, Any]]
+
+
+@dataclasses.dataclass
+class Counterexample:
+    part: int
+    lines: List[str]
+    expected: Any
+    actual: Any
+
+
+# Engines checked against the reference, with the sizes of their trial inputs
+CHECKS = [
+    Check(
+        3,
+        "grid",
+        lambda rng: {
+            "size": rng.randint(1, 12),
+            "number_density": rng.random(),
+            "symbol_density": rng.random(),
+        },
+    ),
+    Check(
+        5,
+        "intervals",
+        lambda rng: {
+            "seed_pair_count": rng.randint(1, 4),
+            "range_count": rng.randint(1, 6),
+            "max_value": rng.randint(20, 1000),
+            "max_seed_range": rng.randint(1, 20),
+        },
+    ),
+    Check(
+        6,
+        "closed",
+        lambda rng: {"race_count": rng.randint(1, 2), "max_time": rng.randint(2, 99)},
+    ),
+    Check(
+        9,
+        "closed",
+        lambda rng: {
+            "history_count": rng.randint(1, 5),
+            "value_count": rng.randint(2, 12),
+            "max_degree": rng.randint(0, 10),
+        },
+    ),
+    Check(
+        10,
+        "grid",
+        lambda rng: {"size": rng.randint(3, 24), "fill": rng.uniform(0.1, 1)},
+    ),
+    Check(
+        10,
+        "flood",
+        lambda rng: {"size": rng.randint(3, 24), "fill": rng.uniform(0.1, 1)},
+    ),
+    Check(
+        12,
+        "dp",
+        lambda rng: {
+            "row_count": rng.randint(1, 5),
+            "row_length": rng.randint(1, 12),
+            "unknown_count": rng.randint(0, 8),
+        },
+    ),
+]
+
+
+# Solves a part from the lines, so that a crash counts as an answer that can
+# be compared like any other
+def solve(
+    module: types.ModuleType, function: Callable[[Any], Any], lines: List[str]
+) -> Any:
+    try:
+        return function(module.parse(lines))
+
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def find_mismatch(
+    module: types.ModuleType,
+    engine: Dict[int, Callable[[Any], Any]],
+    lines: List[str],
+) -> Optional[Counterexample]:
+    """
+    Solves each part the engine replaces with both the engine and the
+    reference. Inputs on which the reference fails are not valid inputs, so
+    they never count as a mismatch.
+
+    Args:
+        module (types.ModuleType): The day module holding the reference parts.
+        engine (Dict[int, Callable[[Any], Any]]): The parts of the engine.
+        lines (List[str]): The lines of the input.
+
+    Returns:
+        Optional[Counterexample]: The first part on which the answers differ, or
+        None if they agree.
+    """
+    for part, function in sorted(engine.items()):
+        try:
+            expected = getattr(module, f"part_{part}")(module.parse(lines))
+
+        except Exception:
+            return None
+
+        actual = solve(module, function, lines)
+
+        if actual != expected:
+            return Counterexample(part, lines, expected, actual)
+
+    return None
+
+
+def create_candidates(lines: List[str]) -> Generator[List[str], None, None]:
+    # Drop chunks of lines, from halves of the input down to single lines
+    size = len(lines) // 2
+
+    while size > 0:
+        for start in range(0, len(lines), size):
+            yield lines[:start] + lines[start + size :]
+
+        size //= 2
+
+    for i, line in enumerate(lines):
+        spans = [match.span() for match in NUMBER_PATTERN.finditer(line)]
+
+        # Drop each number, then bring each number closer to zero
+        for start, end in spans:
+            dropped = f"{line[:start].rstrip()} {line[end:].lstrip()}".strip()
+            yield lines[:i] + [dropped] + lines[i + 1 :]
+
+        for start, end in spans:
+            number = int(line[start:end])
+
+            for smaller in sorted({0, number // 2, number - (number > 0)}):
+                if abs(smaller) < abs(number):
+                    replaced = line[:start] + str(smaller) + line[end:]
+                    yield lines[:i] + [replaced] + lines[i + 1 :]
+
+        # Drop each other character, leaving the separators of numbers alone
+        for j, char in enumerate(line):
+            if not (char.isspace() or char.isdigit() or char == "-"):
+                yield lines[:i] + [line[:j] + line[j + 1 :]] + lines[i + 1 :]
+
+
+def shrink(lines: List[str], fails: Callable[[List[str]], bool]) -> List[str]:
+    """
+    Shrinks failing lines greedily, taking the first smaller variation that
+    still fails and starting over from it, until no variation fails.
+
+    Args:
+        lines (List[str]): The lines of a failing input.
+        fails (Callable[[List[str]], bool]): Whether some lines still fail.
+
+    Returns:
+        List[str]: The smallest failing lines found.
+    """
+    attempts = 0
+    shrunk = True
+
+    while shrunk and attempts < MAX_SHRINK_ATTEMPTS:
+        shrunk = False
+
+        for candidate in create_candidates(lines):
+            attempts += 1
+
+            if fails(candidate):
+                lines, shrunk = candidate, True
+                break
+
+            if attempts >= MAX_SHRINK_ATTEMPTS:
+                break
+
+    return lines
+
+
+def check_engine(
+    module: types.ModuleType,
+    engine: Dict[int, Callable[[Any], Any]],
+    generate: Callable[[random.Random], List[str]],
+    trials: int = 100,
+    seed: int = 0,
+) -> Optional[Counterexample]:
+    """
+    Compares an engine with the reference on random inputs, and shrinks the
+    first mismatching input to a minimal counterexample.
+
+    Args:
+        module (types.ModuleType): The day module holding the reference parts.
+        engine (Dict[int, Callable[[Any], Any]]): The parts of the engine.
+        generate (Callable[[random.Random], List[str]]): Generates the lines of
+        a random input.
+        trials (int): The number of random inputs.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Optional[Counterexample]: The shrunk counterexample, or None if the
+        engine agrees with the reference on every input.
+    """
+    rng = random.Random(seed)
+
+    for _ in range(trials):
+        lines = generate(rng)
+        mismatch = find_mismatch(module, engine, lines)
+
+        if mismatch is not None:
+            lines = shrink(
+                lines, lambda lines: find_mismatch(module, engine, lines) is not None
+            )
+            return find_mismatch(module, engine, lines)
+
+    return None
+
+
+def run_check(
+    check: Check, trials: int = 100, seed: int = 0
+) -> Optional[Counterexample]:
+    module = importlib.import_module(f"day_{check.day:02}")
+    generator, _, _ = generators.GENERATORS[check.day]
+
+    def generate(rng: random.Random) -> List[str]:
+        lines: List[str] = generator(rng, **check.draw_parameters(rng))
+        return lines
+
+    return check_engine(module, module.ENGINES[check.engine], generate, trials, seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check engines against references.")
+    parser.add_argument("days", type=int, nargs="*", help="days, defaults to all")
+    parser.add_argument("--trials", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = 0
+
+    for check in CHECKS:
+        if args.days and check.day not in args.days:
+            continue
+
+        # Some solvers print their progress, which is silenced as in aoc.runner
+        with contextlib.redirect_stdout(io.StringIO()):
+            counterexample = run_check(check, args.trials, args.seed)
+
+        if counterexample is None:
+            print(f"day {check.day:02} {check.engine}: {args.trials} trials agree")
+            continue
+
+        failures += 1
+        print(f"day {check.day:02} {check.engine}: part {counterexample.part} differs")
+        print(f"  expected {counterexample.expected!r}")
+        print(f"  actual   {counterexample.actual!r}")
+
+        for line in counterexample.lines:
+            print(f"  | {line}")
+
+    if failures > 0:
+        parser.exit(1)
@@ -0,0 +1,679 @@
+"""
+This module generates valid synthetic puzzle inputs for the 2023 days at any
+scale. The single puzzle-sized input of each day is too small to expose the
+quadratic and exponential paths of the solutions, so benchmarks sweep inputs
+generated here from 1x to 1000x the puzzle size.
+
+Every generator takes a seeded random.Random and its own size parameters, whose
+defaults match the size of the puzzle input, and returns the lines of the input.
+The inputs are built backwards from a known solution where the puzzle needs one,
+so that every generated input has an answer.
+
+Usage:
+    python 2023/src/generators.py DAY [--scale N] [--seed N] [--output FILE]
+
+Functions:
+- generate_calibration_document: Day 1 lines of letters, digits and digit words.
+- generate_games: Day 2 games of cubes drawn from a bag.
+- generate_schematic: Day 3 grid of part numbers and symbols.
+- generate_cards: Day 4 scratchcards with a bounded number of matches.
+- generate_almanac: Day 5 seeds and seven category maps.
+- generate_races: Day 6 race times and record distances.
+- generate_hands: Day 7 camel cards hands and bids.
+- generate_network: Day 8 instructions and a network of ghost cycles.
+- generate_histories: Day 9 polynomial histories.
+- generate_pipe_maze: Day 10 grid with a single loop of pipes.
+- generate_image: Day 11 image of galaxies with empty rows and columns.
+- generate_springs: Day 12 spring rows with a set number of unknowns.
+- generate_hailstones: Day 24 hailstones all hit by a single rock.
+- generate: Generates the input of a day at a scale relative to the puzzle size.
+"""
+
+from typing import Callable, Dict, List, Set, Tuple
+import argparse
+import inspect
+import math
+import random
+import string
+
+
+# Digits spelled out with letters, as recognised by day 1
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+# Symbols marking parts in the day 3 schematic
+SYMBOLS = "*#+$/=%@&-"
+
+# Cards of camel cards, from weakest to strongest
+CARDS = "23456789TJQKA"
+
+# Categories of the day 5 almanac, in the order they are mapped
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+# Pipe characters, used for tiles off the loop of day 10
+PIPES = "|-LJ7F"
+
+# Pipe characters keyed by the pair of directions they connect
+PIPE_BY_DIRECTIONS = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+
+
+def generate_calibration_document(
+    rng: random.Random, line_count: int = 1000, max_token_count: int = 12
+) -> List[str]:
+    lines = []
+
+    for _ in range(line_count):
+        tokens = []
+
+        for _ in range(rng.randint(1, max_token_count)):
+            match rng.randrange(3):
+                case 0:
+                    tokens.append(rng.choice(string.digits[1:]))
+
+                case 1:
+                    tokens.append(rng.choice(DIGIT_WORDS))
+
+                case _:
+                    tokens.append(
+                        "".join(
+                            rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))
+                        )
+                    )
+
+        # Every line needs at least one digit for part one
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(string.digits[1:]))
+        lines.append("".join(tokens))
+
+    return lines
+
+
+def generate_games(
+    rng: random.Random, game_count: int = 100, max_set_count: int = 6
+) -> List[str]:
+    lines = []
+
+    for i in range(game_count):
+        sets = []
+
+        for _ in range(rng.randint(1, max_set_count)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            sets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+
+        lines.append(f"Game {i + 1}: {'; '.join(sets)}")
+
+    return lines
+
+
+def generate_schematic(
+    rng: random.Random,
+    size: int = 140,
+    number_density: float = 0.12,
+    symbol_density: float = 0.1,
+) -> List[str]:
+    """
+    Generates a square engine schematic. Numbers are separated by at least one
+    other character and never touch the right edge, since day 3 joins digits at
+    the end of a line with those at the start of the next.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        size (int): The number of rows and columns.
+        number_density (float): The chance of a number starting at each free
+        position.
+        symbol_density (float): The chance of each remaining tile holding a
+        symbol.
+
+    Returns:
+        List[str]: The rows of the schematic.
+    """
+    rows = []
+
+    for _ in range(size):
+        row = ["."] * size
+        j = 0
+
+        while j < size - 1:
+            width = rng.randint(1, 3)
+
+            if j + width < size and rng.random() < number_density:
+                row[j : j + width] = str(rng.randint(10 ** (width - 1), 10**width - 1))
+                j += width
+
+            elif rng.random() < symbol_density:
+                row[j] = rng.choice(SYMBOLS)
+
+            j += 1
+
+        rows.append("".join(row))
+
+    return rows
+
+
+def generate_cards(
+    rng: random.Random,
+    card_count: int = 204,
+    winner_count: int = 10,
+    select_count: int = 25,
+    max_number: int = 99,
+) -> List[str]:
+    """
+    Generates scratchcards. The number of matches of each card is bounded by the
+    number of cards after it, so copies are never won past the end of the table.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        card_count (int): The number of cards.
+        winner_count (int): The number of winning numbers per card.
+        select_count (int): The number of numbers chosen per card.
+        max_number (int): The largest number on a card, at least the sum of the
+        two counts.
+
+    Returns:
+        List[str]: The lines of the cards.
+    """
+    id_width = len(str(card_count))
+    number_width = len(str(max_number))
+    lines = []
+
+    for i in range(card_count):
+        numbers = rng.sample(range(1, max_number + 1), winner_count + select_count)
+        winners, others = numbers[:winner_count], numbers[winner_count:]
+
+        # Skew towards few matches, as copies compound over later cards
+        match_count = min(
+            int(rng.expovariate(0.5)), winner_count, select_count, card_count - i - 1
+        )
+        selects = winners[:match_count] + others[: select_count - match_count]
+        rng.shuffle(selects)
+
+        lines.append(
+            f"Card {i + 1:>{id_width}}: "
+            + " ".join(f"{n:>{number_width}}" for n in winners)
+            + " | "
+            + " ".join(f"{n:>{number_width}}" for n in selects)
+        )
+
+    return lines
+
+
+def generate_almanac(
+    rng: random.Random,
+    seed_pair_count: int = 10,
+    range_count: int = 30,
+    max_value: int = 2**32,
+    max_seed_range: int = 10**8,
+) -> List[str]:
+    """
+    Generates an almanac. Each map shuffles contiguous segments of the values
+    above a random offset, leaving the values below the offset unmapped.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        seed_pair_count (int): The number of (start, length) seed pairs.
+        range_count (int): The number of ranges in each map.
+        max_value (int): The exclusive upper bound of every value.
+        max_seed_range (int): The largest length of a range of seeds.
+
+    Returns:
+        List[str]: The lines of the almanac.
+    """
+    seeds = []
+
+    for _ in range(seed_pair_count):
+        length = rng.randint(1, max_seed_range)
+        seeds += [rng.randrange(max_value - length), length]
+
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+
+    for source, target in zip(CATEGORIES, CATEGORIES[1:]):
+        offset = rng.randrange(max_value // 10)
+        cuts = sorted(rng.sample(range(offset + 1, max_value), range_count - 1))
+        bounds = [offset] + cuts + [max_value]
+        segments = list(zip(bounds, bounds[1:]))
+
+        # Lay the segments out again in shuffled order to get the targets
+        order = list(range(range_count))
+        rng.shuffle(order)
+        target_start = offset
+
+        lines += ["", f"{source}-to-{target} map:"]
+
+        for i in order:
+            start, end = segments[i]
+            lines.append(f"{target_start} {start} {end - start}")
+            target_start += end - start
+
+    return lines
+
+
+def generate_races(
+    rng: random.Random, race_count: int = 4, max_time: int = 100
+) -> List[str]:
+    """
+    Generates race times and record distances that can be beaten. Part two
+    concatenates the values, so its running time grows tenfold with every
+    digit added by more races.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        race_count (int): The number of races.
+        max_time (int): The longest race time.
+
+    Returns:
+        List[str]: The two lines of the race document.
+    """
+    times, distances = [], []
+
+    for _ in range(race_count):
+        time = rng.randint(2, max_time)
+        times.append(time)
+        distances.append(rng.randrange((time // 2) * (time - time // 2)))
+
+    width = max(len(str(value)) for value in times + distances) + 2
+    return [
+        "Time:    " + "".join(f"{value:>{width}}" for value in times),
+        "Distance:" + "".join(f"{value:>{width}}" for value in distances),
+    ]
+
+
+def generate_hands(
+    rng: random.Random, hand_count: int = 1000, max_bid: int = 1000
+) -> List[str]:
+    return [
+        f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, max_bid)}"
+        for _ in range(hand_count)
+    ]
+
+
+# Creates a node name from an index, ending with neither 'A' nor 'Z'
+def create_node_name(index: int, length: int) -> str:
+    index, last = divmod(index, 24)
+    name = string.ascii_uppercase[1 + last]
+
+    for _ in range(length - 1):
+        index, value = divmod(index, 26)
+        name = string.ascii_uppercase[value] + name
+
+    return name
+
+
+def generate_network(
+    rng: random.Random, instruction_length: int = 31, ghost_count: int = 6
+) -> List[str]:
+    """
+    Generates instructions and a network in which every start node leads into a
+    cycle whose only end node is reached after a whole number of passes over
+    the instructions. The cycle lengths are the instruction length times
+    distinct primes, so part two's answer is their least common multiple. The
+    first start and end nodes are "AAA" and "ZZZ" for part one.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        instruction_length (int): The number of left and right instructions.
+        ghost_count (int): The number of start nodes.
+
+    Returns:
+        List[str]: The instructions, a blank line and the node lines.
+    """
+    instructions = "".join(rng.choices("LR", k=instruction_length))
+    primes: List[int] = []
+    n = 2
+
+    while len(primes) < ghost_count:
+        if all(n % prime != 0 for prime in primes):
+            primes.append(n)
+
+        n += 1
+
+    cycle_lengths = [instruction_length * prime for prime in primes]
+
+    name_length = 3
+    while 24 * 26 ** (name_length - 1) < sum(cycle_lengths):
+        name_length += 1
+
+    names = iter(rng.sample(range(24 * 26 ** (name_length - 1)), sum(cycle_lengths)))
+    ends: Set[str] = {"ZZZ"}
+    nodes: Dict[str, Tuple[str, str]] = {}
+
+    for i, cycle_length in enumerate(cycle_lengths):
+        cycle = [
+            create_node_name(next(names), name_length) for _ in range(cycle_length)
+        ]
+
+        if i == 0:
+            start, cycle[-1] = "AAA", "ZZZ"
+
+        else:
+            prefix = create_node_name(i, name_length - 1)
+            start, cycle[-1] = prefix + "A", prefix + "Z"
+            ends.add(cycle[-1])
+
+        # Each node is left on the side given by the instruction followed there
+        for j, node in enumerate([start] + cycle):
+            following = cycle[j % cycle_length]
+            side = instructions[j % instruction_length]
+            nodes[node] = (following, "") if side == "L" else ("", following)
+
+    # Point the unused side of every node anywhere in the network
+    names_list = list(nodes)
+
+    for node, (left, right) in nodes.items():
+        nodes[node] = (left or rng.choice(names_list), right or rng.choice(names_list))
+
+    node_lines = [
+        f"{node} = ({left}, {right})" for node, (left, right) in nodes.items()
+    ]
+    rng.shuffle(node_lines)
+
+    return [instructions, ""] + node_lines
+
+
+def generate_histories(
+    rng: random.Random,
+    history_count: int = 200,
+    value_count: int = 21,
+    max_degree: int = 19,
+) -> List[str]:
+    """
+    Generates histories sampled from polynomials. The degree stays below the
+    number of values less one, so the differences always reach all zeros.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        history_count (int): The number of histories.
+        value_count (int): The number of values per history.
+        max_degree (int): The largest degree of a polynomial.
+
+    Returns:
+        List[str]: The lines of the histories.
+    """
+    lines = []
+
+    for _ in range(history_count):
+        degree = rng.randint(0, min(max_degree, value_count - 2))
+
+        # Coefficients in the binomial basis keep the values integral
+        coefficients = [rng.randint(-9, 9) for _ in range(degree + 1)]
+        values = [
+            sum(c * math.comb(x, k) for k, c in enumerate(coefficients))
+            for x in range(value_count)
+        ]
+        lines.append(" ".join(map(str, values)))
+
+    return lines
+
+
+def generate_pipe_maze(
+    rng: random.Random, size: int = 140, fill: float = 0.7
+) -> List[str]:
+    """
+    Generates a square grid holding a single loop of pipes. The loop is the
+    outline of a random tree of corridors two tiles wide, so it encloses tiles
+    along the corridors and leaves tiles between them outside. Tiles off the
+    loop hold random pipes, except next to the start, which is placed on an 'F'
+    corner as day 10 expects.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        size (int): The number of rows and columns, at least 3.
+        fill (float): The fraction of the grid spanned by the tree.
+
+    Returns:
+        List[str]: The rows of the grid.
+    """
+    height = width = max(1, (size + 1) // 4)
+
+    # Grow a random spanning tree over part of a coarse grid
+    start = (rng.randrange(height), rng.randrange(width))
+    tree = {start}
+    edges = []
+    frontier: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+
+    def add_frontier(cell: Tuple[int, int]) -> None:
+        for dy, dx in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            y, x = cell[0] + dy, cell[1] + dx
+
+            if 0 <= y < height and 0 <= x < width:
+                frontier.append((cell, (y, x)))
+
+    add_frontier(start)
+
+    while frontier and len(tree) < max(1, fill * height * width):
+        cell, neighbor = frontier.pop(rng.randrange(len(frontier)))
+
+        if neighbor not in tree:
+            tree.add(neighbor)
+            edges.append((cell, neighbor))
+            add_frontier(neighbor)
+
+    # Thicken the tree into a region of cells, each tree cell and edge becoming
+    # a 2x2 block, so that corridors are two cells wide
+    region = set()
+
+    for y, x in tree:
+        region.add((2 * y, 2 * x))
+
+    for (y_1, x_1), (y_2, x_2) in edges:
+        region.add((y_1 + y_2, x_1 + x_2))
+
+    cells = {
+        (2 * y + a, 2 * x + b) for y, x in region for a in range(2) for b in range(2)
+    }
+
+    # The outline of the region runs along the corners of its cells, and the
+    # corners become the tiles of the grid
+    grid = [[rng.choice(PIPES + ".") for _ in range(size)] for _ in range(size)]
+    corners = []
+
+    for y in range(4 * height - 1):
+        for x in range(4 * width - 1):
+            directions = ""
+
+            if ((y - 1, x - 1) in cells) != ((y - 1, x) in cells):
+                directions += "N"
+
+            if ((y, x - 1) in cells) != ((y, x) in cells):
+                directions += "S"
+
+            if ((y - 1, x) in cells) != ((y, x) in cells):
+                directions += "E"
+
+            if ((y - 1, x - 1) in cells) != ((y, x - 1) in cells):
+                directions += "W"
+
+            if directions:
+                grid[y][x] = PIPE_BY_DIRECTIONS[frozenset(directions)]
+
+                if grid[y][x] == "F":
+                    corners.append((y, x))
+
+    y, x = rng.choice(corners)
+    grid[y][x] = "S"
+
+    # The loop leaves the start to the south and east, so keep pipes off the
+    # loop to the north and west from leading into it
+    if y > 0 and grid[y - 1][x] in "|7F":
+        grid[y - 1][x] = "."
+
+    if x > 0 and grid[y][x - 1] in "-LF":
+        grid[y][x - 1] = "."
+
+    return ["".join(row) for row in grid]
+
+
+def generate_image(
+    rng: random.Random,
+    size: int = 140,
+    galaxy_density: float = 0.02,
+    empty_fraction: float = 0.05,
+) -> List[str]:
+    empty_rows = set(rng.sample(range(size), int(size * empty_fraction)))
+    empty_columns = set(rng.sample(range(size), int(size * empty_fraction)))
+
+    return [
+        "".join(
+            "#"
+            if i not in empty_rows
+            and j not in empty_columns
+            and rng.random() < galaxy_density
+            else "."
+            for j in range(size)
+        )
+        for i in range(size)
+    ]
+
+
+def generate_springs(
+    rng: random.Random,
+    row_count: int = 1000,
+    row_length: int = 20,
+    unknown_count: int = 10,
+) -> List[str]:
+    """
+    Generates rows of springs from a random arrangement, then hides the given
+    number of springs behind '?', so that every row has at least one valid
+    arrangement.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        row_count (int): The number of rows.
+        row_length (int): The number of springs per row.
+        unknown_count (int): The number of unknown springs per row.
+
+    Returns:
+        List[str]: The lines of the condition records.
+    """
+    lines = []
+
+    for _ in range(row_count):
+        row = [rng.choice("#.") for _ in range(row_length)]
+
+        # Every row has at least one group of damaged springs
+        row[rng.randrange(row_length)] = "#"
+
+        groups = [len(group) for group in "".join(row).split(".") if group]
+
+        for i in rng.sample(range(row_length), min(unknown_count, row_length)):
+            row[i] = "?"
+
+        lines.append(f"{''.join(row)} {','.join(map(str, groups))}")
+
+    return lines
+
+
+def generate_hailstones(rng: random.Random, hailstone_count: int = 300) -> List[str]:
+    """
+    Generates hailstones that a single rock thrown from an integer position at
+    an integer velocity hits at distinct integer times, as part two requires.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        hailstone_count (int): The number of hailstones.
+
+    Returns:
+        List[str]: The lines of the hailstones.
+    """
+    rock_position = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10**10, 2 * 10**11), hailstone_count)
+    lines = []
+
+    for time in times:
+        velocity = [rng.randint(-600, 600) for _ in range(3)]
+
+        # Day 24 divides by the x velocity, and parallel paths never meet
+        while velocity[0] == 0 or velocity == rock_velocity:
+            velocity = [rng.randint(-600, 600) for _ in range(3)]
+
+        position = [
+            p + time * (v_rock - v)
+            for p, v_rock, v in zip(rock_position, rock_velocity, velocity)
+        ]
+        lines.append(
+            f"{position[0]}, {position[1]}, {position[2]} @ "
+            f"{velocity[0]}, {velocity[1]}, {velocity[2]}"
+        )
+
+    return lines
+
+
+# Generators keyed by day, with the size parameter scaled for each and whether
+# it is the side of a square grid
+GENERATORS: Dict[int, Tuple[Callable[..., List[str]], str, bool]] = {
+    1: (generate_calibration_document, "line_count", False),
+    2: (generate_games, "game_count", False),
+    3: (generate_schematic, "size", True),
+    4: (generate_cards, "card_count", False),
+    5: (generate_almanac, "range_count", False),
+    6: (generate_races, "race_count", False),
+    7: (generate_hands, "hand_count", False),
+    8: (generate_network, "instruction_length", False),
+    9: (generate_histories, "history_count", False),
+    10: (generate_pipe_maze, "size", True),
+    11: (generate_image, "size", True),
+    12: (generate_springs, "row_count", False),
+    24: (generate_hailstones, "hailstone_count", False),
+}
+
+
+def generate(
+    day: int, scale: float = 1, seed: int = 0, **parameters: float
+) -> List[str]:
+    """
+    Generates the input of a day at a scale relative to the puzzle size. The
+    scale multiplies the size parameter of the day, or the area for grids.
+    Other parameters override the defaults of the generator.
+
+    Args:
+        day (int): The day of the puzzle.
+        scale (float): The size relative to the puzzle input.
+        seed (int): The seed of the random number generator.
+        **parameters (float): Parameters passed on to the generator.
+
+    Returns:
+        List[str]: The lines of the input.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}.")
+
+    generator, size_parameter, is_grid = GENERATORS[day]
+
+    if size_parameter not in parameters:
+        size = inspect.signature(generator).parameters[size_parameter].default
+        factor = math.sqrt(scale) if is_grid else scale
+        parameters[size_parameter] = max(1, round(size * factor))
+
+    return generator(random.Random(seed), **parameters)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic input.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write, defaults to stdout")
+    args = parser.parse_args()
+
+    text = "".join(line + "\n" for line in generate(args.day, args.scale, args.seed))
+
+    if args.output is None:
+        print(text, end="")
+
+    else:
+        with open(args.output, "w") as f:
+            f.write(text)
@@ -0,0 +1,247 @@
+"""
+This module provides a grid of single-byte cells shared by the grid days. The
+cells are stored row after row in one flat bytearray, surrounded by a border of
+sentinel cells, so that a cell is an index into the array and a neighbour is
+the index plus a fixed offset. Walks over the grid stop on the sentinel instead
+of checking bounds, and visited cells are marked in a bytearray of the same size
+rather than collected in a set of coordinate tuples. A grid may also adopt
+cells it did not allocate, such as a read-only view of a mapped columnar file,
+so that loading it copies nothing.
+
+Functions:
+- Grid.from_lines: Builds a grid from lines of equal length.
+- Grid.index: Returns the index of a cell from its row and column.
+- Grid.position: Returns the row and column of a cell from its index.
+- Grid.row: Returns a view of the cells of a row.
+- Grid.column: Returns a view of the cells of a column.
+- Grid.to_lines: Returns the rows of the grid as lines, without the border.
+- Grid.locate: Yields the index of every cell holding a value.
+- Grid.mark_border: Sets the border cells of a map of the grid.
+- Components: The connected components of the free cells of a grid.
+- flood_fill: Fills the component of a cell in a visited map.
+- find_components: Finds every component of the free cells of a grid.
+
+The flood fill works on flat indices alone. Visits are flags in a bytearray the
+size of the grid, and pending cells are kept in an array('i'). Each step fills
+a whole run of free cells along a row, finding the ends of the run and marking
+it with bytearray operations, so open areas cost a few operations per row
+rather than per cell, and a grid of 10^8 cells holds no Python object per cell.
+"""
+
+from typing import Generator, List, Optional, Tuple, Union
+import array
+import dataclasses
+import re
+
+
+class Grid:
+    """
+    A rectangular grid of byte cells with a one-cell sentinel border. Row r and
+    column c of the grid are at index (r + 1) * stride + c + 1 of the cells.
+
+    Attributes:
+        rows (int): The number of rows, without the border.
+        columns (int): The number of columns, without the border.
+        stride (int): The distance between vertically adjacent cells.
+        border (int): The value of the sentinel cells.
+        cells (Union[bytearray, memoryview]): The cells, row after row,
+        including the border. A view may be read-only.
+        offsets_4 (Tuple[int, ...]): The offsets of the north, south, east and
+        west neighbours of a cell.
+        offsets_8 (Tuple[int, ...]): The offsets of the eight neighbours of a
+        cell, orthogonal ones first.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        columns: int,
+        border: int = ord("."),
+        cells: Optional[Union[bytearray, memoryview]] = None,
+    ) -> None:
+        self.rows = rows
+        self.columns = columns
+        self.stride = columns + 2
+        self.border = border
+
+        size = self.stride * (rows + 2)
+        self.cells: Union[bytearray, memoryview] = (
+            bytearray([border]) * size if cells is None else cells
+        )
+
+        if len(self.cells) != size:
+            raise ValueError("The cells do not match the shape of the grid.")
+
+        north, south, east, west = -self.stride, self.stride, 1, -1
+        self.offsets_4 = (north, south, east, west)
+        self.offsets_8 = self.offsets_4 + (
+            north + east,
+            north + west,
+            south + east,
+            south + west,
+        )
+
+    @classmethod
+    def from_lines(cls, lines: List[str], border: int = ord(".")) -> "Grid":
+        columns = len(lines[0]) if lines else 0
+
+        if any(len(line) != columns for line in lines):
+            raise ValueError("The rows of a grid must have the same length.")
+
+        grid = cls(len(lines), columns, border)
+        edge = bytes([border])
+
+        # Rows are joined by the border cells closing one row and opening the
+        # next, which fills every cell between the first and the last of the
+        # grid at once
+        start, end = grid.index(0, 0), grid.index(len(lines) - 1, columns)
+        grid.cells[start:end] = (edge * 2).join(line.encode("ascii") for line in lines)
+
+        return grid
+
+    def index(self, row: int, column: int) -> int:
+        return (row + 1) * self.stride + column + 1
+
+    def position(self, index: int) -> Tuple[int, int]:
+        row, column = divmod(index, self.stride)
+        return row - 1, column - 1
+
+    def row(self, row: int) -> memoryview:
+        start = self.index(row, 0)
+        return memoryview(self.cells)[start : start + self.columns]
+
+    # Columns are strided views, so reading one does not copy the grid
+    def column(self, column: int) -> memoryview:
+        start = self.index(0, column)
+        end = self.index(self.rows - 1, column) + 1
+        return memoryview(self.cells)[start : end : self.stride]
+
+    def to_lines(self) -> List[str]:
+        return [bytes(self.row(row)).decode("ascii") for row in range(self.rows)]
+
+    # Finds each cell with a search of the cells, which skips every other cell
+    # at native speed and works on views as on bytearrays. The value must
+    # differ from the border.
+    def locate(self, value: int) -> Generator[int, None, None]:
+        for match in re.finditer(re.escape(bytes([value])), self.cells):
+            yield match.start()
+
+    # Sets the cells of the border in a map of the same size as the grid, such
+    # as a visited map, so walks over the map stop at the edge of the grid
+    def mark_border(self, cells: bytearray, value: int = 1) -> None:
+        edge = bytes([value])
+        cells[: self.stride] = edge * self.stride
+        cells[-self.stride :] = edge * self.stride
+        cells[:: self.stride] = edge * (self.rows + 2)
+        cells[self.stride - 1 :: self.stride] = edge * (self.rows + 2)
+
+
+@dataclasses.dataclass
+class Components:
+    """
+    The connected components of the free cells of a grid.
+
+    Attributes:
+        sizes (array.array[int]): The number of cells of each component.
+        seeds (array.array[int]): The first cell of each component in row-major
+        order.
+        labels (Optional[array.array[int]]): The component of each cell of the
+        grid, or -1, if labels were requested.
+    """
+
+    sizes: "array.array[int]"
+    seeds: "array.array[int]"
+    labels: Optional["array.array[int]"] = None
+
+
+def flood_fill(
+    visited: bytearray,
+    stride: int,
+    seed: int,
+    labels: Optional["array.array[int]"] = None,
+    label: int = 0,
+) -> int:
+    """
+    Fills the component of a cell through its north, south, east and west
+    neighbours, marking each cell of the component as visited. The visited map
+    holds 0 for free cells and 1 for others, and every cell of the border must
+    be 1 so that the fill never leaves the grid.
+
+    Args:
+        visited (bytearray): The visited map, changed in place.
+        stride (int): The distance between vertically adjacent cells.
+        seed (int): A free cell of the component.
+        labels (Optional[array.array[int]]): The map to write the label of the
+        component into, if any.
+        label (int): The label of the component.
+
+    Returns:
+        int: The number of cells of the component.
+    """
+    queue = array.array("i", [seed])
+    size = 0
+
+    while queue:
+        index = queue.pop()
+
+        if visited[index]:
+            continue
+
+        # Extend the cell to the run of free cells holding it, and fill the run
+        left = visited.rfind(1, 0, index) + 1
+        right = visited.find(1, index)
+        visited[left:right] = b"\x01" * (right - left)
+        size += right - left
+
+        if labels is not None:
+            labels[left:right] = array.array("i", [label]) * (right - left)
+
+        # Queue a cell of each run of free cells touching the run above or below
+        for offset in (-stride, stride):
+            start, end = left + offset, right + offset
+
+            while (start := visited.find(0, start, end)) != -1:
+                queue.append(start)
+                start = visited.find(1, start, end)
+
+                if start == -1:
+                    break
+
+    return size
+
+
+def find_components(
+    image: Grid, blocked: bytearray, with_labels: bool = False
+) -> Components:
+    """
+    Finds the connected components of the cells of a grid that are not blocked,
+    each component joining cells through their north, south, east and west
+    neighbours. The components are numbered in the row-major order of their
+    first cell.
+
+    Args:
+        image (Grid): The grid.
+        blocked (bytearray): A flag for each cell of the grid, 1 for blocked
+        cells and 0 for free cells. It is copied, not changed.
+        with_labels (bool): Whether to label every cell with its component,
+        which takes four bytes per cell.
+
+    Returns:
+        Components: The size and first cell of each component, and the labels
+        if requested.
+    """
+    visited = bytearray(blocked)
+    image.mark_border(visited)
+
+    sizes, seeds = array.array("q"), array.array("q")
+    labels = array.array("i", [-1]) * len(visited) if with_labels else None
+
+    # Each free cell left after filling the earlier components starts a new one
+    seed = visited.find(0)
+
+    while seed != -1:
+        seeds.append(seed)
+        sizes.append(flood_fill(visited, image.stride, seed, labels, len(sizes)))
+        seed = visited.find(0, seed)
+
+    return Components(sizes, seeds, labels)
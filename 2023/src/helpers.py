@@ -1,4 +1,47 @@
-from typing import Generator, Tuple
+from typing import Any, Callable, Dict, Generator, Optional, Tuple, Union, cast
+import array
+import dataclasses
+import functools
+import mmap
+import operator
+import re
+import sys
+import time
+
+import counters
+
+# Bytes removed from both ends of a line, matching str.strip() on ASCII input
+WHITESPACE = b" \t\n\r\x0b\x0c"
+
+# Translation table mapping every byte that cannot be part of an integer, other
+# than newlines, to a space
+INTEGER_BYTES = bytes(byte if byte in b"-0123456789\n" else 32 for byte in range(256))
+
+# Pattern matching a possibly negative integer
+INTEGER_PATTERN = re.compile(rb"-?\d+")
+
+# Bytes of a buffer translated at a time when extracting its integers
+INTEGER_CHUNK_SIZE = 1 << 20
+
+# Patterns for each field type of a record layout
+FIELD_PATTERNS: Dict[str, str] = {
+    "int": r"-?\d+",
+    "ints": r"-?\d+(?:\s+-?\d+)*",
+    "id": r"\w+",
+}
+
+# Conversions applied to the text matched by each field type
+FIELD_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "ints": lambda value: list(map(int, value.split())),
+    "id": str,
+}
+
+# Pattern matching a field placeholder in a record layout
+FIELD_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+# Iterations of a hot loop between two checks of its deadline
+DEADLINE_INTERVAL = 1 << 14
 
 
 def generate_lines(filename: str) -> Generator[str, None, None]:
@@ -7,6 +50,58 @@ def generate_lines(filename: str) -> Generator[str, None, None]:
             yield line.strip()
 
 
+# Maps a whole file into memory and returns a read-only view of it
+def map_file(filename: str) -> memoryview:
+    with open(filename, "rb") as f:
+        # Empty files cannot be mapped
+        if f.seek(0, 2) == 0:
+            return memoryview(b"")
+
+        # The mapping keeps its own handle, so the file can be closed right away
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # The mapping is not closed explicitly: views handed out may outlive the
+    # caller, and the mapping is released once the last view is dropped
+    return memoryview(buffer)
+
+
+# Yields each stripped line as a zero-copy view into a memory-mapped file
+def generate_line_views(filename: str) -> Generator[memoryview, None, None]:
+    view = map_file(filename)
+    size = len(view)
+    start = 0
+
+    if size == 0:
+        return
+
+    buffer = cast(mmap.mmap, view.obj)
+
+    while start < size:
+        end = buffer.find(b"\n", start)
+        next_start = end + 1
+
+        if end == -1:
+            end = size
+            next_start = size
+
+        line_start, line_end = start, end
+
+        while line_start < line_end and view[line_start] in WHITESPACE:
+            line_start += 1
+
+        while line_end > line_start and view[line_end - 1] in WHITESPACE:
+            line_end -= 1
+
+        yield view[line_start:line_end]
+        start = next_start
+
+
+# Decodes memory-mapped line views for solvers that expect str lines
+def generate_lines_mapped(filename: str) -> Generator[str, None, None]:
+    for view in generate_line_views(filename):
+        yield str(view, "utf-8")
+
+
 def expect(line: str, line_index: int, chars: str) -> int:
     for char in chars:
         if char == line[line_index]:
@@ -43,3 +138,190 @@ def parse_whitespace(line: str, line_index: int) -> int:
             break
 
     return line_index
+
+
+# Translates a buffer for parse_ints a chunk at a time and yields its lines, so
+# that a mapped file is never copied whole. The last piece of each chunk is the
+# start of a line continued by the next chunk.
+def generate_integer_lines(
+    data: Union[bytes, memoryview], chunk_size: int = INTEGER_CHUNK_SIZE
+) -> Generator[bytes, None, None]:
+    tail = b""
+
+    for start in range(0, len(data), chunk_size):
+        chunk = tail + data[start : start + chunk_size]
+        lines = chunk.translate(INTEGER_BYTES).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+
+    # A trailing newline does not start a new line
+    if tail:
+        yield tail
+
+
+# Extracts every integer in a line or a whole buffer in one pass
+def parse_ints(
+    data: Union[str, bytes, memoryview],
+) -> Tuple["array.array[int]", "array.array[int]"]:
+    """
+    Extracts every possibly negative integer from a line or a whole buffer.
+
+    Line i holds the values between offsets[i] and offsets[i + 1], so a buffer
+    of n lines yields n + 1 offsets. A trailing newline does not start a new
+    line, matching generate_lines.
+
+    Args:
+        data (Union[str, bytes, memoryview]): The text to scan, such as a
+        single line or a memory-mapped file from map_file.
+
+    Returns:
+        Tuple[array.array[int], array.array[int]]: The integers found as 64-bit
+        values, and the offset of the first integer of each line.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    values = array.array("q")
+    offsets = array.array("q", [0])
+
+    for line in generate_integer_lines(data):
+        try:
+            # Fast path: the integers are the whitespace separated tokens
+            values.extend(map(int, line.split()))
+
+        except ValueError:
+            # Tokens such as "seed-to-soil" or "1-2" need the full pattern
+            del values[offsets[-1] :]
+            values.extend(map(int, INTEGER_PATTERN.findall(line)))
+
+        offsets.append(len(values))
+
+    return values, offsets
+
+
+# Define a dataclass to represent a record layout compiled into a matcher
+@dataclasses.dataclass
+class Layout:
+    """
+    Data class representing a compiled record layout such as
+    "Card {int}: {ints} | {ints}".
+
+    Attributes:
+        literals (Tuple[str, ...]): The literal text before each field, followed
+        by the literal text after the last field.
+        fields (Tuple[str, ...]): The type of each field: int, ints or id.
+        pattern (re.Pattern[str]): The regular expression matching a record.
+    """
+
+    literals: Tuple[str, ...]
+    fields: Tuple[str, ...]
+    pattern: "re.Pattern[str]"
+
+    def __post_init__(self) -> None:
+        # Pick the cheapest conversion that covers every field of the layout
+        self.converters: Tuple[Callable[[str], Any], ...] = tuple(
+            FIELD_CONVERTERS[field] for field in self.fields
+        )
+        self.is_text = all(field == "id" for field in self.fields)
+        self.is_integer = all(field == "int" for field in self.fields)
+
+    # Parse a record into a tuple with one typed value per field
+    def parse(self, line: str) -> Tuple[Any, ...]:
+        match = self.pattern.fullmatch(line)
+
+        if match is None:
+            self.diagnose(line)
+
+        assert match is not None
+
+        if self.is_text:
+            return match.groups()
+
+        elif self.is_integer:
+            return tuple(map(int, match.groups()))
+
+        return tuple(map(operator.call, self.converters, match.groups()))
+
+    # Walk a malformed record field by field and raise at the first mismatch
+    def diagnose(self, line: str) -> None:
+        line_index = 0
+
+        for i, field in enumerate(self.fields):
+            line_index = self.expect_literal(line, line_index, self.literals[i])
+            match = re.compile(FIELD_PATTERNS[field]).match(line, line_index)
+
+            if match is None:
+                if field == "id":
+                    raise ValueError("Expected identifier.")
+
+                raise ValueError("Expected sequence of digits.")
+
+            line_index = match.end()
+
+        line_index = self.expect_literal(line, line_index, self.literals[-1])
+
+        if line_index != len(line):
+            raise ValueError(f"Expected EOL after item {len(self.fields) - 1}.")
+
+        raise ValueError("Malformed record.")
+
+    # Consume literal text, where a space stands for a run of whitespace
+    def expect_literal(self, line: str, line_index: int, literal: str) -> int:
+        for char in literal:
+            if line_index == len(line):
+                raise ValueError(f"Expected {char} but found EOL.")
+
+            if char != " ":
+                line_index = expect(line, line_index, char)
+                continue
+
+            if not line[line_index].isspace():
+                raise ValueError(f"Expected whitespace but found {line[line_index]}.")
+
+            line_index = parse_whitespace(line, line_index)
+
+        return line_index
+
+
+# Compile a record layout once into a reusable matcher
+@functools.cache
+def compile_layout(layout: str) -> Layout:
+    """
+    Compiles a record layout into a matcher. Fields are written as {int}, {ints}
+    for whitespace separated integers, or {id} for a word, and a space in the
+    literal text matches any run of whitespace.
+
+    Args:
+        layout (str): The record layout, e.g. "{id} = ({id}, {id})".
+
+    Returns:
+        Layout: The compiled layout, shared by all callers of the same layout.
+    """
+    literals = FIELD_PLACEHOLDER.split(layout)[::2]
+    fields = FIELD_PLACEHOLDER.findall(layout)
+
+    for field in fields:
+        if field not in FIELD_PATTERNS:
+            raise ValueError(f"Unknown field type {field}.")
+
+    # Escape literal text, then allow any run of whitespace where it has one
+    pieces = [re.escape(literal).replace("\\ ", r"\s+") for literal in literals]
+    expression = pieces[0]
+
+    for field, piece in zip(fields, pieces[1:]):
+        expression += f"({FIELD_PATTERNS[field]}){piece}"
+
+    return Layout(tuple(literals), tuple(fields), re.compile(expression))
+
+
+# Raises a TimeoutError holding the progress made so far once the deadline given
+# by the runner has passed, so that the runner can report a partial result
+def check_deadline(deadline: Optional[float], **progress: Any) -> None:
+    if deadline is not None and time.perf_counter() > deadline:
+        raise TimeoutError(progress)
+
+
+# Swap in counting versions of the parsing primitives when counting is enabled,
+# so that runs without counting pay nothing per call
+if counters.is_enabled():
+    counters.install(sys.modules[__name__])
@@ -0,0 +1,60 @@
+from typing import List
+import os
+import pathlib
+import pytest
+
+import cache
+
+
+@pytest.fixture(autouse=True)
+def directory(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    return str(tmp_path / "cache")
+
+
+@pytest.fixture
+def filename(tmp_path: pathlib.Path) -> str:
+    path = tmp_path / "input.txt"
+    path.write_text("1 2\n3 4\n")
+    return str(path)
+
+
+def test_load_or_parse(filename: str) -> None:
+    calls: List[List[str]] = []
+
+    def parse(lines: List[str]) -> List[str]:
+        calls.append(lines)
+        return lines
+
+    assert cache.load_or_parse(filename, parse, 1) == ["1 2", "3 4"]
+    assert cache.load_or_parse(filename, parse, 1) == ["1 2", "3 4"]
+    assert len(calls) == 1
+
+    # A new parser version or new input contents miss the cache
+    assert cache.load_or_parse(filename, parse, 2) == ["1 2", "3 4"]
+    assert len(calls) == 2
+
+    pathlib.Path(filename).write_text("5 6\n")
+    assert cache.load_or_parse(filename, parse, 2) == ["5 6"]
+    assert len(calls) == 3
+
+    assert len(cache.list_entries()) == 3
+
+
+def test_evict(filename: str, directory: str) -> None:
+    for version in range(3):
+        cache.load_or_parse(filename, lambda lines: lines, version)
+
+    # Make the first entry the most recently used
+    first = cache.list_entries()[-1][0]
+    os.utime(os.path.join(directory, first), (2e9, 2e9))
+
+    entries = cache.list_entries()
+    assert entries[0][0] == first
+
+    removed = cache.evict(entries[0][1] + entries[1][1])
+    assert removed == [entries[2][0]]
+    assert [name for name, _, _ in cache.list_entries()] == [first, entries[1][0]]
+
+    assert len(cache.clear()) == 2
+    assert cache.list_entries() == []
@@ -0,0 +1,73 @@
+from typing import Dict, List
+import array
+import pathlib
+import pytest
+
+import columnar
+import day_07
+import day_09
+import day_10
+import day_24
+
+
+def test_write_and_load_columns(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "input.col")
+    columns = {
+        "values": array.array("q", [-(1 << 40), 0, 7]),
+        "codes": array.array("I", [1, 2]),
+        "plane": array.array("B", b"#.#"),
+    }
+    columnar.write_columns(path, 5, columns)
+
+    day, loaded = columnar.load_columns(path)
+    assert day == 5
+    assert {name: column.tolist() for name, column in loaded.items()} == {
+        name: column.tolist() for name, column in columns.items()
+    }
+
+    pathlib.Path(path).write_bytes(b"not columns at all")
+
+    with pytest.raises(ValueError, match="is not a columnar file"):
+        columnar.load_columns(path)
+
+
+# Converts lines of a day through a file and loads the columns back
+def convert(
+    tmp_path: pathlib.Path, day: int, lines: List[str]
+) -> Dict[str, memoryview]:
+    filename = tmp_path / "input.txt"
+    filename.write_text("\n".join(lines) + "\n")
+
+    path = columnar.convert_file(day, str(filename))
+    assert path == str(tmp_path / "input.col")
+
+    columns_day, columns = columnar.load_columns(path)
+    assert columns_day == day
+
+    result: Dict[str, memoryview] = columns
+    return result
+
+
+def test_decode_columns(tmp_path: pathlib.Path) -> None:
+    hands = ["32T3K 765", "T55J5 684", "KK677 28"]
+    codes, bids = day_07.decode_columns(convert(tmp_path, 7, hands))
+    assert isinstance(codes, memoryview) and isinstance(bids, memoryview)
+    assert (list(codes), list(bids)) == tuple(map(list, day_07.parse(hands)))
+
+    histories = ["0 3 6 9 12 15", "10 13 16 21 30 45", "-4 -1"]
+    decoded = day_09.decode_columns(convert(tmp_path, 9, histories))
+    assert [list(values) for values in decoded] == day_09.parse(histories)
+
+    grid = ["..F7.", ".FJ|.", "SJ.L7"]
+    pipes = day_10.decode_columns(convert(tmp_path, 10, grid))
+    assert isinstance(pipes.cells, memoryview) and pipes.to_lines() == grid
+
+    hailstones = ["19, 13, 30 @ -2, 1, -2", "18, 19, 22 @ -1, -1, -2"]
+    assert day_24.decode_columns(convert(tmp_path, 24, hailstones)) == day_24.parse(
+        hailstones
+    )
+
+
+def test_encode_grid() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        columnar.encode_grid(["...", ".."])
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import counters
+import helpers
+
+
+def test_wrap() -> None:
+    counters.COUNTS.clear()
+    parse_digits = counters.wrap("parse_digits", helpers.parse_digits)
+
+    assert parse_digits("ab -123 c", 3) == ("-123", 7)
+    assert parse_digits("12", 0) == ("12", 2)
+
+    count = counters.COUNTS[("test_counters", "parse_digits")]
+    assert (count.calls, count.chars) == (2, 6)
+    assert "test_counters   parse_digits" in counters.format_counts()
+
+    counters.COUNTS.clear()
+
+
+def test_install() -> None:
+    # Without the environment variable the primitives are left untouched
+    assert not hasattr(helpers.expect, "__wrapped__")
+
+    code = (
+        "import helpers\n"
+        "helpers.compile_layout('Card {int}: {ints}').diagnose('Card  1: 2 x')\n"
+    )
+    environment = {**os.environ, counters.ENVIRONMENT_VARIABLE: "1"}
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+
+    # Calls made by the helpers themselves are attributed to their caller
+    assert "ValueError" in process.stderr
+    assert "<string>        expect" in process.stderr
+    assert "<string>        parse_whitespace" in process.stderr
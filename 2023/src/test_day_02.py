@@ -20,3 +20,21 @@ def test_add_valid_games(document: str) -> None:
 
 def test_add_set_powers(document: str) -> None:
     assert day_02.add_set_powers(document.split("\n")) == 2286
+
+
+def test_fused(document: str) -> None:
+    lines = day_02.parse(document.split("\n"))
+
+    assert day_02.find_max_draws(lines[0]) == (1, {"blue": 6, "red": 4, "green": 2})
+    assert day_02.fused(lines) == (day_02.part_1(lines), day_02.part_2(lines))
+    assert day_02.fused(lines) == (8, 2286)
+
+    # A color drawn at most 0 times is still in the minimum set
+    lines = ["Game 1: 0 red, 3 blue; 2 green"]
+
+    assert day_02.find_max_draws(lines[0]) == (1, {"red": 0, "blue": 3, "green": 2})
+    assert day_02.part_2(lines) == day_02.add_set_powers(lines) == 0
+
+
+def test_stream(document: str) -> None:
+    assert day_02.stream(iter(document.split("\n"))) == (8, 2286)
@@ -15,3 +15,25 @@ def test_get_calibration_values_simple() -> None:
 .664.598.."""
 
     assert day_03.get_part_numbers_sum(document.split("\n")) == (4361, 467835)
+
+
+def test_add_part_numbers_grid() -> None:
+    lines = ["467..114..", "...*......", "..35..633.", "......#...", "617*......"]
+    layout, _ = day_03.parse(lines)
+
+    assert layout.to_lines() == lines
+    assert day_03.add_part_numbers_grid(layout) == day_03.get_part_numbers_sum(lines)
+
+    # A number next to two symbols counts once, towards the first
+    assert day_03.add_part_numbers_grid(day_03.parse(["2*3", "*.."])[0]) == (5, 6)
+
+
+def test_fused() -> None:
+    lines = ["467..114..", "...*......", "..35..633.", "......#...", "617*......"]
+    model = day_03.parse(lines)
+
+    # The scan is shared, so solving a part leaves it intact for the next one
+    assert day_03.part_1(model) == 467 + 35 + 633 + 617
+    assert day_03.part_2(model) == 467 * 35
+    assert day_03.fused(model) == (day_03.part_1(model), day_03.part_2(model))
+    assert day_03.fused(model) == day_03.add_part_numbers_grid(model[0])
@@ -5,8 +5,8 @@ import day_04
 
 
 @pytest.fixture
-def cards() -> Sequence[day_04.Card]:
-    lines = [
+def lines() -> Sequence[str]:
+    return [
         "Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53",
         "Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19",
         "Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1",
@@ -15,6 +15,9 @@ def cards() -> Sequence[day_04.Card]:
         "Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11",
     ]
 
+
+@pytest.fixture
+def cards(lines: Sequence[str]) -> Sequence[day_04.Card]:
     return [day_04.parse_card(line) for line in lines]
 
 
@@ -29,3 +32,7 @@ def test_count_points(cards: Sequence[day_04.Card]) -> None:
 
 def test_count_cards(cards: Sequence[day_04.Card]) -> None:
     assert day_04.count_cards(cards) == 30
+
+
+def test_stream(lines: Sequence[str]) -> None:
+    assert day_04.stream(iter(lines)) == (13, 30)
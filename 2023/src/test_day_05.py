@@ -55,3 +55,11 @@ def test_find_min_location_range(document: str) -> None:
 
     assert min_location == 46
     assert min_seed == 82
+
+
+def test_find_min_location_intervals(document: str) -> None:
+    almanac, seeds = day_05.init_almanac(document.split("\n"))
+    min_location, min_seed = day_05.find_min_location_intervals(almanac, seeds)
+
+    assert min_location == 46
+    assert min_seed == 82
@@ -16,3 +16,26 @@ QQQJA 483"""
 def test_calculate_winnings(document: str) -> None:
     assert day_07.calculate_winnings(document.split("\n"), False) == 6440
     assert day_07.calculate_winnings(document.split("\n"), True) == 5905
+
+
+def test_stream(document: str) -> None:
+    assert day_07.stream(iter(document.split("\n"))) == (6440, 5905)
+
+    # Copies of a hand keep the order of their lines among themselves
+    lines = document.split("\n") + ["KK677 5", "T55J5 1", "KK677 300"]
+    assert day_07.stream(iter(lines)) == (
+        day_07.calculate_winnings(lines, False),
+        day_07.calculate_winnings(lines, True),
+    )
+
+
+def test_calculate_code_winnings(document: str) -> None:
+    model = day_07.parse(document.split("\n"))
+    assert day_07.unpack_code(model[0][0]) == [3, 2, 10, 3, 13]
+    assert (day_07.part_1(model), day_07.part_2(model)) == (6440, 5905)
+
+    # Jokers alone make five of a kind, yet still rank below any other card
+    lines = document.split("\n") + ["JJJJJ 7", "22223 11", "KK677 5", "J2345 3"]
+    model = day_07.parse(lines)
+    assert day_07.part_1(model) == day_07.calculate_winnings(lines, False)
+    assert day_07.part_2(model) == day_07.calculate_winnings(lines, True)
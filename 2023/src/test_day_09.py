@@ -17,3 +17,8 @@ def test_extrapolate_next_value() -> None:
 
     assert next_total == 114
     assert prior_total == 2
+
+
+def test_stream() -> None:
+    lines = ["0 3 6 9 12 15", "1 3 6 10 15 21", "10 13 16 21 30 45"]
+    assert day_09.stream(iter(lines)) == (114, 2)
@@ -1,4 +1,5 @@
 import day_10
+import grid
 
 
 def test_solve_loop() -> None:
@@ -53,3 +54,35 @@ LJ.LJ"""
 
     islands = day_10.get_islands(document.split("\n"), boundary)
     assert day_10.count_tiles(document.split("\n"), islands, boundary) == 1
+
+
+def test_get_islands_flat() -> None:
+    document = """\
+..........
+.S------7.
+.|F----7|.
+.||....||.
+.||....||.
+.|L-7F-J|.
+.|..||..|.
+.L--JL--J.
+.........."""
+
+    lines = document.split("\n")
+    _, boundary = day_10.solve_loop(lines)
+    islands = day_10.get_islands(lines, boundary)
+
+    pipes = grid.Grid.from_lines(lines)
+    _, on_loop, crossings = day_10.trace_loop(pipes)
+    components = day_10.get_islands_flat(pipes, on_loop)
+
+    assert list(components.sizes) == [len(island) for island in islands.values()]
+    assert [pipes.position(seed) for seed in components.seeds] == [
+        island[0] for island in islands.values()
+    ]
+    assert day_10.count_tiles_flat(pipes, crossings, components) == 4
+    assert day_10.part_2_flood(pipes) == day_10.count_tiles(lines, islands, boundary)
+
+    # The start is read as the pipe it stands for, and the grid is not changed
+    assert on_loop[pipes.index(1, 1)] == 1 and crossings[pipes.index(1, 1)] == 0
+    assert pipes.to_lines() == lines
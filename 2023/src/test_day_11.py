@@ -1,4 +1,7 @@
+import pytest
+
 import day_11
+import grid
 
 
 def test_sum_distances() -> None:
@@ -96,3 +99,36 @@ def test_sum_distances() -> None:
     )
 
     assert day_11.sum_distances(galaxies_3) == 8410
+
+
+def test_fused() -> None:
+    lines = [
+        "...#......",
+        ".......#..",
+        "#.........",
+        "..........",
+        "......#...",
+        ".#........",
+        ".........#",
+        "..........",
+        ".......#..",
+        "#...#.....",
+    ]
+    model = day_11.parse(lines)
+
+    # The sums for factors 10 and 100 follow from the same two totals
+    total_distance, total_crossed = day_11.sum_expansions(model)
+    assert total_distance + 9 * total_crossed == 1030
+    assert total_distance + 99 * total_crossed == 8410
+
+    assert day_11.fused(model) == (374, day_11.part_2(model))
+
+
+def test_scan_galaxies_grid() -> None:
+    lines = ["...#......", ".......#..", "#.........", "..........", "......#..."]
+    image = grid.Grid.from_lines(lines)
+
+    assert day_11.scan_galaxies_grid(image) == day_11.scan_galaxies(lines)
+
+    with pytest.raises(ValueError, match="same length"):
+        day_11.parse(["#..", "."])
@@ -35,3 +35,4 @@ def test_calculate_total() -> None:
     pairs = day_12.scan_conditions(document.split("\n"))
 
     assert day_12.calculate_total(pairs) == 21
+    assert day_12.stream(iter(document.split("\n"))) == (21,)
@@ -1,3 +1,5 @@
+import pytest
+
 from day_24 import Hailstone, Vector
 import day_24
 
@@ -19,3 +21,18 @@ def test_calculate_intersection_2d() -> None:
     h_1 = day_24.parse_hailstone("18, 19, 22 @ -1, -1, -2")
     h_2 = day_24.parse_hailstone("12, 31, 28 @ -1, -2, -1")
     assert day_24.calculate_intersection_2d(h_1, h_2) == (-6.0, -5.0)
+
+
+def test_parse_hailstones() -> None:
+    document = """\
+19, 13, 30 @ -2, 1, -2
+18, 19, 22 @ -1, -1, -2
+"""
+
+    assert day_24.parse_hailstones(document) == [
+        day_24.parse_hailstone("19, 13, 30 @ -2, 1, -2"),
+        day_24.parse_hailstone("18, 19, 22 @ -1, -1, -2"),
+    ]
+
+    with pytest.raises(ValueError):
+        day_24.parse_hailstones("19, 13, 30 @ -2, 1")
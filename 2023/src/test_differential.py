@@ -0,0 +1,55 @@
+from typing import List
+import pytest
+import random
+
+import day_06
+import day_09
+import day_12
+import differential
+import generators
+
+
+@pytest.mark.parametrize(
+    "check", differential.CHECKS, ids=lambda check: f"day_{check.day:02}"
+)
+def test_engine_matches_reference(check: differential.Check) -> None:
+    assert differential.run_check(check, trials=200) is None
+
+
+def test_shrink() -> None:
+    lines = ["10 20 30", "40 57 60", "70 80 90"]
+
+    def fails(lines: List[str]) -> bool:
+        return any(int(number) > 50 for line in lines for number in line.split())
+
+    assert differential.shrink(lines, fails) == ["51"]
+
+
+def test_check_engine_shrinks_counterexample() -> None:
+    # An engine that forgets the last value of histories longer than three
+    def part_1_broken(histories: List[List[int]]) -> int:
+        answer: int = day_09.part_1([values[:3] for values in histories])
+        return answer
+
+    def generate(rng: random.Random) -> List[str]:
+        lines: List[str] = generators.generate_histories(rng, 5, 6, 4)
+        return lines
+
+    counterexample = differential.check_engine(day_09, {1: part_1_broken}, generate)
+
+    assert counterexample is not None and counterexample.part == 1
+    assert len(counterexample.lines) == 1
+    assert len(counterexample.lines[0].split()) == 4
+
+
+def test_count_ways_closed() -> None:
+    for time in range(60):
+        for distance in range(time * time // 4 + 2):
+            expected = day_06.count_ways(time, distance)
+            assert day_06.count_ways_closed(time, distance) == expected
+
+
+def test_count_arrangements() -> None:
+    assert day_12.count_arrangements("?###????????", [3, 2, 1]) == 10
+    assert day_12.count_arrangements("?#?#?#?#?#?#?#?", [1, 3, 1, 6]) == 1
+    assert day_12.count_arrangements("#", [2]) == 0
@@ -0,0 +1,61 @@
+import importlib
+import pytest
+import random
+
+import day_08
+import day_10
+import day_12
+import generators
+
+
+def test_generate() -> None:
+    assert generators.generate(1, seed=1) == generators.generate(1, seed=1)
+    assert generators.generate(1, seed=1) != generators.generate(1, seed=2)
+
+    # The scale multiplies the number of lines, or the area of a grid
+    assert len(generators.generate(1, scale=2)) == 2000
+    assert len(generators.generate(11, scale=4)) == 280
+    assert len(generators.generate(11, size=10)) == 10
+
+    with pytest.raises(ValueError, match="No generator for day 13."):
+        generators.generate(13)
+
+
+@pytest.mark.parametrize("day", [1, 2, 3, 4, 5, 6, 7, 9, 11, 24])
+def test_generate_solvable(day: int) -> None:
+    module = importlib.import_module(f"day_{day:02}")
+    model = module.parse(generators.generate(day, scale=0.1))
+
+    assert isinstance(module.part_1(model), int)
+
+
+def test_generate_network() -> None:
+    model = day_08.parse(generators.generate_network(random.Random(0), 7, 3))
+
+    assert day_08.part_1(model) == 7 * 2
+    assert day_08.part_2(model) == 7 * 2 * 3 * 5
+
+
+def test_generate_pipe_maze() -> None:
+    lines = generators.generate(10, size=40)
+    _, path = day_10.solve_loop(lines)
+    boundary = list(dict.fromkeys(path))
+
+    # By Pick's theorem, the tiles enclosed by a loop follow from its area and
+    # length
+    area = abs(
+        sum(
+            y_1 * x_2 - y_2 * x_1
+            for (y_1, x_1), (y_2, x_2) in zip(boundary, boundary[1:] + boundary[:1])
+        )
+    )
+    assert day_10.part_2(day_10.parse(lines)) == area // 2 - len(boundary) // 2 + 1
+
+
+def test_generate_springs() -> None:
+    lines = generators.generate(12, scale=0.01, unknown_count=8)
+
+    for line in lines:
+        assert line.count("?") == 8
+        assert len(line.split()[0]) == 20
+        assert day_12.part_1(day_12.parse([line])) >= 1
@@ -0,0 +1,57 @@
+import pytest
+
+import grid
+
+
+def test_from_lines() -> None:
+    cells = grid.Grid.from_lines(["ab", "cd", "ef"])
+
+    assert (cells.rows, cells.columns, cells.stride) == (3, 2, 4)
+    assert cells.cells == bytearray(b".....ab..cd..ef.....")
+
+    view = memoryview(bytes(cells.cells))
+    assert grid.Grid(3, 2, ord("."), view).to_lines() == ["ab", "cd", "ef"]
+
+    with pytest.raises(ValueError, match="shape of the grid"):
+        grid.Grid(2, 2, ord("."), view)
+
+    with pytest.raises(ValueError, match="same length"):
+        grid.Grid.from_lines(["ab", "c"])
+
+
+def test_index_and_views() -> None:
+    cells = grid.Grid.from_lines(["abc", "def"], border=0)
+    index = cells.index(1, 2)
+
+    assert cells.cells[index] == ord("f")
+    assert cells.position(index) == (1, 2)
+    assert bytes(cells.row(1)) == b"def"
+    assert bytes(cells.column(1)) == b"be"
+    assert list(cells.locate(ord("e"))) == [cells.index(1, 1)]
+
+    # The neighbours of a corner outside the grid are sentinel cells
+    corner = cells.index(0, 0)
+    neighbours = bytes(cells.cells[corner + offset] for offset in cells.offsets_8)
+    assert neighbours == b"\0db\0\0\0e\0"
+
+
+def test_find_components() -> None:
+    cells = grid.Grid.from_lines(["..#..", "..#..", "###.#", ".#..."])
+    blocked = bytearray(cell == ord("#") for cell in cells.cells)
+
+    visited = bytearray(len(cells.cells))
+    cells.mark_border(visited)
+    assert visited.count(1) == 2 * cells.stride + 2 * cells.rows
+
+    components = grid.find_components(cells, blocked, with_labels=True)
+    assert list(components.sizes) == [4, 8, 1]
+    assert [cells.position(seed) for seed in components.seeds] == [
+        (0, 0),
+        (0, 3),
+        (3, 0),
+    ]
+
+    assert components.labels is not None
+    assert components.labels[cells.index(3, 4)] == 1
+    assert components.labels[cells.index(2, 2)] == -1
+    assert grid.find_components(cells, blocked).labels is None
@@ -1,3 +1,4 @@
+import pathlib
 import pytest
 
 import helpers
@@ -19,3 +20,88 @@ def test_parse_digits() -> None:
 
     assert helpers.parse_digits("a", 0) == ("", 0)
     assert helpers.parse_digits("1a", 0) == ("1", 1)
+
+
+def test_generate_line_views(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"  ab \r\n\ncd\n-12 3")
+    assert helpers.map_file(str(path)) == b"  ab \r\n\ncd\n-12 3"
+
+    views = list(helpers.generate_line_views(str(path)))
+    assert [bytes(view) for view in views] == [b"ab", b"", b"cd", b"-12 3"]
+
+    assert list(helpers.generate_lines_mapped(str(path))) == list(
+        helpers.generate_lines(str(path))
+    )
+
+
+def test_generate_line_views_empty(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+
+    assert helpers.map_file(str(path)) == b""
+    assert list(helpers.generate_line_views(str(path))) == []
+
+
+def test_parse_ints() -> None:
+    values, offsets = helpers.parse_ints("19, 13, 30 @ -2, 1, -2")
+    assert values.tolist() == [19, 13, 30, -2, 1, -2]
+    assert offsets.tolist() == [0, 6]
+
+    values, offsets = helpers.parse_ints(
+        b"seeds: 79 14\n\nseed-to-soil map:\n50 98 2\n"
+    )
+    assert values.tolist() == [79, 14, 50, 98, 2]
+    assert offsets.tolist() == [0, 2, 2, 2, 5]
+
+    values, offsets = helpers.parse_ints(memoryview(b"1-2,-3\n-"))
+    assert values.tolist() == [1, -2, -3]
+    assert offsets.tolist() == [0, 3, 3]
+
+    values, offsets = helpers.parse_ints("")
+    assert values.tolist() == []
+    assert offsets.tolist() == [0]
+
+
+def test_generate_integer_lines() -> None:
+    data = memoryview(b"seeds: 79 14\n\nsoil -12\n")
+    lines = list(helpers.generate_integer_lines(data))
+
+    # Lines cut across chunks are joined back together
+    assert list(helpers.generate_integer_lines(data, chunk_size=3)) == lines
+    assert lines == [b"       79 14", b"", b"     -12"]
+
+
+def test_compile_layout() -> None:
+    layout = helpers.compile_layout("Card {int}: {ints} | {ints}")
+    assert layout is helpers.compile_layout("Card {int}: {ints} | {ints}")
+
+    assert layout.parse("Card   3:  1 21 | 69  1") == (3, [1, 21], [69, 1])
+
+    with pytest.raises(ValueError, match="Expected C but found G."):
+        layout.parse("Game 3:  1 21 | 69  1")
+
+    with pytest.raises(ValueError, match="Expected sequence of digits."):
+        layout.parse("Card 3: a | 69  1")
+
+    layout = helpers.compile_layout("{id} = ({id}, {id})")
+    assert layout.parse("AAA = (BBB, CCC)") == ("AAA", "BBB", "CCC")
+
+    with pytest.raises(ValueError, match="Expected EOL after item 2."):
+        layout.parse("AAA = (BBB, CCC))")
+
+    with pytest.raises(ValueError, match="Expected , but found EOL."):
+        layout.parse("AAA = (BBB")
+
+    with pytest.raises(ValueError):
+        helpers.compile_layout("{float}")
+
+
+def test_check_deadline() -> None:
+    helpers.check_deadline(None, steps=1)
+    helpers.check_deadline(float("inf"), steps=1)
+
+    with pytest.raises(TimeoutError) as e:
+        helpers.check_deadline(0.0, steps=1, location="AAA")
+
+    assert e.value.args[0] == {"steps": 1, "location": "AAA"}
@@ -0,0 +1,15 @@
+"""
+This package provides a single entry point for running the solutions of every
+year. Solvers are discovered from the day modules of each year, the input is
+read and parsed once, and the parsed model is shared by both parts.
+
+Usage:
+    python -m aoc list [--year YEAR]
+    python -m aoc run --year 2023 --day 5 [--part 2] [--input FILE] [--memo] [--memory]
+    python -m aoc run --year 2023 --day 3 --profile DIRECTORY [--interval SECONDS]
+    python -m aoc run --year 2023 --day 5 --budget SECONDS
+    python -m aoc batch --year 2023 --day 7 'inputs/*.txt' [--workers N]
+    python -m aoc serve [--socket PATH] [--workers N] [--timeout SECONDS]
+    python -m aoc solve --year 2023 --day 7 [--part 1] [--input FILE]
+    python -m aoc stats [--socket PATH]
+"""
@@ -0,0 +1,282 @@
+import argparse
+import json
+import os
+import socket
+
+from aoc import client
+from aoc import registry
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="aoc", description="Run puzzle solvers.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="list the available solvers")
+    list_parser.add_argument("--year", type=int)
+
+    run_parser = subparsers.add_parser("run", help="run a solver and time it")
+    run_parser.add_argument("--year", type=int, required=True)
+    run_parser.add_argument("--day", type=int, required=True)
+    run_parser.add_argument("--part", type=int, choices=(1, 2))
+    run_parser.add_argument("--input", help="input file, defaults to the day's data")
+    run_parser.add_argument("--engine", help="alternative engine of the solver")
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="fold the input line by line as it is read, '-' reading stdin",
+    )
+    run_parser.add_argument(
+        "--verbose", action="store_true", help="show output printed by the solver"
+    )
+    run_parser.add_argument(
+        "--no-fuse", action="store_true", help="time each part separately"
+    )
+    run_parser.add_argument(
+        "--memo", action="store_true", help="reuse answers of unchanged runs"
+    )
+    run_parser.add_argument(
+        "--cache", action="store_true", help="reuse parsed models of unchanged runs"
+    )
+    run_parser.add_argument(
+        "--budget", type=float, help="seconds before long-running parts give up"
+    )
+    run_parser.add_argument(
+        "--memory", action="store_true", help="trace the memory of each phase"
+    )
+    run_parser.add_argument(
+        "--profile", metavar="DIRECTORY", help="write sampled stacks of each phase"
+    )
+    run_parser.add_argument(
+        "--interval",
+        type=float,
+        help="seconds of CPU time between samples",
+    )
+
+    run_all_parser = subparsers.add_parser(
+        "run-all", help="run every solver in parallel, longest first"
+    )
+    run_all_parser.add_argument("--year", type=int)
+    run_all_parser.add_argument(
+        "--workers", type=int, help="maximum number of worker processes"
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve a day for many inputs, printing JSON lines"
+    )
+    batch_parser.add_argument("--year", type=int, required=True)
+    batch_parser.add_argument("--day", type=int, required=True)
+    batch_parser.add_argument("pattern", help="glob of the inputs, such as 'in/*.txt'")
+    batch_parser.add_argument(
+        "--workers", type=int, default=0, help="worker processes, 0 for none"
+    )
+    batch_parser.add_argument("--engine", help="alternative engine of the solver")
+    batch_parser.add_argument(
+        "--budget", type=float, help="seconds per input before parts give up"
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="run the solve service on a local socket"
+    )
+    serve_parser.add_argument("--socket", help="socket path, defaults to the cache")
+    serve_parser.add_argument("--workers", type=int, help="worker processes")
+    serve_parser.add_argument(
+        "--max-concurrency", type=int, help="requests solved at once"
+    )
+    serve_parser.add_argument(
+        "--max-queue", type=int, default=64, help="requests waiting for a worker"
+    )
+    serve_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=client.DEFAULT_TIMEOUT,
+        help="default seconds a request may take",
+    )
+
+    solve_parser = subparsers.add_parser(
+        "solve", help="solve through the service, or in-process without one"
+    )
+    solve_parser.add_argument("--year", type=int, required=True)
+    solve_parser.add_argument("--day", type=int, required=True)
+    solve_parser.add_argument("--part", type=int, choices=(1, 2))
+    solve_parser.add_argument("--input", help="input file, defaults to the day's data")
+    solve_parser.add_argument("--socket", help="socket path, defaults to the cache")
+    solve_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=client.DEFAULT_TIMEOUT,
+        help="seconds the request may take",
+    )
+
+    stats_parser = subparsers.add_parser(
+        "stats", help="print the counters and latencies of the service"
+    )
+    stats_parser.add_argument("--socket", help="socket path, defaults to the cache")
+
+    args = parser.parse_args()
+
+    # Each command imports only the modules it needs, so that starting the
+    # client or solving a single day does not pay for the process pool or the
+    # event loop
+    match args.command:
+        case "list":
+            for year in [args.year] if args.year else registry.list_years():
+                days = []
+
+                for day in registry.list_days(year):
+                    engines = registry.list_engines(registry.load_solver(year, day))
+                    days.append(f"{day}[{','.join(engines)}]" if engines else str(day))
+
+                print(f"{year}: {' '.join(days)}")
+
+        case "run":
+            from aoc import memoize
+            from aoc import profiler
+            from aoc import runner
+
+            memo = memoize.Memo.load() if args.memo else None
+            interval = (
+                (args.interval or profiler.DEFAULT_INTERVAL) if args.profile else None
+            )
+
+            try:
+                result = runner.run_solver(
+                    args.year,
+                    args.day,
+                    args.input,
+                    [args.part] if args.part else (1, 2),
+                    args.verbose,
+                    args.engine,
+                    args.memory,
+                    interval,
+                    not args.no_fuse,
+                    memo,
+                    args.budget,
+                    args.stream,
+                    args.cache,
+                )
+
+            except (ValueError, FileNotFoundError) as e:
+                parser.exit(1, f"aoc: {e}\n")
+
+            print(runner.format_result(result))
+
+            if memo is not None:
+                memo.save()
+                print(f"  memo: {memo.hits} hits, {memo.misses} misses")
+
+            if result.profiles is not None:
+                os.makedirs(args.profile, exist_ok=True)
+                name = f"{args.year}_day_{args.day:02}"
+
+                for phase, sampler in result.profiles.items():
+                    path = os.path.join(args.profile, f"{name}_{phase}.collapsed")
+                    profiler.write_collapsed(sampler, phase, path)
+                    count = sum(sampler.samples.values())
+                    print(f"  {phase}: {count} samples in {path}")
+
+                path = os.path.join(args.profile, f"{name}.speedscope.json")
+                profiler.write_speedscope(result.profiles, name, path)
+                print(f"  speedscope: {path}")
+
+        case "run-all":
+            import time
+
+            from aoc import runner
+            from aoc import scheduler
+
+            jobs = [
+                (year, day)
+                for year in ([args.year] if args.year else registry.list_years())
+                for day in registry.list_days(year)
+            ]
+
+            start = time.perf_counter()
+            total, failures = 0.0, 0
+
+            for result in scheduler.run_all(jobs, args.workers):
+                print(runner.format_result(result), flush=True)
+                total += sum(result.timings.values())
+                failures += result.error is not None
+
+            elapsed = time.perf_counter() - start
+            print(
+                f"{len(jobs)} solvers in {elapsed:.1f} s, {total:.1f} s of solver time,"
+                f" {failures} failed"
+            )
+
+            if failures > 0:
+                parser.exit(1)
+
+        case "batch":
+            import glob
+
+            from aoc import batch
+
+            filenames = sorted(glob.glob(args.pattern, recursive=True))
+
+            if len(filenames) == 0:
+                parser.exit(1, f"aoc: No inputs match {args.pattern}.\n")
+
+            failures = 0
+
+            for record in batch.run_batch(
+                args.year, args.day, filenames, args.workers, args.engine, args.budget
+            ):
+                print(json.dumps(record), flush=True)
+                failures += "error" in record
+
+            if failures > 0:
+                parser.exit(1, f"aoc: {failures} inputs failed.\n")
+
+        case "serve":
+            import asyncio
+
+            from aoc import service
+
+            path = args.socket or client.get_socket_path()
+            print(f"aoc: serving on {path}", flush=True)
+
+            try:
+                asyncio.run(
+                    service.serve(
+                        path,
+                        args.workers,
+                        args.max_concurrency,
+                        args.max_queue,
+                        args.timeout,
+                    )
+                )
+
+            except ValueError as e:
+                parser.exit(1, f"aoc: {e}\n")
+
+            except KeyboardInterrupt:
+                pass
+
+        case "solve":
+            message = {
+                "year": args.year,
+                "day": args.day,
+                "part": args.part,
+                "path": os.path.abspath(
+                    args.input or registry.get_input_path(args.year, args.day)
+                ),
+                "timeout": args.timeout,
+            }
+            record = client.solve(message, args.socket or client.get_socket_path())
+            print(json.dumps(record))
+
+            if "error" in record:
+                parser.exit(1)
+
+        case "stats":
+            path = args.socket or client.get_socket_path()
+
+            try:
+                print(json.dumps(client.send_request({"op": "stats"}, path)))
+
+            except (FileNotFoundError, ConnectionRefusedError):
+                parser.exit(1, f"aoc: No service is listening on {path}.\n")
+
+            except (socket.timeout, ConnectionError) as e:
+                parser.exit(1, f"aoc: The service did not answer: {e}\n")
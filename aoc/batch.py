@@ -0,0 +1,93 @@
+"""
+This module solves the same day for many inputs in long-lived processes, so the
+interpreter startup and the import of the solver are paid once rather than once
+per input. Inputs are solved in the current process, or spread over a pool of
+worker processes, and one record is yielded per input as soon as it is solved.
+
+Each record holds the file, the answer to each part, the milliseconds spent
+reading, parsing and solving, and the error if the input could not be solved:
+
+    {"file": "inputs/a.txt", "part1": 24000, "part2": 45000, "ms": 0.42}
+
+Given a budget, a part that gives up adds its phase and progress to the record
+under "partial", so that one adversarial input cannot hold up a worker.
+
+Functions:
+- solve_file: Solves one input into a record.
+- run_batch: Solves many inputs and yields their records as they complete.
+"""
+
+from typing import Any, Dict, Generator, List, Optional, Sequence
+import concurrent.futures
+import functools
+
+from aoc import runner
+
+
+def solve_file(
+    year: int,
+    day: int,
+    filename: str,
+    engine: Optional[str] = None,
+    parts: Sequence[int] = (1, 2),
+    budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"file": filename}
+
+    try:
+        result = runner.run_solver(
+            year, day, filename, parts, engine=engine, budget=budget
+        )
+
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+
+    for part, answer in sorted(result.answers.items()):
+        record[f"part{part}"] = answer
+
+    if result.partial is not None:
+        record["partial"] = {"phase": result.partial.phase, **result.partial.progress}
+
+    record["ms"] = round(sum(result.timings.values()) * 1000, 3)
+    return record
+
+
+def run_batch(
+    year: int,
+    day: int,
+    filenames: List[str],
+    workers: int = 0,
+    engine: Optional[str] = None,
+    budget: Optional[float] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Solves a day for each input, in the current process or on a pool of
+    worker processes, and yields the record of each input as it completes.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        filenames (List[str]): The inputs to solve.
+        workers (int): The number of worker processes, or 0 to solve every
+        input in the current process, in order.
+        engine (Optional[str]): The alternative engine to solve the parts with.
+        budget (Optional[float]): The seconds each input may take before its
+        parts give up, or None to solve every input to completion.
+
+    Returns:
+        Generator[Dict[str, Any], None, None]: The record of each input.
+    """
+    solve = functools.partial(solve_file, year, day, engine=engine, budget=budget)
+
+    if workers == 0:
+        for filename in filenames:
+            yield solve(filename)
+
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve, filename) for filename in filenames]
+
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
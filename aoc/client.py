@@ -0,0 +1,147 @@
+"""
+This module is the client side of the solve service in aoc.service. It sends a
+request over the Unix socket of the service, and solves the request in the
+current process when no service is listening. It imports neither asyncio nor
+the process pool, so that a cold client starts about as fast as the interpreter.
+
+The socket is $AOC_SOCKET, or aoc.sock in $AOC_CACHE_DIR by default.
+
+Functions:
+- get_socket_path: Returns the socket of the service.
+- solve_request: Solves a request, within a time limit.
+- send_request: Sends a request to a running service.
+- solve: Solves a request through the service, or in-process without one.
+"""
+
+from typing import Any, Dict, List, Optional
+import contextlib
+import json
+import os
+import signal
+import socket
+import tempfile
+
+from aoc import registry
+
+
+# Seconds a request may take by default
+DEFAULT_TIMEOUT = 60.0
+
+# Extra seconds the daemon waits beyond the timeout enforced by the worker
+TIMEOUT_GRACE = 5.0
+
+
+def get_socket_path() -> str:
+    if "AOC_SOCKET" in os.environ:
+        return os.environ["AOC_SOCKET"]
+
+    return os.path.join(registry.get_cache_directory(), "aoc.sock")
+
+
+def raise_timeout(*_: object) -> None:
+    raise TimeoutError("The request took longer than its timeout.")
+
+
+def solve_request(
+    year: int,
+    day: int,
+    parts: List[int],
+    path: Optional[str],
+    text: Optional[str],
+    timeout: float,
+) -> Dict[str, Any]:
+    """
+    Solves a request, in a worker of the service or in the client. Input text
+    is written to a temporary file first, since the solvers read their input
+    from a file. An alarm interrupts the solver once the timeout has passed.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        parts (List[int]): The parts to solve.
+        path (Optional[str]): The input file, if the request names one.
+        text (Optional[str]): The input text, if the request carries it.
+        timeout (float): The seconds after which the solver is interrupted.
+
+    Returns:
+        Dict[str, Any]: The record of the input, with an error on timeout.
+    """
+    # The solvers are only imported once a request is solved here, so a client
+    # of a running service never loads them
+    from aoc import batch
+
+    with contextlib.ExitStack() as stack:
+        if text is not None:
+            directory = stack.enter_context(tempfile.TemporaryDirectory())
+            path = os.path.join(directory, "input.txt")
+
+            with open(path, "w") as f:
+                f.write(text)
+
+        assert path is not None
+
+        previous = signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+        try:
+            record = batch.solve_file(year, day, path, parts=parts)
+
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    if text is not None:
+        record.pop("file")
+
+    return record
+
+
+def send_request(
+    message: Dict[str, Any], path: str, timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    with socket.socket(socket.AF_UNIX) as connection:
+        connection.settimeout(timeout)
+        connection.connect(path)
+        connection.sendall(json.dumps(message).encode() + b"\n")
+
+        with connection.makefile("rb") as f:
+            line = f.readline()
+
+    if not line:
+        raise ConnectionError("The service closed the connection.")
+
+    response: Dict[str, Any] = json.loads(line)
+    return response
+
+
+# Solves a request through the service, falling back to solving it in the
+# current process when no service is listening
+def solve(message: Dict[str, Any], path: str) -> Dict[str, Any]:
+    timeout = float(message.get("timeout", DEFAULT_TIMEOUT))
+
+    try:
+        response = send_request(message, path, timeout + TIMEOUT_GRACE)
+        response["served"] = True
+        return response
+
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+
+    # A service that stops answering in time, or drops the connection, is
+    # reported as the error of the request. The request is not solved again
+    # here, as the service may still be solving it.
+    except (socket.timeout, ConnectionError) as e:
+        reason = str(e) or "The service did not answer."
+        return {"error": f"{type(e).__name__}: {reason}", "served": True}
+
+    part = message.get("part")
+    record = solve_request(
+        int(message["year"]),
+        int(message["day"]),
+        [int(part)] if part is not None else [1, 2],
+        message.get("path"),
+        message.get("input"),
+        timeout,
+    )
+    record["served"] = False
+    return record
@@ -0,0 +1,147 @@
+"""
+This module memoizes the answers of solvers, so re-running an unchanged solver
+on an unchanged input returns its answers without reading or solving anything.
+
+Each answer is keyed by the SHA-256 digest of the solver source, the digest of
+the input bytes, the part and the engine solving it. The solver source covers
+the day module and the shared modules of its source directory, such as
+helpers.py, so editing any of them invalidates the answers of the day without
+any bookkeeping. Parameters such as the expansion factor of 2023 day 11 or the
+wildcard rules of 2023 day 7 are fixed by the part, so the part stands in for
+them.
+
+The memo holds a bounded number of answers and evicts the least recently used
+first. It counts its hits and misses, and is stored in answers.json in
+$AOC_CACHE_DIR, or in ~/.cache/advent-of-code by default.
+
+Functions:
+- get_memo_path: Returns the file holding the stored answers.
+- hash_file: Computes the SHA-256 digest of a file.
+- list_sources: Lists the files whose source a day depends on.
+- hash_sources: Computes the digest of the source of a day.
+- create_key: Builds the key of an answer.
+"""
+
+from typing import Dict, List, Optional, Union
+import collections
+import hashlib
+import json
+import os
+import tempfile
+
+from aoc import registry
+
+
+# An answer is a number for most puzzles and text for the rest
+Answer = Union[int, str]
+
+# Default number of answers kept before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def get_memo_path() -> str:
+    return os.path.join(registry.get_cache_directory(), "answers.json")
+
+
+def hash_file(filename: str) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Lists the day module along with every module of its directory that is not
+# another day or a test, since any of them may be imported by the day
+def list_sources(year: int, day: int) -> List[str]:
+    directory = registry.get_source_directory(year)
+    sources = [os.path.join(directory, f"day_{day:02}.py")]
+
+    for name in sorted(os.listdir(directory)):
+        if (
+            name.endswith(".py")
+            and not name.startswith("test_")
+            and registry.DAY_PATTERN.fullmatch(name) is None
+        ):
+            sources.append(os.path.join(directory, name))
+
+    return sources
+
+
+def hash_sources(year: int, day: int) -> str:
+    digest = hashlib.sha256()
+
+    for filename in list_sources(year, day):
+        digest.update(os.path.basename(filename).encode())
+        digest.update(hash_file(filename).encode())
+
+    return digest.hexdigest()
+
+
+def create_key(source: str, digest: str, part: int, engine: Optional[str]) -> str:
+    return f"{source[:16]}:{digest[:16]}:{part}:{engine or ''}"
+
+
+class Memo:
+    """
+    Holds answers by key, from least to most recently used, evicting the least
+    recently used once more than max_entries are held.
+
+    Attributes:
+        max_entries (int): The number of answers kept.
+        entries (OrderedDict[str, Answer]): The answers by key.
+        hits (int): The number of lookups that found an answer.
+        misses (int): The number of lookups that did not.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.entries: collections.OrderedDict[str, Answer] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Answer]:
+        if key not in self.entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key: str, answer: Answer) -> None:
+        self.entries[key] = answer
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    @classmethod
+    def load(
+        cls, filename: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> "Memo":
+        memo = cls(max_entries)
+
+        try:
+            with open(filename or get_memo_path(), "r") as f:
+                entries: Dict[str, Answer] = json.load(f)
+
+        except (FileNotFoundError, json.JSONDecodeError):
+            return memo
+
+        for key, answer in entries.items():
+            memo.put(key, answer)
+
+        return memo
+
+    def save(self, filename: Optional[str] = None) -> None:
+        path = filename or get_memo_path()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        # Write to a temporary file first so concurrent runs never read a partial
+        # file, keeping the order of use for eviction
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+
+        with os.fdopen(descriptor, "w") as f:
+            json.dump(self.entries, f, indent=2)
+
+        os.replace(temporary_path, path)
@@ -0,0 +1,154 @@
+"""
+This module accounts for the memory of each phase of a run with tracemalloc.
+For every phase it records the peak of traced memory above the level at the
+start of the phase, the net change in bytes and in allocated blocks, and the
+source lines responsible for most of that change.
+
+The peak includes transient structures, such as candidate lists built and
+discarded inside a part, while the net change and the sites only show what a
+phase leaves allocated, such as the model built by parse. Tracing slows the
+solvers down severalfold, so the timings of a traced run are not comparable
+with untraced ones.
+
+Functions:
+- tracing: Traces allocations for the duration of a block.
+- begin_phase: Takes the snapshot a phase is measured against.
+- end_phase: Measures the memory of a phase since its snapshot.
+- format_size: Formats a number of bytes with a binary unit.
+- format_memory: Formats the memory of each phase for printing.
+"""
+
+from typing import Dict, Generator, List, Tuple
+import contextlib
+import dataclasses
+import os
+import tracemalloc
+
+from aoc import registry
+
+
+# Number of allocation sites kept for each phase
+TOP_SITES = 5
+
+# Allocations made while measuring rather than by the phase itself
+FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@dataclasses.dataclass
+class Site:
+    location: str
+    size: int
+    blocks: int
+
+
+@dataclasses.dataclass
+class PhaseMemory:
+    peak: int
+    size: int
+    blocks: int
+    sites: List[Site] = dataclasses.field(default_factory=list)
+
+
+# Starts tracing unless it is already on, in which case the caller that started
+# it remains in charge of stopping it
+@contextlib.contextmanager
+def tracing(enabled: bool = True) -> Generator[None, None, None]:
+    if not enabled or tracemalloc.is_tracing():
+        yield
+        return
+
+    tracemalloc.start()
+
+    try:
+        yield
+
+    finally:
+        tracemalloc.stop()
+
+
+def begin_phase() -> Tuple[tracemalloc.Snapshot, int]:
+    snapshot = tracemalloc.take_snapshot().filter_traces(FILTERS)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    return snapshot, current
+
+
+def end_phase(
+    begin: Tuple[tracemalloc.Snapshot, int], top: int = TOP_SITES
+) -> PhaseMemory:
+    """
+    Measures the memory of a phase against the snapshot taken at its start.
+
+    Args:
+        begin (Tuple[tracemalloc.Snapshot, int]): The snapshot and the traced
+        memory at the start of the phase.
+        top (int): The number of allocation sites to keep.
+
+    Returns:
+        PhaseMemory: The peak above the start, the net change in bytes and in
+        blocks, and the sites with the largest net growth.
+    """
+    _, peak = tracemalloc.get_traced_memory()
+    before, current = begin
+
+    differences = (
+        tracemalloc.take_snapshot().filter_traces(FILTERS).compare_to(before, "lineno")
+    )
+    sites = [
+        Site(
+            format_location(difference.traceback[0]),
+            difference.size_diff,
+            difference.count_diff,
+        )
+        for difference in differences
+        if difference.size_diff > 0
+    ]
+
+    return PhaseMemory(
+        max(0, peak - current),
+        sum(difference.size_diff for difference in differences),
+        sum(difference.count_diff for difference in differences),
+        sites[:top],
+    )
+
+
+# Shortens the files of the repository to their path from its root
+def format_location(frame: tracemalloc.Frame) -> str:
+    filename = frame.filename
+
+    if filename.startswith(registry.ROOT + os.sep):
+        filename = os.path.relpath(filename, registry.ROOT)
+
+    return f"{filename}:{frame.lineno}"
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+        size /= 1024
+
+    return f"{size:.1f} GiB"
+
+
+def format_memory(memory: Dict[str, PhaseMemory]) -> List[str]:
+    rows = []
+
+    for phase, usage in memory.items():
+        rows.append(
+            f"  {phase}: peak {format_size(usage.peak)},"
+            f" net {'+' if usage.size >= 0 else '-'}{format_size(abs(usage.size))}"
+            f" in {usage.blocks:+d} blocks"
+        )
+
+        for site in usage.sites:
+            rows.append(
+                f"    {site.location}  +{format_size(site.size)}"
+                f" in {site.blocks:+d} blocks"
+            )
+
+    return rows
@@ -0,0 +1,173 @@
+"""
+This module samples the stack of a running solver at a fixed interval of CPU
+time, using a profiling signal timer. Unlike cProfile, which traces every call
+and skews tight loops of small calls, a sampler only pays for each sample, so
+the relative cost of the functions is preserved.
+
+The samples are written as collapsed stacks, one line per distinct stack with
+its number of samples, which flamegraph.pl and most flame graph viewers read,
+and as speedscope JSON, which https://www.speedscope.app opens directly.
+
+Signal timers are only available on Unix, and only in the main thread. The
+kernel may deliver them less often than requested, so speedscope weights each
+sample by the CPU time actually spent per sample rather than by the interval.
+
+Functions:
+- create_frame: Describes the code of a stack frame.
+- format_frame: Formats a frame for a collapsed stack.
+- write_collapsed: Writes the samples of a phase as collapsed stacks.
+- write_speedscope: Writes the samples of every phase as speedscope JSON.
+"""
+
+from typing import Any, Counter, Dict, List, Optional, Tuple
+import collections
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import types
+
+from aoc import registry
+
+
+# A frame is the (function, file, first line) of its code
+Frame = Tuple[str, str, int]
+
+# A stack lists frames from the outermost call inwards
+Stack = Tuple[Frame, ...]
+
+# Seconds of CPU time between samples
+DEFAULT_INTERVAL = 0.001
+
+
+def create_frame(frame: types.FrameType) -> Frame:
+    code = frame.f_code
+    filename = code.co_filename
+
+    if filename.startswith(registry.ROOT + os.sep):
+        filename = os.path.relpath(filename, registry.ROOT)
+
+    return code.co_name, filename, code.co_firstlineno
+
+
+def format_frame(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({filename}:{line})"
+
+
+class Sampler:
+    """
+    Samples the stack while used as a context manager. Only the frames called
+    from the function that entered the sampler are kept, so the stacks start at
+    the profiled code rather than at the interpreter.
+
+    Attributes:
+        interval (float): The seconds of CPU time between samples.
+        skip (int): The number of outermost frames left out of the stacks, such
+        as a lambda wrapping the profiled call.
+        samples (Counter[Stack]): The number of samples of each stack.
+        elapsed (float): The seconds of CPU time spent while sampling.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, skip: int = 0) -> None:
+        self.interval = interval
+        self.skip = skip
+        self.samples: Counter[Stack] = collections.Counter()
+        self.elapsed = 0.0
+        self.root: Optional[types.FrameType] = None
+        self.previous: Any = None
+
+    def __enter__(self) -> "Sampler":
+        if not hasattr(signal, "setitimer"):
+            raise ValueError("Profiling needs signal timers, which are Unix only.")
+
+        if threading.current_thread() is not threading.main_thread():
+            raise ValueError("Profiling is only possible in the main thread.")
+
+        self.root = sys._getframe(1)
+        self.previous = signal.signal(signal.SIGPROF, self.sample)
+        self.elapsed -= time.process_time()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        self.elapsed += time.process_time()
+        signal.signal(signal.SIGPROF, self.previous)
+        self.root = None
+
+    def sample(self, _: int, frame: Optional[types.FrameType]) -> None:
+        frames: List[types.FrameType] = []
+
+        while frame is not None and frame is not self.root:
+            frames.append(frame)
+            frame = frame.f_back
+
+        # Samples taken outside of the profiled call are dropped
+        if frame is None:
+            return
+
+        outermost = len(frames) - self.skip
+        self.samples[tuple(create_frame(f) for f in reversed(frames[:outermost]))] += 1
+
+
+def write_collapsed(sampler: Sampler, root: str, filename: str) -> None:
+    with open(filename, "w") as f:
+        for stack, count in sampler.samples.most_common():
+            names = [root] + [format_frame(frame) for frame in stack]
+            f.write(f"{';'.join(names)} {count}\n")
+
+
+def write_speedscope(profiles: Dict[str, Sampler], name: str, filename: str) -> None:
+    """
+    Writes the samples of every phase as a sampled profile of a speedscope
+    file, sharing the frames between phases. Each sample is weighted by the
+    CPU time of its phase divided by the number of samples of the phase.
+
+    Args:
+        profiles (Dict[str, Sampler]): The sampler of each phase.
+        name (str): The name of the file shown by speedscope.
+        filename (str): The file to write.
+    """
+    frames: Dict[Frame, int] = {}
+    documents = []
+
+    for phase, sampler in profiles.items():
+        stacks = []
+        weights = []
+        weight = sampler.elapsed / max(1, sum(sampler.samples.values()))
+
+        for stack, count in sampler.samples.items():
+            stacks.append([frames.setdefault(frame, len(frames)) for frame in stack])
+            weights.append(count * weight)
+
+        documents.append(
+            {
+                "type": "sampled",
+                "name": phase,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": stacks,
+                "weights": weights,
+            }
+        )
+
+    with open(filename, "w") as f:
+        json.dump(
+            {
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "name": name,
+                "exporter": "aoc",
+                "shared": {
+                    "frames": [
+                        {"name": frame_name, "file": frame_file, "line": line}
+                        for frame_name, frame_file, line in frames
+                    ]
+                },
+                "profiles": documents,
+            },
+            f,
+        )
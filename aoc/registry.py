@@ -0,0 +1,293 @@
+"""
+This module discovers the solvers of every year and loads them on demand. A
+solver is a day module following the Solver protocol: parse(lines) builds a
+model, part_1(model) and optionally part_2(model) solve the parts from it, and
+optionally fused(model) solves both parts in a single pass over the model.
+Parts whose loops may run for a long time also take an optional deadline, and
+give up by raising a TimeoutError holding their progress once it has passed. A
+solver may also offer alternative implementations of its parts in ENGINES, a
+dictionary mapping each engine name to the parts it replaces. A solver whose
+input has a columnar encoding, written by the 2023 columnar module, builds its
+model from the loaded columns with decode_columns(columns). A solver whose
+lines are independent records may also solve its parts with stream(lines),
+folding each line into an accumulator as it is read and returning the answer
+of each part in order, so that its memory does not grow with the input.
+
+The 2023 modules import their siblings as top-level modules, so they are
+imported by name with their source directory on sys.path. The 2022 modules are
+standalone scripts sharing the same file names, so they are loaded from their
+files under names prefixed with the year.
+
+Functions:
+- get_source_directory: Returns the directory holding the day modules of a year.
+- get_input_path: Returns the default input of a day.
+- get_cache_directory: Returns the directory shared by the caches of every
+  tool.
+- list_years: Lists the years with at least one day module.
+- list_days: Lists the days of a year with a day module.
+- load_solver: Imports the day module of a year and day.
+- list_engines: Lists the alternative engines of a solver.
+- get_part: Returns the function solving a part with an engine.
+- get_fused: Returns the function solving both parts at once, if any.
+- accepts_deadline: Returns whether a part can be given a deadline.
+- read_lines: Reads the lines of an input as the solvers of a year expect them.
+- generate_stream_lines: Yields the lines of an input or of stdin, read in
+  chunks of a fixed size.
+- is_columnar: Returns whether an input is a columnar file.
+- read_columns: Maps the columns of a columnar input into memory.
+- load_parse_cache: Imports the parse cache shared with the 2023 scripts.
+"""
+
+from typing import Any, Callable, Dict, Generator, List, Optional, Protocol, Tuple
+import importlib
+import importlib.util
+import os
+import re
+import sys
+import types
+
+
+# Root of the repository, holding one directory per year
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Years whose day modules are scripts loaded from their files
+SCRIPT_YEARS = (2022,)
+
+# Suffix of inputs converted by the columnar module of 2023
+COLUMNAR_SUFFIX = ".col"
+
+# Year whose source directory holds the parse cache
+CACHE_YEAR = 2023
+
+# Input name standing for stdin when streaming
+STDIN = "-"
+
+# Bytes read at a time when streaming an input
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Pattern matching the file name of a day module
+DAY_PATTERN = re.compile(r"day_(\d\d)\.py")
+
+
+class Solver(Protocol):
+    def parse(self, lines: List[str]) -> Any: ...
+
+    def part_1(self, model: Any) -> Any: ...
+
+
+class FusedSolver(Solver, Protocol):
+    def fused(self, model: Any) -> Tuple[Any, Any]: ...
+
+
+def get_source_directory(year: int) -> str:
+    return os.path.join(ROOT, str(year), "src")
+
+
+def get_input_path(year: int, day: int) -> str:
+    return os.path.join(ROOT, str(year), "data", f"day_{day:02}.txt")
+
+
+# The parse cache, memoized answers, timings, benchmark history and service
+# socket all live in $AOC_CACHE_DIR, or in ~/.cache/advent-of-code by default
+def get_cache_directory() -> str:
+    return os.environ.get(
+        "AOC_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "advent-of-code"),
+    )
+
+
+def list_years() -> List[int]:
+    return sorted(
+        int(name)
+        for name in os.listdir(ROOT)
+        if name.isdigit() and len(list_days(int(name))) > 0
+    )
+
+
+def list_days(year: int) -> List[int]:
+    directory = get_source_directory(year)
+
+    if not os.path.isdir(directory):
+        return []
+
+    days = []
+
+    for name in os.listdir(directory):
+        match = DAY_PATTERN.fullmatch(name)
+
+        if match is not None:
+            days.append(int(match.group(1)))
+
+    return sorted(days)
+
+
+def load_solver(year: int, day: int) -> types.ModuleType:
+    """
+    Imports the day module of a year and day, checking that it exposes the
+    solver interface.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+
+    Returns:
+        types.ModuleType: The day module.
+    """
+    if day not in list_days(year):
+        raise ValueError(f"No solver for {year} day {day}.")
+
+    directory = get_source_directory(year)
+
+    if year in SCRIPT_YEARS:
+        name = f"y{year}_day_{day:02}"
+
+        if name not in sys.modules:
+            path = os.path.join(directory, f"day_{day:02}.py")
+            spec = importlib.util.spec_from_file_location(name, path)
+            assert spec is not None and spec.loader is not None
+
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+
+        module = sys.modules[name]
+
+    else:
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+
+        module = importlib.import_module(f"day_{day:02}")
+
+    for attribute in ("parse", "part_1"):
+        if not hasattr(module, attribute):
+            raise ValueError(f"Solver for {year} day {day} has no {attribute}.")
+
+    return module
+
+
+def list_engines(module: types.ModuleType) -> List[str]:
+    return sorted(getattr(module, "ENGINES", {}))
+
+
+# Returns the function solving a part, taking it from an engine when the engine
+# replaces that part, and None when the solver does not implement the part
+def get_part(
+    module: types.ModuleType, part: int, engine: Optional[str] = None
+) -> Optional[Callable[[Any], Any]]:
+    if engine is not None:
+        engines = getattr(module, "ENGINES", {})
+
+        if engine not in engines:
+            raise ValueError(f"Unknown engine {engine} for {module.__name__}.")
+
+        if part in engines[engine]:
+            return engines[engine][part]  # type: ignore[no-any-return]
+
+    return getattr(module, f"part_{part}", None)
+
+
+# Returns the function solving both parts in one pass, unless the solver has
+# none or the engine replaces one of the parts it would compute
+def get_fused(
+    module: types.ModuleType, engine: Optional[str] = None
+) -> Optional[Callable[[Any], Tuple[Any, Any]]]:
+    if engine is not None and len(getattr(module, "ENGINES", {}).get(engine, {})) > 0:
+        return None
+
+    return getattr(module, "fused", None)
+
+
+# Returns whether a function takes a deadline, as the parts of solvers with long
+# running loops do
+def accepts_deadline(function: Callable[..., Any]) -> bool:
+    # Imported here, as the client reads its socket path from this module and
+    # would otherwise import inspect on every cold start
+    import inspect
+
+    return "deadline" in inspect.signature(function).parameters
+
+
+# Reads an input, stripping lines the same way as the solvers of the year do
+def read_lines(year: int, filename: str) -> List[str]:
+    with open(filename, "r") as f:
+        if year in SCRIPT_YEARS:
+            # Leading whitespace is significant, e.g. in the 2022 day 5 stacks
+            return [line.rstrip("\n") for line in f]
+
+        return [line.strip() for line in f]
+
+
+# Reads an input in chunks of a fixed size, so that memory stays bounded by the
+# chunk size and the longest line however large the input, and works the same
+# on files, pipes and stdin
+def generate_stream_lines(
+    year: int, filename: str, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Generator[str, None, None]:
+    f = sys.stdin.buffer if filename == STDIN else open(filename, "rb")
+    tail = b""
+
+    # Lines are stripped as read_lines strips them
+    def decode(line: bytes) -> str:
+        return (line.rstrip(b"\r") if year in SCRIPT_YEARS else line.strip()).decode()
+
+    try:
+        while chunk := f.read(chunk_size):
+            lines = (tail + chunk).split(b"\n")
+
+            # The last piece is the start of a line continued by the next chunk
+            tail = lines.pop()
+
+            for line in lines:
+                yield decode(line)
+
+        if tail:
+            yield decode(tail)
+
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+def is_columnar(filename: str) -> bool:
+    return filename.endswith(COLUMNAR_SUFFIX)
+
+
+def read_columns(year: int, day: int, filename: str) -> Dict[str, memoryview]:
+    """
+    Maps the columns of a columnar input into memory, checking that the input
+    was converted for the day and that its solver can decode it.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        filename (str): The columnar input.
+
+    Returns:
+        Dict[str, memoryview]: The columns by name.
+    """
+    module = load_solver(year, day)
+
+    if not hasattr(module, "decode_columns"):
+        raise ValueError(f"Solver for {year} day {day} has no columnar decoding.")
+
+    # The columnar module lives beside the solvers, which load_solver put on
+    # the path
+    columnar = importlib.import_module("columnar")
+    columns_day, columns = columnar.load_columns(filename)
+
+    if columns_day != day:
+        raise ValueError(f"{filename} holds the input of day {columns_day}.")
+
+    result: Dict[str, memoryview] = columns
+    return result
+
+
+# The parse cache lives beside the 2023 solvers, which import it as a sibling
+# when run as scripts, so it is imported from their directory for every year
+def load_parse_cache() -> types.ModuleType:
+    directory = get_source_directory(CACHE_YEAR)
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    return importlib.import_module("cache")
@@ -0,0 +1,365 @@
+"""
+This module runs a solver on an input and times each phase. The input is read
+once, parsed once, and the parsed model is passed to each requested part, or to
+the fused function of the solver when both parts are requested. A columnar
+input is mapped into memory and decoded by the solver instead. The memory of
+each phase is optionally traced as well, and the stack of each phase
+optionally sampled. Given a memo, parts answered by an earlier run of the same
+source on the same input are taken from the memo instead of being solved. Given
+a budget, parts that take a deadline give up once it has passed, and the run
+returns the answers found so far along with the progress of the part that gave
+up. Given the parse cache, the model of a text input is loaded from the cache
+when the same solver source parsed the same input before, keyed by the digest
+of the source as the memo is.
+
+Functions:
+- run_solver: Runs the parts of a solver and records answers and timings.
+- format_result: Formats the answers and timings of a run for printing.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+import contextlib
+import dataclasses
+import io
+import time
+
+from aoc import memoize
+from aoc import memory
+from aoc import profiler
+from aoc import registry
+
+
+T = TypeVar("T")
+
+# An answer is a number for most puzzles and text for the rest
+Answer = Union[int, str]
+
+# Phases of a run, in the order they are timed
+PHASES = ("memo", "read", "parse", "stream", "fused", "part_1", "part_2")
+
+
+@dataclasses.dataclass
+class Partial:
+    phase: str
+    progress: Dict[str, Any]
+
+
+@dataclasses.dataclass
+class Result:
+    year: int
+    day: int
+    filename: str
+    engine: Optional[str] = None
+    answers: Dict[int, Answer] = dataclasses.field(default_factory=dict)
+    timings: Dict[str, float] = dataclasses.field(default_factory=dict)
+    allocations: Optional[Dict[str, memory.PhaseMemory]] = None
+    profiles: Optional[Dict[str, profiler.Sampler]] = None
+    memoized: List[int] = dataclasses.field(default_factory=list)
+    partial: Optional[Partial] = None
+    error: Optional[str] = None
+
+
+# Calls a function and records its elapsed time in seconds under a phase, along
+# with its memory when the run traces memory and its stacks when it is profiled
+def time_phase(
+    result: Result,
+    phase: str,
+    function: Callable[[], T],
+    profile_interval: Optional[float] = None,
+    skip: int = 1,
+) -> T:
+    begin = memory.begin_phase() if result.allocations is not None else None
+
+    # The stacks start inside the function, leaving out the lambda wrapping it
+    # and any of the runner's own frames it calls through
+    sampler = (
+        profiler.Sampler(profile_interval, skip=skip)
+        if profile_interval is not None
+        else None
+    )
+
+    start = time.perf_counter()
+
+    with sampler or contextlib.nullcontext():
+        value = function()
+
+    result.timings[phase] = time.perf_counter() - start
+
+    if result.allocations is not None and begin is not None:
+        result.allocations[phase] = memory.end_phase(begin)
+
+    if result.profiles is not None and sampler is not None:
+        result.profiles[phase] = sampler
+
+    return value
+
+
+# Calls a part, passing the deadline along when the part takes one
+def call_part(function: Callable[..., T], model: Any, deadline: Optional[float]) -> T:
+    if deadline is not None and registry.accepts_deadline(function):
+        return function(model, deadline=deadline)
+
+    return function(model)
+
+
+def run_solver(
+    year: int,
+    day: int,
+    filename: Optional[str] = None,
+    parts: Sequence[int] = (1, 2),
+    verbose: bool = False,
+    engine: Optional[str] = None,
+    trace_memory: bool = False,
+    profile_interval: Optional[float] = None,
+    fuse: bool = True,
+    memo: Optional[memoize.Memo] = None,
+    budget: Optional[float] = None,
+    stream: bool = False,
+    parse_cache: bool = False,
+) -> Result:
+    """
+    Runs the requested parts of a solver on an input. The input is read and
+    parsed once, and the parsed model is shared by the parts.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        filename (Optional[str]): The input, defaulting to the input of the day
+        in the data directory of the year.
+        parts (Sequence[int]): The parts to run. Parts the solver does not
+        implement are skipped.
+        verbose (bool): Whether to let the solver print to stdout.
+        engine (Optional[str]): The alternative engine to solve the parts with,
+        where the solver offers one.
+        trace_memory (bool): Whether to trace the memory of each phase, which
+        slows the phases down.
+        profile_interval (Optional[float]): The seconds of CPU time between
+        samples of the stack of each phase, or None not to profile.
+        fuse (bool): Whether to solve both parts in a single fused phase, where
+        the solver offers one and both parts are requested.
+        memo (Optional[memoize.Memo]): The memo to take answers from and store
+        new answers in, or None to solve every part.
+        budget (Optional[float]): The seconds the run may take before parts
+        taking a deadline give up, or None to run them to completion.
+        stream (bool): Whether to fold the input into the answers line by line
+        as it is read, where the solver can. The input may then be stdin.
+        parse_cache (bool): Whether to load the parsed model of a text input
+        from the parse cache, parsing and storing it on a miss. The input is
+        then only read on a miss, within the parse phase.
+
+    Returns:
+        Result: The answers keyed by part, and the timings and optionally the
+        memory and stack samples keyed by phase. A part that gave up has no
+        answer, and its progress is in the partial result.
+    """
+    deadline = time.perf_counter() + budget if budget is not None else None
+    module = registry.load_solver(year, day)
+    filename = filename or registry.get_input_path(year, day)
+    result = Result(year, day, filename, engine)
+    solvers = {part: registry.get_part(module, part, engine) for part in parts}
+    keys: Dict[int, str] = {}
+    fused = registry.get_fused(module, engine) if fuse else None
+
+    if stream:
+        if not hasattr(module, "stream"):
+            raise ValueError(f"Solver for {year} day {day} cannot stream its input.")
+
+        if engine is not None or registry.is_columnar(filename):
+            raise ValueError("Streamed inputs are text solved without engines.")
+
+        if memo is not None and filename == registry.STDIN:
+            raise ValueError("Answers for stdin cannot be memoized.")
+
+        if parse_cache:
+            raise ValueError("Streamed inputs have no parsed model to cache.")
+
+    if trace_memory:
+        result.allocations = {}
+
+    if profile_interval is not None:
+        result.profiles = {}
+
+    # Some solvers print progress while solving, which would drown the report
+    output = (
+        contextlib.nullcontext()
+        if verbose
+        else contextlib.redirect_stdout(io.StringIO())
+    )
+
+    if memo is not None:
+        keys = time_phase(
+            result, "memo", lambda: create_keys(year, day, filename, solvers, engine)
+        )
+
+        for part, key in keys.items():
+            answer = memo.get(key)
+
+            if answer is not None:
+                result.answers[part] = answer
+                result.memoized.append(part)
+                del solvers[part]
+
+        # Every part was answered, so the input is neither read nor parsed
+        if all(solve is None for solve in solvers.values()):
+            return result
+
+    with output, memory.tracing(trace_memory):
+        # A streamed input is read and solved in a single phase, so it has no
+        # model for the parts
+        if stream:
+            answers = time_phase(
+                result,
+                "stream",
+                lambda: module.stream(registry.generate_stream_lines(year, filename)),
+                profile_interval,
+            )
+
+            for part, answer in enumerate(answers, start=1):
+                if solvers.get(part) is not None:
+                    result.answers[part] = answer
+
+            # Every part is answered, leaving none to solve from a model
+            solvers = {}
+
+        # A columnar input is mapped rather than read, and decoded rather than
+        # parsed
+        elif registry.is_columnar(filename):
+            columns = time_phase(
+                result,
+                "read",
+                lambda: registry.read_columns(year, day, filename),
+                profile_interval,
+            )
+            model = time_phase(
+                result,
+                "parse",
+                lambda: module.decode_columns(columns),
+                profile_interval,
+            )
+
+        elif parse_cache:
+            model = time_phase(
+                result,
+                "parse",
+                lambda: load_or_parse(year, day, module, filename),
+                profile_interval,
+            )
+
+        else:
+            lines = time_phase(
+                result,
+                "read",
+                lambda: registry.read_lines(year, filename),
+                profile_interval,
+            )
+            model = time_phase(
+                result, "parse", lambda: module.parse(lines), profile_interval
+            )
+
+        phase = "fused"
+
+        try:
+            if fused is not None and set(solvers) == {1, 2}:
+                result.answers[1], result.answers[2] = time_phase(
+                    result,
+                    phase,
+                    lambda: call_part(fused, model, deadline),
+                    profile_interval,
+                    skip=2,
+                )
+
+            else:
+                for part, solve in solvers.items():
+                    if solve is not None:
+                        phase = f"part_{part}"
+                        result.answers[part] = time_phase(
+                            result,
+                            phase,
+                            lambda: call_part(solve, model, deadline),
+                            profile_interval,
+                            skip=2,
+                        )
+
+        except TimeoutError as e:
+            # Only a part giving up at the deadline carries its progress
+            if deadline is None or not (e.args and isinstance(e.args[0], dict)):
+                raise
+
+            result.partial = Partial(phase, e.args[0])
+
+    if memo is not None:
+        for part, key in keys.items():
+            if part in result.answers and part not in result.memoized:
+                memo.put(key, result.answers[part])
+
+    return result
+
+
+# Builds the memo key of each part the solver implements
+def create_keys(
+    year: int,
+    day: int,
+    filename: str,
+    solvers: Dict[int, Optional[Callable[[Any], Any]]],
+    engine: Optional[str],
+) -> Dict[int, str]:
+    source = memoize.hash_sources(year, day)
+    digest = memoize.hash_file(filename)
+
+    return {
+        part: memoize.create_key(source, digest, part, engine)
+        for part, solve in solvers.items()
+        if solve is not None
+    }
+
+
+# Loads the parsed model of an input from the parse cache, versioned by the
+# digest of the solver source so that editing the solver parses the input again
+def load_or_parse(year: int, day: int, module: Any, filename: str) -> Any:
+    cache = registry.load_parse_cache()
+    version = memoize.hash_sources(year, day)[:16]
+
+    return cache.load_or_parse(
+        filename,
+        module.parse,
+        version,
+        lambda name: registry.read_lines(year, name),
+    )
+
+
+def format_result(result: Result) -> str:
+    rows = [f"{result.year} day {result.day:02}"]
+
+    if result.engine is not None:
+        rows[0] += f" ({result.engine})"
+
+    if result.error is not None:
+        rows.append(f"  error: {result.error.rstrip().splitlines()[-1]}")
+        return "\n".join(rows)
+
+    for part, answer in sorted(result.answers.items()):
+        # Multi-line answers, such as letters drawn on a screen, start on a new line
+        text = f"\n{answer}" if isinstance(answer, str) and "\n" in answer else answer
+        rows.append(f"  part {part}: {text}")
+
+    timings = "  ".join(
+        f"{phase} {result.timings[phase] * 1000:.1f} ms"
+        for phase in PHASES
+        if phase in result.timings
+    )
+    rows.append(f"  {timings}")
+
+    if result.partial is not None:
+        progress = " ".join(
+            f"{name}={value}" for name, value in result.partial.progress.items()
+        )
+        rows.append(f"  partial: {result.partial.phase} gave up, {progress}")
+
+    if len(result.memoized) > 0:
+        parts = ", ".join(str(part) for part in sorted(result.memoized))
+        rows.append(f"  memoized: part {parts}")
+
+    if result.allocations is not None:
+        rows += memory.format_memory(result.allocations)
+
+    return "\n".join(rows)
@@ -0,0 +1,117 @@
+"""
+This module runs many solvers in parallel on a process pool. Jobs are submitted
+longest first, using the timings stored by earlier runs, so the slowest solvers
+start immediately instead of holding up the end of the run. Results are yielded
+as soon as each job completes.
+
+The timings are stored in timings.json in $AOC_CACHE_DIR, or in
+~/.cache/advent-of-code by default.
+
+Functions:
+- get_timings_path: Returns the file holding the stored timings.
+- load_timings: Loads the stored total time of each job.
+- save_timings: Stores the total time of each job.
+- order_jobs: Orders jobs from longest to shortest stored time.
+- run_job: Runs a single job, capturing any error in its result.
+- run_all: Runs jobs on a process pool and yields results as they complete.
+"""
+
+from typing import Dict, Generator, List, Optional, Tuple
+import concurrent.futures
+import json
+import os
+import tempfile
+import traceback
+
+from aoc import registry
+from aoc import runner
+
+
+# A job is a (year, day) pair
+Job = Tuple[int, int]
+
+
+def get_timings_path() -> str:
+    return os.path.join(registry.get_cache_directory(), "timings.json")
+
+
+def create_key(job: Job) -> str:
+    year, day = job
+    return f"{year}/{day:02}"
+
+
+def load_timings() -> Dict[str, float]:
+    try:
+        with open(get_timings_path(), "r") as f:
+            timings = json.load(f)
+
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    return {key: float(value) for key, value in timings.items()}
+
+
+def save_timings(timings: Dict[str, float]) -> None:
+    path = get_timings_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file first so concurrent runs never read a partial file
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), suffix=".tmp"
+    )
+
+    with os.fdopen(descriptor, "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+    os.replace(temporary_path, path)
+
+
+# Orders jobs longest first, placing jobs without a stored time at the front
+def order_jobs(jobs: List[Job], timings: Dict[str, float]) -> List[Job]:
+    return sorted(jobs, key=lambda job: -timings.get(create_key(job), float("inf")))
+
+
+def run_job(job: Job) -> runner.Result:
+    year, day = job
+
+    try:
+        return runner.run_solver(year, day)
+
+    except Exception:
+        result = runner.Result(year, day, "")
+        result.error = traceback.format_exc()
+        return result
+
+
+def run_all(
+    jobs: List[Job], workers: Optional[int] = None
+) -> Generator[runner.Result, None, None]:
+    """
+    Runs jobs on a process pool, longest stored time first, and yields each
+    result as soon as its job completes. The total time of every successful
+    job is stored for ordering later runs.
+
+    Args:
+        jobs (List[Job]): The (year, day) pairs to run.
+        workers (Optional[int]): The maximum number of worker processes,
+        defaulting to the number of CPUs.
+
+    Returns:
+        Generator[runner.Result, None, None]: The results in completion order.
+    """
+    timings = load_timings()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_job, job) for job in order_jobs(jobs, timings)]
+
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+
+            if result.error is None:
+                timings[create_key((result.year, result.day))] = sum(
+                    result.timings.values()
+                )
+
+            yield result
+
+    save_timings(timings)
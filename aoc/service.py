@@ -0,0 +1,340 @@
+"""
+This module runs a local solve service on a Unix domain socket. The daemon keeps
+a pool of worker processes that import every solver once at startup, so the
+module-level tables of the solvers, such as compiled record layouts, stay warm
+between requests. There is no network listener.
+
+Requests and responses are JSON objects, one per line. A solve request names the
+puzzle and either the path of an input or the input text itself:
+
+    {"year": 2023, "day": 7, "part": 1, "path": "2023/data/day_07.txt"}
+    {"year": 2023, "day": 7, "input": "32T3K 765\\n..."}
+
+and is answered with the record of aoc.batch, plus the latency of the request in
+milliseconds. The request {"op": "stats"}, or the line /stats, is answered with
+the counters of the service and percentiles of the recent latencies.
+
+At most max_concurrency requests are solved at once, and at most max_queue more
+wait for a slot, beyond which requests are rejected. Each request is limited to
+a timeout, enforced inside the worker by an alarm signal so the worker is freed
+for the next request, and by the daemon as a backstop. A request given up by the
+daemon keeps its slot until its worker is done with it, so that a stuck worker
+is never counted as free. A pool broken by a worker that died is replaced by a
+new one, and the requests it was solving are answered with an error.
+
+Requests are sent with aoc.client, which falls back to solving in-process when
+the service is not running.
+
+Functions:
+- warm_worker: Imports every solver in a worker process.
+- summarise_latencies: Computes percentiles of latencies.
+- serve: Runs the service until cancelled.
+"""
+
+from typing import Any, Callable, Collection, Dict, Optional, Tuple
+import asyncio
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import contextlib
+import functools
+import importlib
+import json
+import os
+import socket
+import statistics
+import time
+
+from aoc import client
+from aoc import registry
+
+
+# Number of recent latencies kept for the percentiles
+LATENCY_WINDOW = 1000
+
+
+def warm_worker() -> None:
+    importlib.import_module("aoc.batch")
+
+    for year in registry.list_years():
+        for day in registry.list_days(year):
+            registry.load_solver(year, day)
+
+
+def summarise_latencies(latencies: Collection[float]) -> Dict[str, float]:
+    if len(latencies) == 0:
+        return {}
+
+    if len(latencies) == 1:
+        latency = next(iter(latencies))
+        return {"p50_ms": latency, "p90_ms": latency, "p99_ms": latency}
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50_ms": cuts[49], "p90_ms": cuts[89], "p99_ms": cuts[98]}
+
+
+class Service:
+    """
+    Dispatches the requests of every connection to a pool of warm workers,
+    limiting how many are solved and queued at once.
+
+    Attributes:
+        create_executor (Callable[[], concurrent.futures.ProcessPoolExecutor]):
+        Starts a worker pool, at startup and whenever the pool breaks.
+        executor (concurrent.futures.ProcessPoolExecutor): The worker pool.
+        max_concurrency (int): The number of requests solved at once.
+        max_queue (int): The number of requests waiting for a slot.
+        timeout (float): The default seconds a request may take.
+        counters (Dict[str, int]): The number of requests by outcome.
+        latencies (Deque[float]): The recent latencies in milliseconds.
+    """
+
+    def __init__(
+        self,
+        create_executor: Callable[[], concurrent.futures.ProcessPoolExecutor],
+        max_concurrency: int,
+        max_queue: int,
+        timeout: float,
+    ) -> None:
+        self.create_executor = create_executor
+        self.executor = create_executor()
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self.slots = asyncio.Semaphore(max_concurrency)
+        self.queued = 0
+        self.running = 0
+        self.started = time.time()
+
+        self.counters = collections.Counter(
+            {
+                "requests": 0,
+                "solved": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "rejected": 0,
+                "restarts": 0,
+            }
+        )
+        self.latencies: collections.deque[float] = collections.deque(
+            maxlen=LATENCY_WINDOW
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "running": self.running,
+            "queued": self.queued,
+            "uptime_s": round(time.time() - self.started, 3),
+            **summarise_latencies(self.latencies),
+        }
+
+    # Replaces a pool broken by a worker that died, unless a request that saw
+    # the same pool break has replaced it already
+    def restart_executor(
+        self, executor: concurrent.futures.ProcessPoolExecutor
+    ) -> None:
+        if executor is not self.executor:
+            return
+
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = self.create_executor()
+        self.counters["restarts"] += 1
+
+    def submit(
+        self, request: Tuple[Any, ...]
+    ) -> Tuple[
+        concurrent.futures.ProcessPoolExecutor, "asyncio.Future[Dict[str, Any]]"
+    ]:
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+
+        try:
+            future = loop.run_in_executor(executor, client.solve_request, *request)
+
+        # A pool that broke after its last request is only found out here
+        except concurrent.futures.process.BrokenProcessPool:
+            self.restart_executor(executor)
+            executor = self.executor
+            future = loop.run_in_executor(executor, client.solve_request, *request)
+
+        return executor, future
+
+    # Frees the slot of a request once its worker is done with it
+    def release(
+        self,
+        executor: concurrent.futures.ProcessPoolExecutor,
+        future: "asyncio.Future[Dict[str, Any]]",
+    ) -> None:
+        self.running -= 1
+        self.slots.release()
+
+        if not future.cancelled() and isinstance(
+            future.exception(), concurrent.futures.process.BrokenProcessPool
+        ):
+            self.restart_executor(executor)
+
+    async def solve(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        self.counters["requests"] += 1
+
+        # Requests beyond the queue limit are turned away rather than delayed
+        if self.slots.locked() and self.queued >= self.max_queue:
+            self.counters["rejected"] += 1
+            return {"error": "The service is busy."}
+
+        timeout = float(message.get("timeout", self.timeout))
+        part = message.get("part")
+        request = (
+            int(message["year"]),
+            int(message["day"]),
+            [int(part)] if part is not None else [1, 2],
+            message.get("path"),
+            message.get("input"),
+            timeout,
+        )
+
+        if request[3] is None and request[4] is None:
+            raise ValueError("A request needs a path or an input.")
+
+        self.queued += 1
+
+        try:
+            await self.slots.acquire()
+
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+
+        try:
+            executor, future = self.submit(request)
+
+        except BaseException:
+            self.running -= 1
+            self.slots.release()
+            raise
+
+        # The slot is held until the worker is done, even once the daemon stops
+        # waiting for the request, so a worker past its timeout is not handed
+        # another request
+        future.add_done_callback(functools.partial(self.release, executor))
+
+        try:
+            record = await asyncio.wait_for(
+                asyncio.shield(future), timeout + client.TIMEOUT_GRACE
+            )
+
+        except asyncio.TimeoutError:
+            record = {"error": "TimeoutError: The request did not complete."}
+
+        except concurrent.futures.process.BrokenProcessPool:
+            record = {"error": "BrokenProcessPool: A worker died during the request."}
+
+        if "error" not in record:
+            self.counters["solved"] += 1
+
+        elif record["error"].startswith("TimeoutError"):
+            self.counters["timeouts"] += 1
+
+        else:
+            self.counters["errors"] += 1
+
+        record["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        self.latencies.append(record["latency_ms"])
+        return record
+
+    async def respond(self, line: bytes) -> Dict[str, Any]:
+        if line.strip() == b"/stats":
+            return self.get_stats()
+
+        try:
+            message = json.loads(line)
+
+            if not isinstance(message, dict):
+                raise ValueError("A request must be an object.")
+
+            if message.get("op", "solve") == "stats":
+                return self.get_stats()
+
+            return await self.solve(message)
+
+        except (ValueError, KeyError, TypeError) as e:
+            self.counters["errors"] += 1
+            return {"error": f"Invalid request: {e}"}
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                response = await self.respond(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        finally:
+            writer.close()
+
+
+async def serve(
+    path: str,
+    workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    max_queue: int = 64,
+    timeout: float = client.DEFAULT_TIMEOUT,
+) -> None:
+    """
+    Runs the service on a Unix socket until cancelled. A stale socket left by a
+    daemon that died is replaced, but a live one is not.
+
+    Args:
+        path (str): The path of the socket.
+        workers (Optional[int]): The number of worker processes, defaulting to
+        the number of CPUs.
+        max_concurrency (Optional[int]): The number of requests solved at once,
+        defaulting to the number of workers.
+        max_queue (int): The number of requests waiting for a slot.
+        timeout (float): The default seconds a request may take.
+    """
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX) as probe:
+            if probe.connect_ex(path) == 0:
+                raise ValueError(f"A service is already listening on {path}.")
+
+        os.unlink(path)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    count = workers or os.cpu_count() or 1
+    service = Service(
+        functools.partial(
+            concurrent.futures.ProcessPoolExecutor,
+            max_workers=count,
+            initializer=warm_worker,
+        ),
+        max_concurrency or count,
+        max_queue,
+        timeout,
+    )
+
+    try:
+        # Workers are started on demand, so they are started and warmed up
+        # before the first request rather than while answering it
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[loop.run_in_executor(service.executor, os.getpid) for _ in range(count)]
+        )
+
+        server = await asyncio.start_unix_server(service.handle, path)
+
+        try:
+            async with server:
+                await server.serve_forever()
+
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+
+    finally:
+        service.executor.shutdown()
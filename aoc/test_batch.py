@@ -0,0 +1,27 @@
+import pathlib
+
+from aoc import batch
+
+
+def test_run_batch(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "a.txt").write_text("1000\n2000\n\n4000\n\n500\n")
+    (tmp_path / "b.txt").write_text("1\n\n2\n\n3\n\n4\n")
+    (tmp_path / "c.txt").write_text("x\n")
+    filenames = sorted(str(path) for path in tmp_path.iterdir())
+
+    records = list(batch.run_batch(2022, 1, filenames))
+    assert [record["file"] for record in records] == filenames
+
+    assert (records[0]["part1"], records[0]["part2"]) == (4000, 7500)
+    assert (records[1]["part1"], records[1]["part2"]) == (4, 9)
+    assert records[0]["ms"] >= 0
+    assert records[2]["error"].startswith("ValueError")
+
+    # Records arrive in completion order from a pool, with the same answers
+    pooled = list(batch.run_batch(2022, 1, filenames, workers=2))
+    pooled.sort(key=lambda record: record["file"])
+
+    for record, pooled_record in zip(records, pooled):
+        record.pop("ms", None)
+        pooled_record.pop("ms", None)
+        assert record == pooled_record
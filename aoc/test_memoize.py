@@ -0,0 +1,56 @@
+import os
+import pathlib
+
+from aoc import memoize
+from aoc import runner
+
+
+def test_memo(tmp_path: pathlib.Path) -> None:
+    memo = memoize.Memo(max_entries=2)
+    memo.put("a", 1)
+    memo.put("b", 2)
+
+    # Looking up a makes b the least recently used, so b is evicted by c
+    assert memo.get("a") == 1
+    memo.put("c", "text")
+    assert memo.get("b") is None
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    path = str(tmp_path / "answers.json")
+    memo.save(path)
+    loaded = memoize.Memo.load(path)
+    assert list(loaded.entries.items()) == [("a", 1), ("c", "text")]
+
+    assert memoize.Memo.load(str(tmp_path / "missing.json")).entries == {}
+    assert len(memoize.Memo.load(path, max_entries=1).entries) == 1
+
+
+def test_list_sources() -> None:
+    names = [os.path.basename(path) for path in memoize.list_sources(2023, 7)]
+    assert names[0] == "day_07.py" and "helpers.py" in names
+    assert not any(name.startswith(("test_", "day_0")) for name in names[1:])
+
+    assert memoize.hash_sources(2023, 7) != memoize.hash_sources(2023, 9)
+
+
+def test_run_solver_memo(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("32T3K 765\nT55J5 684\nKK677 28\nKTJJT 220\nQQQJA 483\n")
+    memo = memoize.Memo()
+
+    result = runner.run_solver(2023, 7, str(path), memo=memo)
+    assert result.answers == {1: 6440, 2: 5905} and result.memoized == []
+
+    # The second run answers from the memo without reading the input
+    memoized = runner.run_solver(2023, 7, str(path), memo=memo)
+    assert memoized.answers == result.answers and memoized.memoized == [1, 2]
+    assert list(memoized.timings) == ["memo"]
+    assert (memo.hits, memo.misses) == (2, 2)
+    assert "memoized: part 1, 2" in runner.format_result(memoized)
+
+    # Only the part missing from the memo is solved
+    path.write_text("0 3 6 9 12 15\n")
+    runner.run_solver(2023, 9, str(path), parts=[1], memo=memo)
+    partial = runner.run_solver(2023, 9, str(path), memo=memo)
+    assert partial.answers == {1: 18, 2: -3} and partial.memoized == [1]
+    assert "part_2" in partial.timings and "part_1" not in partial.timings
@@ -0,0 +1,48 @@
+import json
+import pathlib
+import time
+
+from aoc import profiler
+from aoc import runner
+
+
+def spin(seconds: float) -> int:
+    count = 0
+    end = time.process_time() + seconds
+
+    while time.process_time() < end:
+        count += 1
+
+    return count
+
+
+def test_sampler(tmp_path: pathlib.Path) -> None:
+    with profiler.Sampler(0.001) as sampler:
+        spin(0.1)
+
+    # Every stack starts at the profiled function, not at the test itself
+    assert len(sampler.samples) > 0
+    assert all(stack[0][0] == "spin" for stack in sampler.samples)
+    assert 0.1 <= sampler.elapsed < 1
+
+    path = tmp_path / "spin.collapsed"
+    profiler.write_collapsed(sampler, "part_1", str(path))
+    assert path.read_text().startswith("part_1;spin (aoc/test_profiler.py:")
+
+    path = tmp_path / "spin.speedscope.json"
+    profiler.write_speedscope({"part_1": sampler}, "spin", str(path))
+    document = json.loads(path.read_text())
+
+    assert document["shared"]["frames"][0]["name"] == "spin"
+    assert abs(document["profiles"][0]["endValue"] - sampler.elapsed) < 1e-6
+
+
+def test_run_solver_profile() -> None:
+    result = runner.run_solver(2022, 4, profile_interval=0.001, fuse=False)
+
+    assert result.profiles is not None
+    assert list(result.profiles) == ["read", "parse", "part_1", "part_2"]
+
+    # Stacks start at the part itself rather than at the runner
+    for stack in result.profiles["part_1"].samples:
+        assert stack == () or stack[0][0] == "part_1"
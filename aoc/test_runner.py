@@ -0,0 +1,194 @@
+import importlib
+import io
+import pathlib
+import pytest
+
+from aoc import registry
+from aoc import runner
+
+
+def test_list_days() -> None:
+    assert registry.list_days(2022) == list(range(1, 12))
+    assert 24 in registry.list_days(2023)
+    assert registry.list_days(1999) == []
+
+
+def test_load_solver() -> None:
+    # Days with the same number in different years are kept apart
+    assert registry.load_solver(2022, 6) is not registry.load_solver(2023, 6)
+
+    with pytest.raises(ValueError, match="No solver for 2023 day 25."):
+        registry.load_solver(2023, 25)
+
+
+# The 2022 scripts embed their tests, which are run here rather than each time
+# a script starts
+@pytest.mark.parametrize("day", registry.list_days(2022))
+def test_script_self_tests(day: int) -> None:
+    module = registry.load_solver(2022, day)
+
+    for name in dir(module):
+        if name.startswith("test_"):
+            getattr(module, name)()
+
+
+def test_run_solver(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("two1nine\neightwothree\nabc123xyz\n7pqrstsixteen\n")
+
+    result = runner.run_solver(2023, 1, str(path))
+    assert result.answers == {1: 11 + 13 + 77, 2: 29 + 83 + 13 + 76}
+    assert list(result.timings) == ["read", "parse", "part_1", "part_2"]
+
+    result = runner.run_solver(2023, 1, str(path), parts=[2])
+    assert result.answers == {2: 29 + 83 + 13 + 76}
+    assert "part_1" not in result.timings
+
+
+def test_run_solver_script_year(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text(
+        "[D]        \n[N] [C]    \n[Z] [M] [P]\n 1   2   3 \n\n"
+        "move 1 from 1 to 2\nmove 2 from 2 to 3\n"
+    )
+
+    # Both parts run on the same parsed stacks
+    result = runner.run_solver(2022, 5, str(path))
+    assert result.answers == {1: "NMC", 2: "NMD"}
+
+
+def test_run_solver_parse_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "input.txt"
+    path.write_text(
+        "[D]        \n[N] [C]    \n[Z] [M] [P]\n 1   2   3 \n\n"
+        "move 1 from 1 to 2\nmove 2 from 2 to 3\n"
+    )
+
+    result = runner.run_solver(2022, 5, str(path), parse_cache=True)
+    assert result.answers == {1: "NMC", 2: "NMD"}
+    assert list(result.timings) == ["parse", "part_1", "part_2"]
+    assert len(registry.load_parse_cache().list_entries()) == 1
+
+    # A hit neither reads nor parses the input
+    def read_lines(year: int, filename: str) -> None:
+        raise AssertionError("The input was read on a hit.")
+
+    monkeypatch.setattr(registry, "read_lines", read_lines)
+    result = runner.run_solver(2022, 5, str(path), parse_cache=True)
+    assert result.answers == {1: "NMC", 2: "NMD"}
+
+    with pytest.raises(ValueError, match="no parsed model to cache"):
+        runner.run_solver(2023, 1, str(path), stream=True, parse_cache=True)
+
+
+def test_run_solver_memory(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(f"{i} {i + 1} {i + 3} {i + 6}" for i in range(500)))
+
+    result = runner.run_solver(2023, 9, str(path), trace_memory=True)
+    assert result.answers == {1: sum(i + 10 for i in range(500)), 2: sum(range(500))}
+    assert result.allocations is not None
+    assert list(result.allocations) == ["read", "parse", "part_1", "part_2"]
+
+    # The parsed histories stay allocated after the parse phase
+    parse = result.allocations["parse"]
+    assert parse.peak >= parse.size > 0 and parse.blocks >= 500
+    assert parse.sites[0].location.startswith("2023/src/day_09.py:")
+
+    assert "parse: peak" in runner.format_result(result)
+    assert runner.run_solver(2023, 9, str(path)).allocations is None
+
+
+def test_run_solver_fused() -> None:
+    jobs = [(2022, day) for day in range(1, 5)] + [(2023, 2), (2023, 11)]
+
+    for year, day in jobs:
+        assert registry.get_fused(registry.load_solver(year, day)) is not None
+
+        fused = runner.run_solver(year, day)
+        separate = runner.run_solver(year, day, fuse=False)
+
+        assert "fused" in fused.timings and "part_1" not in fused.timings
+        assert "fused" not in separate.timings
+        assert fused.answers == separate.answers
+
+    # A single part is solved by the part itself
+    assert "part_2" in runner.run_solver(2022, 1, parts=[2]).timings
+
+
+def test_run_solver_budget(tmp_path: pathlib.Path) -> None:
+    # The walk from AAA cycles without ever reaching ZZZ
+    path = tmp_path / "input.txt"
+    path.write_text("LR\n\nAAA = (BBB, BBB)\nBBB = (AAA, AAA)\nZZZ = (ZZZ, ZZZ)\n")
+
+    result = runner.run_solver(2023, 8, str(path), parts=[1], budget=0.05)
+    assert result.answers == {} and result.partial is not None
+    assert result.partial.phase == "part_1"
+    assert result.partial.progress["steps"] > 0
+    assert "partial: part_1 gave up" in runner.format_result(result)
+
+    # Parts without a deadline, and runs within budget, are unaffected
+    result = runner.run_solver(2022, 11, budget=60)
+    assert set(result.answers) == {1, 2} and result.partial is None
+
+    result = runner.run_solver(2022, 11, budget=0)
+    assert result.partial is not None and result.partial.progress["rounds_done"] == 0
+
+
+def test_run_solver_columnar(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("0 3 6 9 12 15\n1 3 6 10 15 21\n10 13 16 21 30 45\n")
+
+    registry.load_solver(2023, 9)
+    columnar = importlib.import_module("columnar")
+    columns_path = columnar.convert_file(9, str(path))
+
+    expected = runner.run_solver(2023, 9, str(path)).answers
+    assert (
+        runner.run_solver(2023, 9, columns_path).answers
+        == expected
+        == {
+            1: 114,
+            2: 2,
+        }
+    )
+
+    # A columnar input is only accepted for the day it was converted for
+    with pytest.raises(ValueError, match="holds the input of day 9"):
+        runner.run_solver(2023, 24, columns_path)
+
+
+@pytest.mark.parametrize("year", [2022, 2023])
+def test_generate_stream_lines(tmp_path: pathlib.Path, year: int) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"  [D] \r\n\nmove 1 from 1 to 2\n last")
+
+    # Lines split across chunks come out whole, stripped as read_lines does
+    for chunk_size in (1, 3, registry.STREAM_CHUNK_SIZE):
+        lines = list(registry.generate_stream_lines(year, str(path), chunk_size))
+        assert lines == registry.read_lines(year, str(path))
+
+
+def test_run_solver_stream(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text("two1nine\neightwothree\nabc123xyz\n7pqrstsixteen\n")
+
+    result = runner.run_solver(2023, 1, str(path), stream=True)
+    assert result.answers == runner.run_solver(2023, 1, str(path)).answers
+    assert list(result.timings) == ["stream"]
+    assert runner.run_solver(2023, 1, str(path), [2], stream=True).answers == {
+        2: 29 + 83 + 13 + 76
+    }
+
+    # Stdin is read as it is piped in
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(path.read_bytes())))
+    result = runner.run_solver(2023, 1, registry.STDIN, stream=True)
+    assert result.answers == {1: 11 + 13 + 77, 2: 29 + 83 + 13 + 76}
+
+    with pytest.raises(ValueError, match="cannot stream its input"):
+        runner.run_solver(2023, 3, str(path), stream=True)
@@ -0,0 +1,46 @@
+import pathlib
+import pytest
+
+from aoc import scheduler
+
+
+@pytest.fixture(autouse=True)
+def directory(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    return str(tmp_path / "cache")
+
+
+def test_order_jobs() -> None:
+    timings = {"2023/05": 100.0, "2023/01": 0.1, "2022/11": 2.0}
+    jobs = [(2023, 1), (2022, 11), (2023, 2), (2023, 5)]
+
+    # Jobs without a stored time go first, as they may be the slowest
+    assert scheduler.order_jobs(jobs, timings) == [
+        (2023, 2),
+        (2023, 5),
+        (2022, 11),
+        (2023, 1),
+    ]
+
+
+def test_save_timings() -> None:
+    assert scheduler.load_timings() == {}
+
+    scheduler.save_timings({"2023/01": 0.5})
+    assert scheduler.load_timings() == {"2023/01": 0.5}
+
+
+def test_run_all() -> None:
+    results = list(scheduler.run_all([(2022, 1), (2022, 4)], workers=2))
+
+    assert sorted((result.year, result.day) for result in results) == [
+        (2022, 1),
+        (2022, 4),
+    ]
+    assert all(result.error is None for result in results)
+    assert set(scheduler.load_timings()) == {"2022/01", "2022/04"}
+
+
+def test_run_job_error() -> None:
+    result = scheduler.run_job((2023, 25))
+    assert result.error is not None and "No solver" in result.error
@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Tuple
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import os
+import pathlib
+import socket
+import threading
+
+from aoc import client
+from aoc import registry
+from aoc import service
+
+
+async def run_requests(path: str, messages: List[Dict[str, Any]]) -> List[Any]:
+    task = asyncio.create_task(service.serve(path, workers=1, timeout=5))
+
+    while not pathlib.Path(path).exists():
+        await asyncio.sleep(0.01)
+
+    responses = [
+        await asyncio.to_thread(client.solve, message, path) for message in messages
+    ]
+    responses.append(
+        await asyncio.to_thread(client.send_request, {"op": "stats"}, path)
+    )
+
+    task.cancel()
+
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    return responses
+
+
+def test_serve(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "aoc.sock")
+    messages: List[Dict[str, Any]] = [
+        {"year": 2022, "day": 1, "input": "1000\n2000\n\n4000\n\n500\n"},
+        {"year": 2022, "day": 1, "part": 1, "input": "1\n\n2\n"},
+        {"year": 2022, "day": 1, "input": "x\n"},
+        {"year": 2022, "day": 1},
+        {
+            "year": 2023,
+            "day": 12,
+            "path": registry.get_input_path(2023, 12),
+            "timeout": 0.2,
+        },
+    ]
+
+    *records, stats = asyncio.run(run_requests(path, messages))
+
+    assert (records[0]["part1"], records[0]["part2"]) == (4000, 7500)
+    assert records[0]["served"] and records[0]["latency_ms"] > 0
+    assert records[1]["part1"] == 2 and "part2" not in records[1]
+    assert records[2]["error"].startswith("ValueError")
+    assert records[3]["error"].startswith("Invalid request")
+    assert records[4]["error"].startswith("TimeoutError")
+
+    assert stats["requests"] == 5 and stats["solved"] == 2
+    assert stats["errors"] == 2 and stats["timeouts"] == 1
+    assert stats["p50_ms"] <= stats["p90_ms"] <= stats["p99_ms"]
+    assert not pathlib.Path(path).exists()
+
+
+def test_solve_without_service(tmp_path: pathlib.Path) -> None:
+    message = {"year": 2022, "day": 1, "input": "1\n\n2\n"}
+    record = client.solve(message, str(tmp_path / "missing.sock"))
+    assert record == {"part1": 2, "part2": 3, "ms": record["ms"], "served": False}
+
+
+def test_solve_with_closed_connection(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "aoc.sock")
+    message = {"year": 2022, "day": 1, "input": "1\n\n2\n"}
+
+    with socket.socket(socket.AF_UNIX) as listener:
+        listener.bind(path)
+        listener.listen()
+
+        # The service reads the request and drops it without an answer
+        def drop() -> None:
+            connection, _ = listener.accept()
+
+            with connection:
+                connection.recv(1024)
+
+        thread = threading.Thread(target=drop)
+        thread.start()
+        record = client.solve(message, path)
+        thread.join()
+
+    assert record["error"].startswith("ConnectionError") and record["served"]
+
+
+async def solve_after_crash() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    executor = functools.partial(concurrent.futures.ProcessPoolExecutor, 1)
+    solver = service.Service(executor, 1, 1, 5)
+
+    try:
+        # A worker exiting breaks the pool, which the next request replaces
+        with contextlib.suppress(concurrent.futures.process.BrokenProcessPool):
+            solver.executor.submit(os._exit, 1).result()
+
+        record = await solver.solve({"year": 2022, "day": 1, "input": "1\n\n2\n"})
+        return record, solver.get_stats()
+
+    finally:
+        solver.executor.shutdown()
+
+
+def test_restart_broken_pool() -> None:
+    record, stats = asyncio.run(solve_after_crash())
+
+    assert record["part1"] == 2
+    assert stats["restarts"] == 1 and stats["running"] == 0
+
+
+def test_summarise_latencies() -> None:
+    assert service.summarise_latencies([]) == {}
+    assert service.summarise_latencies([3.0])["p99_ms"] == 3.0
+
+    summary = service.summarise_latencies([float(i) for i in range(1, 101)])
+    assert summary["p50_ms"] == 50.5 and summary["p99_ms"] > 99
@@ -0,0 +1,11 @@
+"""
+This package benchmarks the solvers of every year through the runner of the aoc
+package. The standalone scripts beside it measure the helpers in isolation.
+
+Usage:
+    python -m bench run [--year YEAR] [--day DAY] [--inputs real|synthetic|all]
+    python -m bench history [--year YEAR] [--day DAY]
+    python -m bench check [--tolerance PERCENT] [--update]
+    python -m bench complexity [--probe NAME] [--threshold SLOPE]
+    python -m bench startup [--mode batch|daemon] [--budget-ms MS]
+"""
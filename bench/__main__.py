@@ -0,0 +1,282 @@
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+
+from aoc import registry
+from aoc import scheduler
+from bench import baseline
+from bench import complexity
+from bench import history
+from bench import startup
+from bench import streaming
+from bench import suite
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="bench", description="Benchmark solvers.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="time every solver phase")
+    run_parser.add_argument("--year", type=int, action="append")
+    run_parser.add_argument("--day", type=int, action="append")
+    run_parser.add_argument(
+        "--inputs", choices=("real", "synthetic", "all"), default="all"
+    )
+    run_parser.add_argument(
+        "--scale", type=float, action="append", help="scale of synthetic inputs"
+    )
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--trials", type=int, default=5)
+    run_parser.add_argument(
+        "--budget", type=float, default=30, help="seconds of trials per case"
+    )
+    run_parser.add_argument("--no-gc", action="store_true", help="disable the GC")
+    run_parser.add_argument("--cpu", type=int, help="pin the process to a CPU")
+    run_parser.add_argument("--csv", help="file to write results to as CSV")
+    run_parser.add_argument("--json", help="file to write results to as JSON")
+    run_parser.add_argument(
+        "--memory", action="store_true", help="also measure the peak memory"
+    )
+    run_parser.add_argument("--history", default=history.get_history_path())
+    run_parser.add_argument(
+        "--no-history", action="store_true", help="do not record the run"
+    )
+
+    complexity_parser = subparsers.add_parser(
+        "complexity", help="fit the empirical complexity of each solver"
+    )
+    complexity_parser.add_argument(
+        "--probe", action="append", help="run the probes whose name contains this"
+    )
+    complexity_parser.add_argument(
+        "--threshold", type=float, default=complexity.DEFAULT_THRESHOLD
+    )
+    complexity_parser.add_argument("--steps", type=int, default=8)
+    complexity_parser.add_argument(
+        "--max-seconds", type=float, default=1, help="stop scaling past this per call"
+    )
+
+    check_parser = subparsers.add_parser(
+        "check", help="compare time and memory against the stored baseline"
+    )
+    check_parser.add_argument("--baseline", default=baseline.get_baseline_path())
+    check_parser.add_argument(
+        "--tolerance", type=float, default=25, help="allowed growth in percent"
+    )
+    check_parser.add_argument(
+        "--update", action="store_true", help="record a new baseline instead"
+    )
+    check_parser.add_argument("--year", type=int, action="append")
+    check_parser.add_argument("--day", type=int, action="append")
+    check_parser.add_argument(
+        "--skip", action="append", default=[], help="skip a solver, as YEAR/DD"
+    )
+    check_parser.add_argument(
+        "--inputs", choices=("real", "synthetic", "all"), default="real"
+    )
+    check_parser.add_argument("--scale", type=float, action="append")
+    check_parser.add_argument("--warmup", type=int, default=1)
+    check_parser.add_argument("--trials", type=int, default=7)
+    check_parser.add_argument("--budget", type=float, default=10)
+
+    history_parser = subparsers.add_parser(
+        "history", help="show how each solver changed over recorded runs"
+    )
+    history_parser.add_argument("--history", default=history.get_history_path())
+    history_parser.add_argument("--year", type=int, action="append")
+    history_parser.add_argument("--day", type=int, action="append")
+    history_parser.add_argument(
+        "--all-machines", action="store_true", help="include other machines"
+    )
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="time the cold start of the command line"
+    )
+    startup_parser.add_argument("--mode", choices=("batch", "daemon"), action="append")
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.add_argument(
+        "--budget-ms", type=float, default=startup.DEFAULT_BUDGET_MS
+    )
+
+    streaming_parser = subparsers.add_parser(
+        "streaming", help="check that streamed runs keep a flat memory"
+    )
+    streaming_parser.add_argument("--day", type=int, action="append")
+    streaming_parser.add_argument(
+        "--size-mb", type=float, action="append", help="size of an input"
+    )
+    streaming_parser.add_argument(
+        "--tolerance-mb", type=float, default=streaming.DEFAULT_TOLERANCE_MB
+    )
+
+    args = parser.parse_args()
+
+    match args.command:
+        case "run":
+            if args.cpu is not None:
+                suite.pin_cpu(args.cpu)
+
+            jobs = [
+                (year, day)
+                for year in args.year or registry.list_years()
+                for day in registry.list_days(year)
+                if args.day is None or day in args.day
+            ]
+
+            with tempfile.TemporaryDirectory() as directory:
+                cases = suite.create_cases(
+                    jobs, args.inputs, args.scale or [1], directory
+                )
+                measurements = []
+
+                for measurement in suite.run_suite(
+                    cases,
+                    args.warmup,
+                    args.trials,
+                    args.budget,
+                    args.no_gc,
+                    args.memory,
+                ):
+                    print(suite.format_measurement(measurement), flush=True)
+                    measurements.append(measurement)
+
+            if not args.no_history:
+                with contextlib.closing(history.connect(args.history)) as connection:
+                    history.record_run(connection, measurements)
+
+            if args.csv:
+                suite.write_csv(measurements, args.csv)
+
+            if args.json:
+                suite.write_json(measurements, args.json, args.no_gc, args.cpu)
+
+            mismatches = suite.check_answers(measurements)
+
+            for mismatch in mismatches:
+                print(f"Mismatch: {mismatch}", file=sys.stderr)
+
+            if mismatches or any(m.error is not None for m in measurements):
+                parser.exit(1)
+
+        case "complexity":
+            flagged = 0
+
+            for probe in complexity.PROBES:
+                if args.probe and not any(name in probe.name for name in args.probe):
+                    continue
+
+                for fit in complexity.run_probe(
+                    probe,
+                    args.steps,
+                    max_seconds=args.max_seconds,
+                    threshold=args.threshold,
+                ):
+                    print(complexity.format_fit(fit), flush=True)
+                    flagged += fit.is_flagged
+
+            if flagged > 0:
+                parser.exit(1, f"{flagged} probes exceed their threshold.\n")
+
+        case "check":
+            with tempfile.TemporaryDirectory() as directory:
+                if args.update:
+                    jobs = [
+                        (year, day)
+                        for year in args.year or registry.list_years()
+                        for day in registry.list_days(year)
+                        if args.day is None or day in args.day
+                        if scheduler.create_key((year, day)) not in args.skip
+                    ]
+                    cases = suite.create_cases(
+                        jobs, args.inputs, args.scale or [1], directory
+                    )
+
+                else:
+                    stored = baseline.load_baseline(args.baseline)
+                    keys = [
+                        key
+                        for key in stored
+                        if args.year is None or key[0] in args.year
+                        if args.day is None or key[1] in args.day
+                        if scheduler.create_key(key[:2]) not in args.skip
+                    ]
+                    cases = baseline.create_cases(keys, directory)
+
+                measurements = list(
+                    suite.run_suite(
+                        cases,
+                        args.warmup,
+                        args.trials,
+                        args.budget,
+                        trace_memory=True,
+                    )
+                )
+
+            if args.update:
+                for measurement in measurements:
+                    print(suite.format_measurement(measurement))
+
+                if any(m.error is not None for m in measurements):
+                    parser.exit(1, "Not updating the baseline after errors.\n")
+
+                baseline.save_baseline(measurements, args.baseline)
+
+            else:
+                comparisons = baseline.check_baseline(
+                    {key: stored[key] for key in keys}, measurements, args.tolerance
+                )
+                failures = 0
+
+                for comparison in comparisons:
+                    print(baseline.format_comparison(comparison))
+                    failures += comparison.after is None or bool(comparison.regressions)
+
+                if failures > 0:
+                    parser.exit(
+                        1,
+                        f"{failures} solvers regressed by more than"
+                        f" {args.tolerance:g}% or failed.\n",
+                    )
+
+        case "history":
+            if not os.path.exists(args.history):
+                parser.exit(1, f"No history in {args.history}.\n")
+
+            with contextlib.closing(history.connect(args.history)) as connection:
+                points = history.load_history(
+                    connection,
+                    args.year,
+                    args.day,
+                    None if args.all_machines else history.get_fingerprint(),
+                )
+
+            for key, solver_points in points.items():
+                print("\n".join(history.format_history(key, solver_points)))
+
+        case "startup":
+            results = startup.run_startup(args.mode, args.runs, args.budget_ms)
+
+            for result in results:
+                print(startup.format_startup(result))
+
+            if any(result.over_budget for result in results):
+                parser.exit(
+                    1, f"Cold start exceeded the budget of {args.budget_ms:g} ms.\n"
+                )
+
+        case "streaming":
+            streamed = streaming.run_streaming(
+                args.day,
+                args.size_mb or streaming.DEFAULT_SIZES_MB,
+                args.tolerance_mb,
+            )
+
+            for streamed_day in streamed:
+                print(streaming.format_streaming(streamed_day), flush=True)
+
+            if not all(streamed_day.is_flat for streamed_day in streamed):
+                parser.exit(
+                    1, f"Peak memory grew by more than {args.tolerance_mb:g} MB.\n"
+                )
@@ -0,0 +1,234 @@
+"""
+This module guards the solvers against performance regressions. A baseline of
+the median total time and peak memory of each solver is committed beside it,
+and the check measures the same cases again and flags every solver whose time
+or memory grew by more than a tolerance.
+
+Timing noise is handled by the repeated trials of the suite: medians are
+compared rather than single runs, and a slowdown only counts once it also
+exceeds several MADs and a small absolute floor, so sub-millisecond solvers do
+not fail on scheduler jitter.
+
+Functions:
+- get_baseline_path: Returns the committed baseline.
+- create_entry: Summarises a measurement for the baseline.
+- save_baseline: Writes the entry of every measurement.
+- load_baseline: Reads the entries of a baseline.
+- create_cases: Lists the inputs of the cases stored in a baseline.
+- compare: Lists the metrics of a solver that regressed.
+- check_baseline: Compares measurements against a baseline.
+- format_comparison: Formats a row of the diff table.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import dataclasses
+import json
+import os
+import platform
+
+from bench import suite
+
+
+# A solver in the baseline is a (year, day, input, engine) tuple
+Key = Tuple[int, int, str, str]
+
+# A slowdown within this many MADs of the median is treated as noise
+NOISE_MADS = 3
+
+# A slowdown below this many milliseconds is treated as noise
+MIN_DIFFERENCE_MS = 2.0
+
+
+@dataclasses.dataclass
+class Entry:
+    median_ms: float
+    mad_ms: float
+    peak_kib: float
+
+
+@dataclasses.dataclass
+class Comparison:
+    key: Key
+    before: Entry
+    after: Optional[Entry] = None
+    regressions: List[str] = dataclasses.field(default_factory=list)
+    error: Optional[str] = None
+
+
+def get_baseline_path() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def create_key(measurement: suite.Measurement) -> Key:
+    case = measurement.case
+    return case.year, case.day, case.label, measurement.engine
+
+
+def create_entry(measurement: suite.Measurement) -> Entry:
+    if measurement.peak_bytes is None:
+        raise ValueError("Baseline measurements must trace memory.")
+
+    return Entry(
+        measurement.median(suite.TOTAL) * 1000,
+        measurement.mad(suite.TOTAL) * 1000,
+        measurement.peak_bytes / 1024,
+    )
+
+
+def save_baseline(measurements: List[suite.Measurement], filename: str) -> None:
+    results = []
+
+    for measurement in measurements:
+        year, day, label, engine = create_key(measurement)
+        results.append(
+            {
+                "year": year,
+                "day": day,
+                "input": label,
+                "engine": engine,
+                **{
+                    name: round(value, 4)
+                    for name, value in dataclasses.asdict(
+                        create_entry(measurement)
+                    ).items()
+                },
+            }
+        )
+
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+    with open(filename, "w") as f:
+        json.dump({"environment": environment, "results": results}, f, indent=2)
+        f.write("\n")
+
+
+def load_baseline(filename: str) -> Dict[Key, Entry]:
+    with open(filename, "r") as f:
+        results = json.load(f)["results"]
+
+    return {
+        (result["year"], result["day"], result["input"], result["engine"]): Entry(
+            result["median_ms"], result["mad_ms"], result["peak_kib"]
+        )
+        for result in results
+    }
+
+
+def create_cases(keys: List[Key], directory: str) -> List[suite.Case]:
+    """
+    Lists the inputs of the solvers stored in a baseline, once per input
+    however many engines were measured on it. Synthetic inputs are generated
+    again from the scale in their label.
+
+    Args:
+        keys (List[Key]): The solvers stored in the baseline.
+        directory (str): The directory to write synthetic inputs to.
+
+    Returns:
+        List[suite.Case]: The cases in the order of the keys.
+    """
+    cases = []
+    seen = set()
+
+    for year, day, label, _ in keys:
+        if (year, day, label) in seen:
+            continue
+
+        seen.add((year, day, label))
+
+        # Synthetic inputs are labelled by their scale, such as 'x2'
+        if label == "real":
+            cases += suite.create_cases([(year, day)], "real", [], directory)
+
+        else:
+            scale = float(label.removeprefix("x"))
+            cases += suite.create_cases([(year, day)], "synthetic", [scale], directory)
+
+    return cases
+
+
+# Lists the metrics that grew by more than the tolerance, in percent, once noise
+# is accounted for
+def compare(before: Entry, after: Entry, tolerance: float) -> List[str]:
+    factor = 1 + tolerance / 100
+    regressions = []
+
+    noise = max(NOISE_MADS * max(before.mad_ms, after.mad_ms), MIN_DIFFERENCE_MS)
+
+    if (
+        after.median_ms > before.median_ms * factor
+        and after.median_ms - before.median_ms > noise
+    ):
+        regressions.append("time")
+
+    if after.peak_kib > before.peak_kib * factor:
+        regressions.append("memory")
+
+    return regressions
+
+
+def check_baseline(
+    baseline: Dict[Key, Entry],
+    measurements: List[suite.Measurement],
+    tolerance: float,
+) -> List[Comparison]:
+    """
+    Compares each solver of a baseline with its new measurement. Solvers that
+    fail or are no longer measured are reported with an error, and measured
+    solvers missing from the baseline are ignored.
+
+    Args:
+        baseline (Dict[Key, Entry]): The stored entries.
+        measurements (List[suite.Measurement]): The new measurements, with
+        memory traced.
+        tolerance (float): The growth in percent above which a metric regresses.
+
+    Returns:
+        List[Comparison]: One comparison per solver of the baseline.
+    """
+    measured = {create_key(measurement): measurement for measurement in measurements}
+    comparisons = []
+
+    for key, before in baseline.items():
+        comparison = Comparison(key, before)
+        measurement = measured.get(key)
+
+        if measurement is None:
+            comparison.error = "not measured"
+
+        elif measurement.error is not None:
+            comparison.error = measurement.error
+
+        else:
+            comparison.after = create_entry(measurement)
+            comparison.regressions = compare(before, comparison.after, tolerance)
+
+        comparisons.append(comparison)
+
+    return comparisons
+
+
+def format_change(before: float, after: float) -> str:
+    change = (after / before - 1) * 100 if before > 0 else 0
+    return f"{before:>10.2f} → {after:>10.2f} {change:>+7.1f}%"
+
+
+def format_comparison(comparison: Comparison) -> str:
+    year, day, label, engine = comparison.key
+    row = f"{year} {day:02} {label:<8}{engine:<12}"
+
+    if comparison.after is None:
+        return row + f"error: {comparison.error}"
+
+    row += (
+        f"{format_change(comparison.before.median_ms, comparison.after.median_ms)} ms"
+        f"  {format_change(comparison.before.peak_kib, comparison.after.peak_kib)} KiB"
+    )
+
+    if comparison.regressions:
+        row += f"  REGRESSED ({', '.join(comparison.regressions)})"
+
+    return row
@@ -0,0 +1,297 @@
+"""
+This module estimates the empirical complexity of the solvers. Each probe runs
+a function on generated inputs of geometrically increasing size and fits the
+slope of log(time) against log(n), so a slope of 2.0 means the time grows as
+O(n^2.0). Probes whose slope exceeds a threshold are flagged, which catches
+accidentally quadratic code, such as queues popping from the front of a list,
+long before it meets a production-sized input.
+
+There is a probe for every phase of the 2023 solvers with a generator, where n
+is the size parameter of the generator, and probes for individual hot
+functions, where n is the natural size of their argument.
+
+Functions:
+- time_call: Returns the best time per call of a function.
+- fit_slope: Fits the slope of the log-log relation of times against sizes.
+- create_solver_probe: Creates the probe of every phase of a 2023 solver.
+- run_probe: Measures a probe at increasing sizes and fits each of its slopes.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import contextlib
+import dataclasses
+import functools
+import inspect
+import io
+import math
+import random
+import statistics
+import time
+
+from aoc import registry
+from bench import suite
+
+
+# Slope above which a probe is flagged, unless the probe sets its own
+DEFAULT_THRESHOLD = 1.5
+
+# A builder takes a scale and returns the resulting size n and the functions
+# to time at that size, keyed by phase
+Builder = Callable[[float], Tuple[int, Dict[str, Callable[[], object]]]]
+
+
+@dataclasses.dataclass
+class Probe:
+    name: str
+    build: Builder
+    start: float = 1
+    threshold: Optional[float] = None
+
+
+@dataclasses.dataclass
+class Fit:
+    name: str
+    sizes: List[int]
+    times: List[float]
+    slope: float
+    threshold: float
+
+    @property
+    def is_flagged(self) -> bool:
+        return self.slope > self.threshold
+
+
+# Calls a function repeatedly for at least a minimum time, and returns the best
+# mean time per call over several rounds
+def time_call(
+    function: Callable[[], object], min_time: float = 0.02, rounds: int = 3
+) -> float:
+    best = math.inf
+
+    for _ in range(rounds):
+        count = 0
+        start = time.perf_counter()
+
+        while True:
+            function()
+            count += 1
+            elapsed = time.perf_counter() - start
+
+            if elapsed >= min_time:
+                break
+
+        best = min(best, elapsed / count)
+
+        # A single slow call is measurement enough
+        if elapsed > 10 * min_time and count == 1:
+            break
+
+    return best
+
+
+def fit_slope(sizes: List[int], times: List[float]) -> float:
+    slope, _ = statistics.linear_regression(
+        [math.log(size) for size in sizes], [math.log(t) for t in times]
+    )
+    return slope
+
+
+def create_solver_probe(
+    day: int,
+    parameter: Optional[str] = None,
+    start: float = 0.1,
+    threshold: Optional[float] = None,
+    **overrides: float,
+) -> Probe:
+    """
+    Creates a probe timing the parse and part phases of a 2023 solver on inputs
+    from its generator. The generator's size parameter, or another parameter,
+    is scaled from its default, and n is the value of that parameter, squared
+    for the side of a grid.
+
+    Args:
+        day (int): The day of the puzzle.
+        parameter (Optional[str]): The parameter to scale, defaulting to the
+        size parameter of the generator.
+        start (float): The first scale.
+        threshold (Optional[float]): The slope above which the probe is
+        flagged, defaulting to the threshold of the run.
+        **overrides (float): Fixed parameters passed on to the generator.
+
+    Returns:
+        Probe: The probe, named after the day module.
+    """
+
+    def build(scale: float) -> Tuple[int, Dict[str, Callable[[], object]]]:
+        generators = suite.load_generators()
+        generator, size_parameter, is_grid = generators.GENERATORS[day]
+        name = parameter or size_parameter
+
+        default = inspect.signature(generator).parameters[name].default
+        value = max(1, round(default * (math.sqrt(scale) if is_grid else scale)))
+        lines = generators.generate(day, **{**overrides, name: value})
+
+        module = registry.load_solver(2023, day)
+        model = module.parse(lines)
+        phases: Dict[str, Callable[[], object]] = {"parse": lambda: module.parse(lines)}
+
+        for part in (1, 2):
+            solve = registry.get_part(module, part)
+
+            if solve is not None:
+                phases[f"part_{part}"] = functools.partial(solve, model)
+
+        return value * value if is_grid else value, phases
+
+    return Probe(f"2023 day_{day:02}", build, start, threshold)
+
+
+def build_count_steps(scale: float) -> Tuple[int, Dict[str, Callable[[], object]]]:
+    generators = suite.load_generators()
+    day_10 = registry.load_solver(2023, 10)
+
+    lines = generators.generate(10, scale)
+    start = day_10.find_start_location(lines)
+    max_row, max_column = len(lines) - 1, len(lines[0]) - 1
+
+    # The start is always an 'F' corner, so the loop leaves it to the south
+    arguments = (lines, start, day_10.Direction.SOUTH, max_row, max_column)
+    steps, _ = day_10.count_steps(*arguments)
+
+    return steps, {"": lambda: day_10.count_steps(*arguments)}
+
+
+def build_sum_distances(scale: float) -> Tuple[int, Dict[str, Callable[[], object]]]:
+    generators = suite.load_generators()
+    day_11 = registry.load_solver(2023, 11)
+
+    galaxies, _, _ = day_11.scan_galaxies(generators.generate(11, scale))
+    return len(galaxies), {"": lambda: day_11.sum_distances(galaxies)}
+
+
+def build_generate_possibilities(
+    scale: float,
+) -> Tuple[int, Dict[str, Callable[[], object]]]:
+    day_12 = registry.load_solver(2023, 12)
+
+    # Every unknown doubles the possibilities, so n is their number
+    unknown_count = round(math.log2(scale))
+    condition = "?" * unknown_count
+    return 2**unknown_count, {"": lambda: day_12.generate_possibilities(condition)}
+
+
+def build_run_instructions(
+    scale: float,
+) -> Tuple[int, Dict[str, Callable[[], object]]]:
+    day_10 = registry.load_solver(2022, 10)
+
+    rng = random.Random(0)
+    instructions = [
+        rng.choice(["noop", f"addx {rng.randint(-20, 20)}"]) for _ in range(int(scale))
+    ]
+
+    # run_instructions consumes its arguments, so each call gets copies
+    return len(instructions), {
+        "": lambda: day_10.run_instructions(list(instructions), [20, 60, 100])
+    }
+
+
+# Probes in the order they are run
+PROBES: List[Probe] = [
+    create_solver_probe(1),
+    create_solver_probe(2),
+    create_solver_probe(3),
+    create_solver_probe(4),
+    create_solver_probe(5, max_seed_range=10**4),
+    # A single race keeps part 2 linear in the time instead of in its digits
+    create_solver_probe(6, "max_time", 10, race_count=1),
+    create_solver_probe(7),
+    create_solver_probe(8),
+    create_solver_probe(9),
+    create_solver_probe(10),
+    # Summing over every pair of galaxies or hailstones is quadratic by design
+    create_solver_probe(11, threshold=2.2),
+    create_solver_probe(12),
+    create_solver_probe(24, threshold=2.2),
+    Probe("2023 day_10.count_steps", build_count_steps, 0.25),
+    Probe("2023 day_11.sum_distances", build_sum_distances, 0.25, 2.2),
+    Probe("2023 day_12.generate_possibilities", build_generate_possibilities, 2**8),
+    Probe("2022 day_10.run_instructions", build_run_instructions, 1000),
+]
+
+
+def run_probe(
+    probe: Probe,
+    steps: int = 8,
+    factor: float = 2,
+    max_seconds: float = 1,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Fit]:
+    """
+    Measures each phase of a probe at geometrically increasing scales, and fits
+    the slope of each. Scaling stops after a number of steps, or once a single
+    call takes longer than the maximum time.
+
+    Args:
+        probe (Probe): The probe to run.
+        steps (int): The maximum number of sizes.
+        factor (float): The ratio between consecutive scales.
+        max_seconds (float): The time per call after which scaling stops.
+        threshold (float): The slope above which a phase is flagged, unless the
+        probe sets its own.
+
+    Returns:
+        List[Fit]: The sizes, times and slope of each phase.
+    """
+    samples: Dict[str, Tuple[List[int], List[float]]] = {}
+    scale = probe.start
+
+    for _ in range(steps):
+        size, phases = probe.build(scale)
+        slowest = 0.0
+
+        for phase, function in phases.items():
+            # Some solvers print their progress, which would drown the report
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed = time_call(function)
+
+            sizes, times = samples.setdefault(phase, ([], []))
+            sizes.append(size)
+            times.append(elapsed)
+            slowest = max(slowest, elapsed)
+
+        if slowest > max_seconds:
+            break
+
+        scale *= factor
+
+    fits = []
+
+    for phase, (sizes, times) in samples.items():
+        # Sizes that round to the same n carry no information about the slope
+        if len(set(sizes)) < 2:
+            continue
+
+        fits.append(
+            Fit(
+                f"{probe.name}.{phase}" if phase else probe.name,
+                sizes,
+                times,
+                fit_slope(sizes, times),
+                probe.threshold or threshold,
+            )
+        )
+
+    return fits
+
+
+def format_fit(fit: Fit) -> str:
+    row = (
+        f"{fit.name:<40} ≈ O(n^{fit.slope:.1f})"
+        f"  n={fit.sizes[0]}..{fit.sizes[-1]} ({len(fit.sizes)} sizes)"
+    )
+
+    if fit.is_flagged:
+        row += f"  exceeds {fit.threshold:g}"
+
+    return row
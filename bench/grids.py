@@ -0,0 +1,401 @@
+"""
+Compares the flat Grid of the 2023 solvers with the list-based grids it
+replaces on a large random image of day 11, where '#' marks a galaxy. Each
+representation is built once under tracemalloc for its memory, and each
+operation is timed on both representations:
+
+- scan: finds every galaxy, with day_11.scan_galaxies over the lines and
+  day_11.scan_galaxies_grid over the Grid.
+- adjacent: counts the galaxies with a galaxy north, south, east or west of
+  them, looking coordinates up in a set of tuples or reading the cells at fixed
+  offsets of a flat index.
+- components: finds the connected regions of empty space, with a search over
+  a set of visited coordinates and with grid.find_components. The search over
+  sets only runs on images of up to SET_LIMIT cells, as it holds several
+  objects per cell.
+
+The solvers moved onto the Grid are then timed on large random inputs of their
+own, against their reference parts: day 3 of 2023 on a schematic of digits and
+symbols, day 10 of 2023 on a single loop of pipes winding through the grid, and
+day 8 of 2022 on a forest of tree heights. The reference parts only run on
+inputs of up to REFERENCE_LIMIT cells, where the engines are timed alongside
+them, as the reference of day 3 looks every neighbour of a symbol up among all
+the numbers.
+
+Usage:
+    PYTHONPATH=.:2023/src python bench/grids.py [--size N] [--density P]
+
+Functions:
+- generate_image: Generates the text of a random square image.
+- split_rows: Splits the text of a square image into its rows.
+- measure_memory: Returns the memory held by the result of a function.
+- measure_time: Returns the time a function takes and its result.
+- count_neighbours_set: Counts adjacent galaxies with a set of coordinates.
+- count_neighbours_grid: Counts adjacent galaxies with flat offsets.
+- find_components_set: Finds the sizes of the regions of empty space with a
+  set of visited coordinates.
+- generate_schematic: Generates the rows of a random day 3 schematic.
+- generate_pipe_loop: Generates the rows of a day 10 grid with a single loop.
+- count_loop_rows: Returns the number of rows of a grid of generate_pipe_loop.
+- count_enclosed: Returns the tiles enclosed in a grid of generate_pipe_loop.
+- generate_forest: Generates the rows of a random day 8 forest of 2022.
+- compare_parts: Times the reference parts and engines of a solver.
+- compare_solver: Times a solver on inputs of a given size and below the
+  reference limit.
+"""
+
+from typing import Callable, Deque, List, Set, Tuple, TypeVar
+import argparse
+import collections
+import contextlib
+import gc
+import io
+import math
+import random
+import time
+import tracemalloc
+import types
+
+from aoc import registry
+import day_03
+import day_10
+import day_11
+import grid
+
+
+T = TypeVar("T")
+
+# Largest image, in cells, searched with a set of visited coordinates
+SET_LIMIT = 10**7
+
+# Largest input, in cells, solved with the reference parts
+REFERENCE_LIMIT = 10**5
+
+# Characters of a schematic, with the bytes below each bound mapped to them, so
+# that about one cell in six is a digit and one in twenty a symbol as in the
+# puzzle input
+SCHEMATIC_DIGITS, DIGIT_BOUND = b"0123456789", 40
+SCHEMATIC_SYMBOLS, SYMBOL_BOUND = b"*#+$", 52
+
+# Characters of the tiles off the loop of pipes
+PIPES = b".|-LJ7F"
+
+
+def generate_image(size: int, density: float, seed: int) -> str:
+    # Bytes below the threshold become galaxies, the rest empty space
+    threshold = int(density * 256)
+    table = bytes(ord("#") if byte < threshold else ord(".") for byte in range(256))
+    return random.Random(seed).randbytes(size * size).translate(table).decode()
+
+
+def split_rows(text: str, size: int) -> List[str]:
+    return [text[i * size : (i + 1) * size] for i in range(size)]
+
+
+def measure_memory(function: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = function()
+        size, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return size
+
+
+def measure_time(function: Callable[[], T]) -> Tuple[float, T]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def count_neighbours_set(galaxies: Set[Tuple[int, int]]) -> int:
+    count = 0
+
+    for i, j in galaxies:
+        for di, dj in ((-1, 0), (1, 0), (0, 1), (0, -1)):
+            if (i + di, j + dj) in galaxies:
+                count += 1
+                break
+
+    return count
+
+
+def count_neighbours_grid(image: grid.Grid) -> int:
+    count = 0
+    cells, offsets, galaxy = image.cells, image.offsets_4, ord("#")
+
+    for index in image.locate(galaxy):
+        for offset in offsets:
+            if cells[index + offset] == galaxy:
+                count += 1
+                break
+
+    return count
+
+
+def find_components_set(lines: List[str]) -> List[int]:
+    sizes = []
+    visited: Set[Tuple[int, int]] = set()
+
+    for i, line in enumerate(lines):
+        for j, cell in enumerate(line):
+            if cell == "#" or (i, j) in visited:
+                continue
+
+            queue: Deque[Tuple[int, int]] = collections.deque([(i, j)])
+            visited.add((i, j))
+            size = 0
+
+            while queue:
+                r, c = queue.popleft()
+                size += 1
+
+                for dr, dc in ((-1, 0), (1, 0), (0, 1), (0, -1)):
+                    nr, nc = r + dr, c + dc
+
+                    if (
+                        0 <= nr < len(lines)
+                        and 0 <= nc < len(line)
+                        and lines[nr][nc] != "#"
+                        and (nr, nc) not in visited
+                    ):
+                        visited.add((nr, nc))
+                        queue.append((nr, nc))
+
+            sizes.append(size)
+
+    return sizes
+
+
+def generate_schematic(size: int, seed: int) -> List[str]:
+    table = bytes(
+        SCHEMATIC_DIGITS[byte % 10]
+        if byte < DIGIT_BOUND
+        else SCHEMATIC_SYMBOLS[byte % 4]
+        if byte < SYMBOL_BOUND
+        else ord(".")
+        for byte in range(256)
+    )
+    text = random.Random(seed).randbytes(size * size).translate(table).decode()
+
+    # Day 3 joins digits at the end of a line with those at the start of the
+    # next, so the last column is kept empty
+    return [row[:-1] + "." for row in split_rows(text, size)]
+
+
+def generate_pipe_loop(size: int, seed: int) -> List[str]:
+    """
+    Generates a grid holding a single loop of pipes. The loop runs along every
+    other row, alternately left to right and right to left, and returns up the
+    first column to the start in the top left corner. The rows between the runs
+    hold random pipes off the loop, and are enclosed by it below the runs going
+    left to right.
+
+    Args:
+        size (int): The number of columns, at least 3. The number of rows is
+        rounded down so that the last run goes right to left.
+        seed (int): The seed of the random pipes.
+
+    Returns:
+        List[str]: The rows of the grid.
+    """
+    rng = random.Random(seed)
+    table = bytes(PIPES[byte % len(PIPES)] for byte in range(256))
+    rows = count_loop_rows(size)
+    lines = ["S" + "-" * (size - 2) + "7"]
+
+    for row in range(1, rows - 1):
+        fill = rng.randbytes(size - 2).translate(table).decode()
+        run = row // 2
+
+        if row % 2 == 1:
+            lines.append("|" + fill + "|" if run % 2 == 0 else "||" + fill)
+
+        elif run % 2 == 1:
+            lines.append("|F" + "-" * (size - 3) + "J")
+
+        else:
+            lines.append("|L" + "-" * (size - 3) + "7")
+
+    lines.append("L" + "-" * (size - 2) + "J")
+    return lines
+
+
+def count_loop_rows(size: int) -> int:
+    # The runs are on even rows and alternate, so the last run goes right to
+    # left on rows of 3 modulo 4
+    return size - (size - 3) % 4
+
+
+def count_enclosed(size: int) -> int:
+    # Every fourth row, from the second, lies below a run going left to right,
+    # with all but its first and last tiles enclosed
+    return (count_loop_rows(size) + 1) // 4 * (size - 2)
+
+
+def generate_forest(size: int, seed: int) -> List[str]:
+    table = bytes(ord("0") + byte % 10 for byte in range(256))
+    text = random.Random(seed).randbytes(size * size).translate(table).decode()
+    return split_rows(text, size)
+
+
+def compare_parts(
+    section: str,
+    solver: types.ModuleType,
+    lines: List[str],
+    with_reference: bool,
+) -> List[object]:
+    """
+    Times both parts of a solver on an input, with its reference parts and
+    every engine, checking that they agree.
+
+    Args:
+        section (str): The label printed before each timing.
+        solver (types.ModuleType): The day module.
+        lines (List[str]): The input.
+        with_reference (bool): Whether to time the reference parts.
+
+    Returns:
+        List[object]: The answers to both parts.
+    """
+    model = solver.parse(lines)
+    answers = []
+
+    for part in (1, 2):
+        functions = [
+            (name, parts[part])
+            for name, parts in solver.ENGINES.items()
+            if part in parts
+        ]
+
+        if with_reference:
+            functions.insert(0, ("reference", getattr(solver, f"part_{part}")))
+
+        results = set()
+
+        for name, function in functions:
+            # Some of the reference parts print their progress
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed, result = measure_time(lambda: function(model))
+
+            results.add(result)
+            label = f"part {part} {name}"
+            print(f"{section:<10}{label:<24}{elapsed * 1000:>10.1f} ms")
+
+        assert len(results) == 1
+        answers.append(results.pop())
+
+    return answers
+
+
+def compare_solver(
+    section: str,
+    solver: types.ModuleType,
+    generate: Callable[[int], List[str]],
+    size: int,
+) -> List[object]:
+    """
+    Times a solver on a generated input of a given size. When the input is over
+    REFERENCE_LIMIT cells, the reference parts and the engines are first timed
+    together on the largest input under it.
+
+    Args:
+        section (str): The label printed before each timing.
+        solver (types.ModuleType): The day module.
+        generate (Callable[[int], List[str]]): Generates an input of a size.
+        size (int): The number of rows and columns of the input.
+
+    Returns:
+        List[object]: The answers to both parts on the input of the given size.
+    """
+    reference_size = min(size, math.isqrt(REFERENCE_LIMIT))
+
+    if reference_size < size:
+        print(f"{section:<10}{reference_size}x{reference_size}")
+        compare_parts(section, solver, generate(reference_size), True)
+
+    print(f"{section:<10}{size}x{size}")
+    return compare_parts(section, solver, generate(size), reference_size == size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--density", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    size = args.size
+    text = generate_image(size, args.density, args.seed)
+    lines = split_rows(text, size)
+    print(f"{size}x{size} image, {args.density:.1%} galaxies")
+
+    representations: List[Tuple[str, Callable[[], object]]] = [
+        ("List[str]", lambda: split_rows(text, size)),
+        ("List[List[int]]", lambda: [list(line.encode()) for line in lines]),
+        ("Grid", lambda: grid.Grid.from_lines(lines)),
+    ]
+
+    for name, build in representations:
+        print(f"memory    {name:<24}{measure_memory(build) / 1e6:>10.1f} MB")
+
+    build_time, image = measure_time(lambda: grid.Grid.from_lines(lines))
+    print(f"build     {'Grid.from_lines':<24}{build_time * 1000:>10.1f} ms")
+
+    list_time, list_model = measure_time(lambda: day_11.scan_galaxies(lines))
+    grid_time, grid_model = measure_time(lambda: day_11.scan_galaxies_grid(image))
+    assert list_model == grid_model
+
+    print(f"scan      {'List[str]':<24}{list_time * 1000:>10.1f} ms")
+    print(f"scan      {'Grid':<24}{grid_time * 1000:>10.1f} ms")
+
+    locations = list(list_model[0].values())
+    galaxies = set(locations)
+    set_memory = measure_memory(lambda: {(i, j) for i, j in locations})
+    set_time, set_count = measure_time(lambda: count_neighbours_set(galaxies))
+    grid_time, grid_count = measure_time(lambda: count_neighbours_grid(image))
+    assert set_count == grid_count
+
+    print(f"memory    {'Set[Tuple[int, int]]':<24}{set_memory / 1e6:>10.1f} MB")
+    print(f"adjacent  {'Set[Tuple[int, int]]':<24}{set_time * 1000:>10.1f} ms")
+    print(f"adjacent  {'Grid':<24}{grid_time * 1000:>10.1f} ms")
+
+    blocked = image.cells.translate(bytes(int(byte == ord("#")) for byte in range(256)))
+    del galaxies, list_model, grid_model
+
+    for with_labels in (False, True):
+        name = "find_components" + (" labels" if with_labels else "")
+        memory = measure_memory(
+            lambda: grid.find_components(image, blocked, with_labels)
+        )
+        flat_time, components = measure_time(
+            lambda: grid.find_components(image, blocked, with_labels)
+        )
+
+        print(f"memory    {name:<24}{memory / 1e6:>10.1f} MB")
+        print(f"regions   {name:<24}{flat_time * 1000:>10.1f} ms")
+
+    print(f"regions   {len(components.sizes)} found, largest {max(components.sizes)}")
+
+    if size * size <= SET_LIMIT:
+        set_time, set_sizes = measure_time(lambda: find_components_set(lines))
+        assert set_sizes == list(components.sizes)
+        print(f"regions   {'Set[Tuple[int, int]]':<24}{set_time * 1000:>10.1f} ms")
+
+    del image, lines, text, blocked, components
+    seed = args.seed
+
+    compare_solver("day 03", day_03, lambda n: generate_schematic(n, seed), size)
+
+    pipes = compare_solver(
+        "day 10", day_10, lambda n: generate_pipe_loop(n, seed), size
+    )
+    assert pipes[1] == count_enclosed(size)
+
+    forest = registry.load_solver(2022, 8)
+    compare_solver("2022 08", forest, lambda n: generate_forest(n, seed), size)
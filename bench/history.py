@@ -0,0 +1,264 @@
+"""
+This module appends every benchmark run to a local SQLite database, so slow
+drift across many commits shows up even when each change stays within the
+tolerance of the baseline check. A run is keyed by the git commit it measured,
+the Python version and a fingerprint of the machine, since timings are only
+comparable between runs on the same machine.
+
+The database is history.sqlite in $AOC_CACHE_DIR, or in
+~/.cache/advent-of-code by default.
+
+Functions:
+- get_history_path: Returns the database holding the history.
+- get_commit: Returns the checked out commit and whether the tree is dirty.
+- get_fingerprint: Returns a short hash identifying the machine.
+- connect: Opens the database, creating its tables if needed.
+- record_run: Appends the measurements of a run.
+- load_history: Loads the recorded points of each solver in order.
+- format_history: Formats the points of a solver with their relative change.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import dataclasses
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import time
+
+from aoc import registry
+from bench import baseline
+from bench import suite
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    machine TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    input TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    trials INTEGER NOT NULL,
+    median_ms REAL,
+    mad_ms REAL,
+    peak_kib REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS results_by_day ON results (year, day);
+"""
+
+
+@dataclasses.dataclass
+class Point:
+    created: float
+    commit: str
+    dirty: bool
+    python: str
+    machine: str
+    median_ms: float
+    mad_ms: float
+    peak_kib: Optional[float]
+
+
+def get_history_path() -> str:
+    return os.path.join(registry.get_cache_directory(), "history.sqlite")
+
+
+# Returns the commit of the repository, or 'unknown' outside of a git checkout
+def get_commit() -> Tuple[str, bool]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=registry.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=registry.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+    return commit, len(status) > 0
+
+
+def get_fingerprint() -> str:
+    details = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "implementation": platform.python_implementation(),
+    }
+
+    # The processor name is often empty on Linux, where cpuinfo holds it instead
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            details["model"] = next(
+                (line.split(":", 1)[1].strip() for line in f if "model name" in line),
+                None,
+            )
+
+    except OSError:
+        pass
+
+    encoded = json.dumps(details, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:12]
+
+
+def connect(filename: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+
+    connection = sqlite3.connect(filename)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_run(
+    connection: sqlite3.Connection, measurements: List[suite.Measurement]
+) -> int:
+    """
+    Appends a run and its measurements to the history, along with the commit,
+    Python version and machine it ran on.
+
+    Args:
+        connection (sqlite3.Connection): The history database.
+        measurements (List[suite.Measurement]): The measurements of the run.
+
+    Returns:
+        int: The identifier of the new run.
+    """
+    commit, dirty = get_commit()
+
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (created, git_commit, dirty, python, machine)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                time.time(),
+                commit,
+                dirty,
+                platform.python_version(),
+                get_fingerprint(),
+            ),
+        )
+        run_id = cursor.lastrowid
+        assert run_id is not None
+
+        for measurement in measurements:
+            year, day, label, engine = baseline.create_key(measurement)
+            measured = measurement.error is None and measurement.trials > 0
+
+            connection.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    year,
+                    day,
+                    label,
+                    engine,
+                    measurement.trials,
+                    measurement.median(suite.TOTAL) * 1000 if measured else None,
+                    measurement.mad(suite.TOTAL) * 1000 if measured else None,
+                    (
+                        measurement.peak_bytes / 1024
+                        if measurement.peak_bytes is not None
+                        else None
+                    ),
+                    measurement.error,
+                ),
+            )
+
+    return run_id
+
+
+def load_history(
+    connection: sqlite3.Connection,
+    years: Optional[List[int]] = None,
+    days: Optional[List[int]] = None,
+    machine: Optional[str] = None,
+) -> Dict[baseline.Key, List[Point]]:
+    """
+    Loads the successful measurements of each solver, oldest first.
+
+    Args:
+        connection (sqlite3.Connection): The history database.
+        years (Optional[List[int]]): The years to load, defaulting to all.
+        days (Optional[List[int]]): The days to load, defaulting to all.
+        machine (Optional[str]): The fingerprint of the machine to load,
+        defaulting to all machines.
+
+    Returns:
+        Dict[baseline.Key, List[Point]]: The points of each solver.
+    """
+    query = (
+        "SELECT year, day, input, engine, created, git_commit, dirty, python,"
+        " machine, median_ms, mad_ms, peak_kib"
+        " FROM results JOIN runs ON results.run_id = runs.id"
+        " WHERE error IS NULL AND median_ms IS NOT NULL"
+    )
+    parameters: List[object] = []
+
+    for column, values in (("year", years), ("day", days)):
+        if values:
+            query += f" AND {column} IN ({', '.join('?' * len(values))})"
+            parameters += values
+
+    if machine is not None:
+        query += " AND machine = ?"
+        parameters.append(machine)
+
+    query += " ORDER BY year, day, input, engine, created"
+    history: Dict[baseline.Key, List[Point]] = {}
+
+    for row in connection.execute(query, parameters):
+        year, day, label, engine, created, commit, dirty, *rest = row
+        history.setdefault((year, day, label, engine), []).append(
+            Point(created, commit, bool(dirty), *rest)
+        )
+
+    return history
+
+
+def format_history(key: baseline.Key, points: List[Point]) -> List[str]:
+    year, day, label, engine = key
+    rows = [f"{year} {day:02} {label} {engine}"]
+    previous: Optional[Point] = None
+
+    for point in points:
+        date = time.strftime("%Y-%m-%d %H:%M", time.localtime(point.created))
+        commit = point.commit[:7] + ("*" if point.dirty else " ")
+        row = (
+            f"  {date}  {commit}  {point.python:<8}{point.machine}"
+            f"  {point.median_ms:>10.2f}±{point.mad_ms:.2f} ms"
+        )
+
+        if previous is not None:
+            row += f" {(point.median_ms / previous.median_ms - 1) * 100:>+7.1f}%"
+
+        else:
+            row += " " * 9
+
+        if point.peak_kib is not None:
+            row += f"  peak {point.peak_kib:>8.0f} KiB"
+
+        rows.append(row)
+        previous = point
+
+    return rows
@@ -0,0 +1,111 @@
+"""
+Measures the parse throughput of the days whose line formats are described by
+record layouts in helpers. Each day parses its real input repeated until it
+holds at least the requested number of lines, and the best throughput over
+several runs is reported in lines/s and MB/s.
+
+Usage:
+    PYTHONPATH=2023/src python bench/layouts.py [--lines N] [--repeats N]
+
+Functions:
+- parse_cards: Parses every scratchcard line of day 4.
+- parse_races: Parses the day 6 document once per two lines.
+- parse_map: Parses the day 8 instructions followed by every node line.
+- parse_hailstones: Parses every hailstone line of day 24.
+- measure_throughput: Runs a parser on scaled lines and returns its best
+  throughput.
+"""
+
+from typing import Callable, List, Tuple
+import argparse
+import time
+
+import day_04
+import day_06
+import day_08
+import day_24
+import helpers
+
+
+def parse_cards(lines: List[str]) -> None:
+    for line in lines:
+        day_04.parse_card(line)
+
+
+def parse_races(lines: List[str]) -> None:
+    for i in range(0, len(lines), 2):
+        day_06.scan_race_parameters(lines[i : i + 2])
+
+
+def parse_map(lines: List[str]) -> None:
+    day_08.scan_map(lines)
+
+
+def parse_hailstones(lines: List[str]) -> None:
+    for line in lines:
+        day_24.parse_hailstone(line)
+
+
+# Parsers under measurement, with their input and the number of header lines
+# that are kept once rather than repeated
+CASES: List[Tuple[str, str, int, Callable[[List[str]], None]]] = [
+    ("day_04.parse_card", "2023/data/day_04.txt", 0, parse_cards),
+    ("day_06.scan_race_parameters", "2023/data/day_06.txt", 0, parse_races),
+    ("day_08.scan_map", "2023/data/day_08.txt", 2, parse_map),
+    ("day_24.parse_hailstone", "2023/data/day_24.txt", 0, parse_hailstones),
+]
+
+
+# Runs a parser on lines scaled to a minimum count and returns its throughput
+def measure_throughput(
+    parser: Callable[[List[str]], None],
+    filename: str,
+    header_count: int,
+    line_count: int,
+    repeats: int,
+) -> Tuple[float, float]:
+    """
+    Repeats the lines of an input until there are at least the given number,
+    then parses them several times and returns the best throughput.
+
+    Args:
+        parser (Callable[[List[str]], None]): The parser to measure.
+        filename (str): The input to scale.
+        header_count (int): The number of leading lines kept only once.
+        line_count (int): The minimum number of lines to parse.
+        repeats (int): The number of times to parse the lines.
+
+    Returns:
+        Tuple[float, float]: The best throughput in lines/s and in MB/s.
+    """
+    lines = list(helpers.generate_lines(filename))
+    header, body = lines[:header_count], lines[header_count:]
+    lines = header + body * max(1, line_count // len(body))
+    size = sum(len(line) + 1 for line in lines)
+
+    best = None
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parser(lines)
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    assert best is not None
+    return len(lines) / best, size / best / 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, filename, header_count, case in CASES:
+        lines_per_second, throughput = measure_throughput(
+            case, filename, header_count, args.lines, args.repeats
+        )
+
+        print(f"{name:<30}{lines_per_second:>12.0f} lines/s{throughput:>8.1f} MB/s")
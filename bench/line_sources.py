@@ -0,0 +1,117 @@
+"""
+Measures the throughput of the line sources in helpers. The input file is
+repeated until it reaches the requested size, then each line source is drained
+several times and the best throughput is reported in MB/s.
+
+Usage:
+    PYTHONPATH=2023/src python bench/line_sources.py [FILE] [--size-mb N]
+
+Functions:
+- create_scaled_input: Writes a copy of a file repeated up to a minimum size.
+- measure_throughput: Drains a line source and returns its best throughput.
+"""
+
+from typing import Callable, Iterable, List, Tuple
+import argparse
+import os
+import tempfile
+import time
+
+import helpers
+
+
+# Line sources under comparison, keyed by the name printed in the report
+LINE_SOURCES: List[Tuple[str, Callable[[str], Iterable[object]]]] = [
+    ("generate_lines", helpers.generate_lines),
+    ("generate_line_views", helpers.generate_line_views),
+    ("generate_lines_mapped", helpers.generate_lines_mapped),
+]
+
+
+# Writes the contents of a file repeatedly until the output reaches a size
+def create_scaled_input(filename: str, output: str, size: int) -> int:
+    """
+    Writes the contents of a file repeatedly to another file until it is at
+    least the given size.
+
+    Args:
+        filename (str): The file to repeat.
+        output (str): The file to write.
+        size (int): The minimum size of the output in bytes.
+
+    Returns:
+        int: The size of the output in bytes.
+    """
+    with open(filename, "rb") as f:
+        contents = f.read()
+
+    if not contents.endswith(b"\n"):
+        contents += b"\n"
+
+    written = 0
+
+    with open(output, "wb") as f:
+        while written < size:
+            f.write(contents)
+            written += len(contents)
+
+    return written
+
+
+# Drains a line source and returns the best throughput in MB/s
+def measure_throughput(
+    line_source: Callable[[str], Iterable[object]],
+    filename: str,
+    size: int,
+    repeats: int,
+) -> float:
+    """
+    Drains a line source several times and returns the best throughput.
+
+    Args:
+        line_source (Callable[[str], Iterable[object]]): The line source to
+        measure.
+        filename (str): The file to read.
+        size (int): The size of the file in bytes.
+        repeats (int): The number of times to drain the line source.
+
+    Returns:
+        float: The best throughput in MB/s.
+    """
+    best = None
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+
+        for _ in line_source(filename):
+            pass
+
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    assert best is not None
+    return size / best / 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("filename", nargs="?", default="2023/data/day_09.txt")
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "input.txt")
+        size = create_scaled_input(args.filename, output, args.size_mb * 1000000)
+
+        print(f"{args.filename} scaled to {size / 1e6:.1f} MB")
+
+        baseline = None
+
+        for name, line_source in LINE_SOURCES:
+            throughput = measure_throughput(line_source, output, size, args.repeats)
+            baseline = baseline or throughput
+
+            print(f"{name:<24}{throughput:>10.1f} MB/s{throughput / baseline:>8.2f}x")
@@ -0,0 +1,195 @@
+"""
+This module measures the cold start of the command line for one small day, in
+the modes where starting a process per input is the norm: batch, which solves
+in the new process, and daemon, where a client hands the input to a running
+service. Each mode is timed from spawning the interpreter to its exit, and run
+once more under python -X importtime to break the start down by module.
+
+A mode is flagged when its best wall time exceeds a fixed budget, so that an
+import added at the top of a module on the path of every command fails the
+check rather than slowing every start unnoticed.
+
+Functions:
+- parse_importtime: Parses the report of python -X importtime.
+- time_command: Returns the best wall time of a command over several runs.
+- measure_mode: Measures the wall time and imports of a mode.
+- serving: Runs a service for the daemon mode while in use.
+- run_startup: Measures every mode.
+- format_startup: Formats the measurement of a mode for printing.
+"""
+
+from typing import Generator, List, Optional
+import contextlib
+import dataclasses
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from aoc import registry
+
+
+# Default wall time a cold start may take, in milliseconds
+DEFAULT_BUDGET_MS = 150.0
+
+# The small day every mode solves
+YEAR, DAY = 2022, 1
+
+# Imports listed per mode, from most to least expensive
+TOP_IMPORTS = 5
+
+
+@dataclasses.dataclass
+class Import:
+    name: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+@dataclasses.dataclass
+class Startup:
+    mode: str
+    wall_ms: float
+    import_ms: float
+    imports: List[Import]
+    over_budget: bool = False
+
+
+def parse_importtime(report: str) -> List[Import]:
+    imports = []
+
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+
+        # Nested imports are indented by two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(Import(name.strip(), depth, int(self_us), int(cumulative_us)))
+
+    return imports
+
+
+def time_command(command: List[str], runs: int) -> float:
+    best = float("inf")
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=registry.ROOT, check=True, capture_output=True)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def measure_mode(mode: str, arguments: List[str], runs: int) -> Startup:
+    """
+    Measures the cold start of a command, as the best wall time over several
+    runs, and the time spent importing modules in one more run.
+
+    Args:
+        mode (str): The name of the mode.
+        arguments (List[str]): The arguments of python -m aoc.
+        runs (int): The number of timed runs.
+
+    Returns:
+        Startup: The wall time, the total import time, and the imports of the
+        command.
+    """
+    command = [sys.executable, "-m", "aoc"] + arguments
+    wall = time_command(command, runs)
+
+    report = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "aoc"] + arguments,
+        cwd=registry.ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+    imports = parse_importtime(report)
+    import_us = sum(item.cumulative_us for item in imports if item.depth == 0)
+
+    return Startup(mode, wall * 1000, import_us / 1000, imports)
+
+
+@contextlib.contextmanager
+def serving(path: str) -> Generator[None, None, None]:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "aoc", "serve", "--socket", path, "--workers", "1"],
+        cwd=registry.ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+
+    try:
+        # The socket appears once the worker has been started and warmed up
+        while not os.path.exists(path):
+            if process.poll() is not None:
+                raise ValueError("The service exited before listening.")
+
+            time.sleep(0.01)
+
+        yield
+
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def run_startup(
+    modes: Optional[List[str]] = None,
+    runs: int = 5,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+) -> List[Startup]:
+    """
+    Measures the cold start of each mode on the input of a small day.
+
+    Args:
+        modes (Optional[List[str]]): The modes to measure, batch and daemon,
+        defaulting to both.
+        runs (int): The number of timed runs per mode.
+        budget_ms (float): The wall time in milliseconds above which a mode is
+        flagged.
+
+    Returns:
+        List[Startup]: The measurement of each mode.
+    """
+    modes = modes or ["batch", "daemon"]
+    day = ["--year", str(YEAR), "--day", str(DAY)]
+    results = []
+
+    if "batch" in modes:
+        path = registry.get_input_path(YEAR, DAY)
+        results.append(measure_mode("batch", ["batch"] + day + [path], runs))
+
+    if "daemon" in modes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "aoc.sock")
+
+            with serving(path):
+                arguments = ["solve"] + day + ["--socket", path]
+                results.append(measure_mode("daemon", arguments, runs))
+
+    for result in results:
+        result.over_budget = result.wall_ms > budget_ms
+
+    return results
+
+
+def format_startup(result: Startup) -> str:
+    rows = [
+        f"{result.mode:<8}{result.wall_ms:>8.1f} ms wall{result.import_ms:>8.1f} ms"
+        f" importing{'  OVER BUDGET' if result.over_budget else ''}"
+    ]
+
+    top = sorted(
+        (item for item in result.imports if item.depth == 0),
+        key=lambda item: -item.cumulative_us,
+    )
+
+    for item in top[:TOP_IMPORTS]:
+        rows.append(f"  {item.cumulative_us / 1000:>8.1f} ms  {item.name}")
+
+    return "\n".join(rows)
@@ -0,0 +1,162 @@
+"""
+This module checks that the streaming mode of the command line keeps memory
+flat as its input grows. Each day that can stream is piped synthetic inputs of
+growing sizes on stdin, repeating one generated block of lines until the size
+is reached, so that inputs of several gigabytes never touch the disk. The peak
+resident memory of the solving process is read from its resource usage once it
+exits.
+
+A day is flagged when its peak on the largest input exceeds its peak on the
+smallest by more than a tolerance, since a fold holding every line or record
+grows with the input while a constant or bounded accumulator does not.
+
+Functions:
+- list_streaming_days: Lists the days of 2023 whose solvers can stream.
+- create_block: Generates the block of lines repeated to build an input.
+- measure_stream: Pipes an input of a given size into a streaming run.
+- run_streaming: Measures each day on inputs of each size.
+- format_streaming: Formats the measurements of a day for printing.
+"""
+
+from typing import List, Optional, Sequence
+import dataclasses
+import os
+import subprocess
+import sys
+
+from aoc import registry
+from bench import suite
+
+
+# Year whose solvers are streamed
+YEAR = 2023
+
+# Default sizes of the inputs, in megabytes
+DEFAULT_SIZES_MB = (1, 4, 16)
+
+# Default growth of the peak memory allowed from the smallest to the largest
+# input, in megabytes
+DEFAULT_TOLERANCE_MB = 8.0
+
+# Scale of the generated block, relative to the puzzle input
+BLOCK_SCALE = 1
+
+
+@dataclasses.dataclass
+class Measurement:
+    size_mb: float
+    peak_mb: float
+    seconds: float
+
+
+@dataclasses.dataclass
+class Streaming:
+    day: int
+    measurements: List[Measurement]
+    is_flat: bool = True
+
+
+def list_streaming_days() -> List[int]:
+    return [
+        day
+        for day in registry.list_days(YEAR)
+        if hasattr(registry.load_solver(YEAR, day), "stream")
+    ]
+
+
+def create_block(day: int) -> bytes:
+    generators = suite.load_generators()
+    return "".join(
+        f"{line}\n" for line in generators.generate(day, BLOCK_SCALE)
+    ).encode()
+
+
+def measure_stream(day: int, block: bytes, size: int) -> Measurement:
+    """
+    Pipes an input of a given size into a streaming run of a day, written as
+    the run reads it, and measures the peak memory of the run.
+
+    Args:
+        day (int): The day to run.
+        block (bytes): The lines repeated to build the input.
+        size (int): The size of the input in bytes, rounded up to whole blocks.
+
+    Returns:
+        Measurement: The size of the input, and the peak resident memory and
+        the CPU time of the run.
+    """
+    command = [sys.executable, "-m", "aoc", "run", "--year", str(YEAR)]
+    command += ["--day", str(day), "--stream", "--input", registry.STDIN]
+    process = subprocess.Popen(
+        command,
+        cwd=registry.ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+    )
+    assert process.stdin is not None
+
+    written = 0
+
+    try:
+        while written < size:
+            process.stdin.write(block)
+            written += len(block)
+
+    finally:
+        process.stdin.close()
+
+    # The usage of the child is only returned by waiting for it directly
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    if process.returncode != 0:
+        raise ValueError(f"Streaming day {day} exited with {process.returncode}.")
+
+    # Linux reports the peak in kilobytes
+    return Measurement(
+        written / 1e6, usage.ru_maxrss / 1e3, usage.ru_utime + usage.ru_stime
+    )
+
+
+def run_streaming(
+    days: Optional[Sequence[int]] = None,
+    sizes_mb: Sequence[float] = DEFAULT_SIZES_MB,
+    tolerance_mb: float = DEFAULT_TOLERANCE_MB,
+) -> List[Streaming]:
+    """
+    Measures the peak memory of streaming each day on inputs of each size.
+
+    Args:
+        days (Optional[Sequence[int]]): The days to measure, defaulting to every
+        day that can stream.
+        sizes_mb (Sequence[float]): The sizes of the inputs in megabytes.
+        tolerance_mb (float): The growth of the peak memory in megabytes above
+        which a day is flagged.
+
+    Returns:
+        List[Streaming]: The measurements of each day.
+    """
+    results = []
+
+    for day in days or list_streaming_days():
+        block = create_block(day)
+        measurements = [
+            measure_stream(day, block, int(size_mb * 1e6))
+            for size_mb in sorted(sizes_mb)
+        ]
+        growth = measurements[-1].peak_mb - measurements[0].peak_mb
+        results.append(Streaming(day, measurements, growth <= tolerance_mb))
+
+    return results
+
+
+def format_streaming(result: Streaming) -> str:
+    rows = [f"day {result.day:02}{'' if result.is_flat else '  NOT FLAT'}"]
+
+    for measurement in result.measurements:
+        rows.append(
+            f"  {measurement.size_mb:>10.1f} MB in{measurement.peak_mb:>8.1f} MB peak"
+            f"{measurement.seconds:>8.1f} s"
+        )
+
+    return "\n".join(rows)
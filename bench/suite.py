@@ -0,0 +1,354 @@
+"""
+This module times every phase of the solvers on the real inputs and on
+synthetic inputs written by the 2023 generators. Each case is run a number of
+warmup times, then timed over repeated trials, and every phase is summarised by
+its median and median absolute deviation (MAD), which are robust to the
+occasional slow trial. The peak memory of a case is optionally measured in one
+extra run under tracemalloc, which would otherwise slow down the timed trials.
+
+Solvers offering alternative engines are measured once per engine on the same
+inputs, and the answers of every engine must match those of the default one.
+Solvers with a fused function are also measured with their parts run
+separately, as the separate engine.
+
+Functions:
+- pin_cpu: Restricts the process to a single CPU.
+- load_generators: Imports the input generators of 2023.
+- create_cases: Lists the inputs to measure for the selected days.
+- measure: Times the trials of one case with one engine.
+- check_answers: Lists the answers on which engines disagree.
+- run_suite: Measures every case with every engine.
+- write_csv: Writes one row per measured phase.
+- write_json: Writes the measurements and the environment they ran in.
+"""
+
+from typing import Dict, Generator, List, Optional, Sequence
+import csv
+import dataclasses
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+
+from aoc import registry
+from aoc import runner
+from aoc import scheduler
+
+
+# Name of the engine made of the solver's own parts
+DEFAULT_ENGINE = "default"
+
+# Name of the engine running the parts of a fused solver one at a time
+SEPARATE_ENGINE = "separate"
+
+# Phase summing the other phases of a trial
+TOTAL = "total"
+
+
+@dataclasses.dataclass
+class Case:
+    year: int
+    day: int
+    label: str
+    filename: str
+
+
+@dataclasses.dataclass
+class Measurement:
+    case: Case
+    engine: str
+    answers: Dict[int, runner.Answer] = dataclasses.field(default_factory=dict)
+    samples: Dict[str, List[float]] = dataclasses.field(default_factory=dict)
+    peak_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def trials(self) -> int:
+        return len(self.samples.get(TOTAL, []))
+
+    def median(self, phase: str) -> float:
+        return statistics.median(self.samples[phase])
+
+    def mad(self, phase: str) -> float:
+        median = self.median(phase)
+        return statistics.median(abs(sample - median) for sample in self.samples[phase])
+
+
+def pin_cpu(cpu: int) -> None:
+    if not hasattr(os, "sched_setaffinity"):
+        print("CPU pinning is not supported on this platform.", file=sys.stderr)
+        return
+
+    os.sched_setaffinity(0, {cpu})
+
+
+# The generators live beside the 2023 solvers and import them as siblings
+def load_generators() -> types.ModuleType:
+    directory = registry.get_source_directory(2023)
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    return importlib.import_module("generators")
+
+
+def create_cases(
+    jobs: Sequence[scheduler.Job],
+    inputs: str,
+    scales: Sequence[float],
+    directory: str,
+) -> List[Case]:
+    """
+    Lists the inputs to measure for each day. Synthetic inputs are written to a
+    directory, and exist only for the days with a generator.
+
+    Args:
+        jobs (Sequence[scheduler.Job]): The (year, day) pairs to measure.
+        inputs (str): Which inputs to use, one of "real", "synthetic" or "all".
+        scales (Sequence[float]): The scales of the synthetic inputs.
+        directory (str): The directory to write synthetic inputs to.
+
+    Returns:
+        List[Case]: The cases in the order of the jobs.
+    """
+    generators = load_generators() if inputs != "real" else None
+    cases = []
+
+    for year, day in jobs:
+        if inputs != "synthetic":
+            cases.append(Case(year, day, "real", registry.get_input_path(year, day)))
+
+        if generators is None or year != 2023 or day not in generators.GENERATORS:
+            continue
+
+        for scale in scales:
+            filename = os.path.join(directory, f"{year}_day_{day:02}_x{scale:g}.txt")
+
+            with open(filename, "w") as f:
+                for line in generators.generate(day, scale):
+                    f.write(line + "\n")
+
+            cases.append(Case(year, day, f"x{scale:g}", filename))
+
+    return cases
+
+
+def measure(
+    case: Case,
+    engine: str,
+    warmup: int,
+    trials: int,
+    budget: float,
+    disable_gc: bool,
+    trace_memory: bool = False,
+) -> Measurement:
+    """
+    Runs a case a number of warmup times, then times each phase over repeated
+    trials. Trials stop early once they have taken longer than the budget, so
+    slow solvers are measured fewer times.
+
+    Args:
+        case (Case): The input to run the solver on.
+        engine (str): The engine to solve the parts with.
+        warmup (int): The number of untimed runs.
+        trials (int): The maximum number of timed runs.
+        budget (float): The time in seconds after which no trial is started.
+        disable_gc (bool): Whether to run each trial with the garbage collector
+        disabled, after a full collection.
+        trace_memory (bool): Whether to measure the peak memory allocated by
+        one more run.
+
+    Returns:
+        Measurement: The answers, the time of each phase in each trial, and
+        the peak memory if traced.
+    """
+    measurement = Measurement(case, engine)
+    engine_name = None if engine in (DEFAULT_ENGINE, SEPARATE_ENGINE) else engine
+
+    def run() -> runner.Result:
+        return runner.run_solver(
+            case.year,
+            case.day,
+            case.filename,
+            engine=engine_name,
+            fuse=engine != SEPARATE_ENGINE,
+        )
+
+    try:
+        for _ in range(warmup):
+            run()
+
+        start = time.perf_counter()
+
+        for _ in range(trials):
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+
+            try:
+                result = run()
+
+            finally:
+                gc.enable()
+
+            measurement.answers = result.answers
+
+            for phase, elapsed in result.timings.items():
+                measurement.samples.setdefault(phase, []).append(elapsed)
+
+            measurement.samples.setdefault(TOTAL, []).append(
+                sum(result.timings.values())
+            )
+
+            if time.perf_counter() - start > budget:
+                break
+
+        if trace_memory:
+            tracemalloc.start()
+
+            try:
+                run()
+                _, measurement.peak_bytes = tracemalloc.get_traced_memory()
+
+            finally:
+                tracemalloc.stop()
+
+    except Exception as e:
+        measurement.error = f"{type(e).__name__}: {e}"
+
+    return measurement
+
+
+# Lists the parts on which an engine disagrees with the default engine
+def check_answers(measurements: List[Measurement]) -> List[str]:
+    expected: Dict[str, Dict[int, runner.Answer]] = {}
+    mismatches = []
+
+    for measurement in measurements:
+        if measurement.engine == DEFAULT_ENGINE and measurement.error is None:
+            expected[measurement.case.filename] = measurement.answers
+
+    for measurement in measurements:
+        answers = expected.get(measurement.case.filename, {})
+
+        for part, answer in measurement.answers.items():
+            if part in answers and answers[part] != answer:
+                mismatches.append(
+                    f"{measurement.case.year} day {measurement.case.day:02}"
+                    f" {measurement.case.label} part {part}: {measurement.engine}"
+                    f" gives {answer}, {DEFAULT_ENGINE} gives {answers[part]}"
+                )
+
+    return mismatches
+
+
+def run_suite(
+    cases: List[Case],
+    warmup: int = 1,
+    trials: int = 5,
+    budget: float = 30,
+    disable_gc: bool = False,
+    trace_memory: bool = False,
+) -> Generator[Measurement, None, None]:
+    for case in cases:
+        module = registry.load_solver(case.year, case.day)
+
+        engines = [DEFAULT_ENGINE] + registry.list_engines(module)
+
+        if registry.get_fused(module) is not None:
+            engines.insert(1, SEPARATE_ENGINE)
+
+        for engine in engines:
+            yield measure(
+                case, engine, warmup, trials, budget, disable_gc, trace_memory
+            )
+
+
+def format_measurement(measurement: Measurement) -> str:
+    case = measurement.case
+    row = f"{case.year} {case.day:02} {case.label:<8}{measurement.engine:<12}"
+
+    if measurement.error is not None:
+        return row + f"error: {measurement.error}"
+
+    phases = "  ".join(
+        f"{phase} {measurement.median(phase) * 1000:.2f}"
+        f"±{measurement.mad(phase) * 1000:.2f}"
+        for phase in runner.PHASES + (TOTAL,)
+        if phase in measurement.samples
+    )
+    row += f"{measurement.trials:>3}x  {phases} ms"
+
+    if measurement.peak_bytes is not None:
+        row += f"  peak {measurement.peak_bytes / 1024:.0f} KiB"
+
+    return row
+
+
+def write_csv(measurements: List[Measurement], filename: str) -> None:
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["year", "day", "input", "engine", "phase", "trials", "median_ms", "mad_ms"]
+        )
+
+        for measurement in measurements:
+            case = measurement.case
+
+            for phase in measurement.samples:
+                writer.writerow(
+                    [
+                        case.year,
+                        case.day,
+                        case.label,
+                        measurement.engine,
+                        phase,
+                        measurement.trials,
+                        f"{measurement.median(phase) * 1000:.4f}",
+                        f"{measurement.mad(phase) * 1000:.4f}",
+                    ]
+                )
+
+
+def write_json(
+    measurements: List[Measurement], filename: str, disable_gc: bool, cpu: Optional[int]
+) -> None:
+    results = []
+
+    for measurement in measurements:
+        case = measurement.case
+        results.append(
+            {
+                "year": case.year,
+                "day": case.day,
+                "input": case.label,
+                "engine": measurement.engine,
+                "trials": measurement.trials,
+                "answers": {str(k): v for k, v in measurement.answers.items()},
+                "phases": {
+                    phase: {
+                        "median_ms": measurement.median(phase) * 1000,
+                        "mad_ms": measurement.mad(phase) * 1000,
+                    }
+                    for phase in measurement.samples
+                },
+                "peak_bytes": measurement.peak_bytes,
+                "error": measurement.error,
+            }
+        )
+
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "gc_disabled": disable_gc,
+        "cpu": cpu,
+    }
+
+    with open(filename, "w") as f:
+        json.dump({"environment": environment, "results": results}, f, indent=2)
@@ -0,0 +1,56 @@
+import pathlib
+
+from bench import baseline
+from bench import suite
+
+
+def create_measurement(day: int, total: float, peak_bytes: int) -> suite.Measurement:
+    case = suite.Case(2023, day, "real", f"day_{day:02}.txt")
+    measurement = suite.Measurement(case, suite.DEFAULT_ENGINE)
+    measurement.samples = {suite.TOTAL: [total] * 5}
+    measurement.peak_bytes = peak_bytes
+    return measurement
+
+
+def test_compare() -> None:
+    before = baseline.Entry(10.0, 0.1, 100.0)
+
+    assert baseline.compare(before, baseline.Entry(11.0, 0.1, 110.0), 25) == []
+    assert baseline.compare(before, baseline.Entry(20.0, 0.1, 100.0), 25) == ["time"]
+    assert baseline.compare(before, baseline.Entry(10.0, 0.1, 200.0), 25) == ["memory"]
+
+    # A slowdown within the noise of the trials is not a regression
+    assert baseline.compare(before, baseline.Entry(20.0, 5.0, 100.0), 25) == []
+    assert (
+        baseline.compare(baseline.Entry(0.1, 0, 1), baseline.Entry(0.3, 0, 1), 25) == []
+    )
+
+
+def test_check_baseline(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "baseline.json")
+    baseline.save_baseline(
+        [create_measurement(1, 0.010, 1024), create_measurement(2, 0.010, 1024)], path
+    )
+    stored = baseline.load_baseline(path)
+
+    assert stored[(2023, 1, "real", "default")] == baseline.Entry(10.0, 0.0, 1.0)
+
+    comparisons = baseline.check_baseline(
+        stored, [create_measurement(1, 0.020, 1024)], 25
+    )
+
+    assert comparisons[0].regressions == ["time"]
+    assert comparisons[1].after is None and comparisons[1].error == "not measured"
+    assert "REGRESSED (time)" in baseline.format_comparison(comparisons[0])
+
+
+def test_create_cases(tmp_path: pathlib.Path) -> None:
+    keys = [
+        (2023, 5, "real", "default"),
+        (2023, 5, "real", "intervals"),
+        (2023, 9, "x0.5", "default"),
+    ]
+    cases = baseline.create_cases(keys, str(tmp_path))
+
+    assert [(case.day, case.label) for case in cases] == [(5, "real"), (9, "x0.5")]
+    assert pathlib.Path(cases[1].filename).exists()
@@ -0,0 +1,35 @@
+from typing import Callable, Dict, Tuple
+
+from bench import complexity
+
+
+def test_fit_slope() -> None:
+    sizes = [10, 20, 40, 80]
+
+    assert abs(complexity.fit_slope(sizes, [3.0 * n for n in sizes]) - 1) < 1e-9
+    assert abs(complexity.fit_slope(sizes, [0.5 * n * n for n in sizes]) - 2) < 1e-9
+
+
+def test_run_probe() -> None:
+    def build(scale: float) -> Tuple[int, Dict[str, Callable[[], object]]]:
+        items = list(range(int(scale)))
+        return len(items), {"sum": lambda: sum(items), "": lambda: sorted(items)}
+
+    probe = complexity.Probe("linear", build, 10000, threshold=3)
+    fits = complexity.run_probe(probe, steps=4, threshold=0.5)
+
+    assert [fit.name for fit in fits] == ["linear.sum", "linear"]
+    assert fits[0].sizes == [10000, 20000, 40000, 80000]
+    assert all(not fit.is_flagged for fit in fits)
+
+
+def test_solver_probe() -> None:
+    probe = complexity.create_solver_probe(9, start=0.05)
+    fits = complexity.run_probe(probe, steps=3)
+
+    assert [fit.name for fit in fits] == [
+        "2023 day_09.parse",
+        "2023 day_09.part_1",
+        "2023 day_09.part_2",
+    ]
+    assert fits[0].sizes == [10, 20, 40]
@@ -0,0 +1,46 @@
+import contextlib
+import pathlib
+
+from bench import history
+from bench import suite
+
+
+def create_measurement(day: int, total: float) -> suite.Measurement:
+    case = suite.Case(2023, day, "real", f"day_{day:02}.txt")
+    measurement = suite.Measurement(case, suite.DEFAULT_ENGINE)
+    measurement.samples = {suite.TOTAL: [total] * 3}
+    return measurement
+
+
+def test_get_fingerprint() -> None:
+    fingerprint = history.get_fingerprint()
+
+    assert len(fingerprint) == 12
+    assert fingerprint == history.get_fingerprint()
+
+
+def test_history(tmp_path: pathlib.Path) -> None:
+    failed = create_measurement(9, 0.010)
+    failed.error = "ValueError: bad input"
+
+    with contextlib.closing(history.connect(str(tmp_path / "h.sqlite"))) as connection:
+        history.record_run(connection, [create_measurement(9, 0.010), failed])
+        history.record_run(
+            connection, [create_measurement(9, 0.020), create_measurement(12, 1.0)]
+        )
+
+        points = history.load_history(connection, days=[9])
+        other = history.load_history(connection, machine="elsewhere")
+
+    assert list(points) == [(2023, 9, "real", "default")]
+    assert [point.median_ms for point in points[(2023, 9, "real", "default")]] == [
+        10.0,
+        20.0,
+    ]
+    assert other == {}
+
+    rows = history.format_history(
+        (2023, 9, "real", "default"), points[(2023, 9, "real", "default")]
+    )
+    assert rows[0] == "2023 09 real default"
+    assert "+100.0%" in rows[2]
@@ -0,0 +1,38 @@
+from bench import startup
+
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:        80 |         80 |     aoc.registry
+import time:        50 |        130 |   aoc.client
+import time:        40 |        170 | aoc
+"""
+
+
+def test_parse_importtime() -> None:
+    imports = startup.parse_importtime(REPORT)
+
+    assert [item.name for item in imports] == [
+        "_io",
+        "io",
+        "aoc.registry",
+        "aoc.client",
+        "aoc",
+    ]
+    assert [item.depth for item in imports] == [1, 0, 2, 1, 0]
+    assert imports[1].self_us == 300 and imports[1].cumulative_us == 420
+
+
+def test_run_startup() -> None:
+    results = startup.run_startup(runs=1, budget_ms=60000)
+    names = {result.mode: {item.name for item in result.imports} for result in results}
+
+    assert [result.mode for result in results] == ["batch", "daemon"]
+    assert not any(result.over_budget for result in results)
+    assert "aoc.batch" in names["batch"]
+
+    # A client of a running service loads neither asyncio nor any solver
+    assert "asyncio" not in names["daemon"]
+    assert "aoc.batch" not in names["daemon"]
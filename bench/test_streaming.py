@@ -0,0 +1,13 @@
+from bench import streaming
+
+
+def test_run_streaming() -> None:
+    assert streaming.list_streaming_days() == [1, 2, 4, 7, 9, 12]
+
+    results = streaming.run_streaming([9], [0.01, 0.1])
+    assert [result.day for result in results] == [9]
+    assert results[0].is_flat
+
+    sizes = [measurement.size_mb for measurement in results[0].measurements]
+    assert sizes[0] >= 0.01 and sizes[1] >= 0.1
+    assert "day 09" in streaming.format_streaming(results[0])
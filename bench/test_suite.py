@@ -0,0 +1,43 @@
+import pathlib
+
+from bench import suite
+
+
+def test_measurement() -> None:
+    case = suite.Case(2023, 1, "real", "day_01.txt")
+    measurement = suite.Measurement(case, suite.DEFAULT_ENGINE)
+    measurement.samples = {"part_1": [1.0, 2.0, 4.0, 10.0], suite.TOTAL: [1.0] * 4}
+
+    assert measurement.trials == 4
+    assert measurement.median("part_1") == 3.0
+    assert measurement.mad("part_1") == 1.5
+
+
+def test_measure() -> None:
+    case = suite.create_cases([(2022, 4)], "real", [], "")[0]
+    measurement = suite.measure(case, suite.DEFAULT_ENGINE, 1, 3, 30, True)
+
+    assert measurement.error is None
+    assert measurement.trials == 3
+    assert measurement.answers == {1: 498, 2: 859}
+    assert set(measurement.samples) == {"read", "parse", "fused", "total"}
+
+    measurement = suite.measure(case, suite.SEPARATE_ENGINE, 0, 1, 30, False)
+    assert measurement.answers == {1: 498, 2: 859}
+    assert set(measurement.samples) == {"read", "parse", "part_1", "part_2", "total"}
+
+
+def test_check_answers(tmp_path: pathlib.Path) -> None:
+    # Short seed ranges keep the default engine fast
+    path = tmp_path / "day_05.txt"
+    lines = suite.load_generators().generate(5, max_seed_range=1000)
+    path.write_text("\n".join(lines) + "\n")
+
+    cases = [suite.Case(2023, 5, "short", str(path))]
+    measurements = list(suite.run_suite(cases, warmup=0, trials=1))
+
+    assert [m.engine for m in measurements] == ["default", "intervals"]
+    assert suite.check_answers(measurements) == []
+
+    measurements[1].answers[2] = -1
+    assert len(suite.check_answers(measurements)) == 1